@@ -0,0 +1,34 @@
+"""
+Heston calibration-time benchmark.
+
+Run with ``python benchmarks/bench_heston_calibration.py``.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from volatilitystats.models.heston_model import estimate_heston_params, heston_price
+
+TRUE_PARAMS = dict(kappa=1.5768, theta=0.0398, xi=0.5751, rho=-0.5711, v0=0.0175)
+
+def run(n_strikes: int, n_maturities: int, repeats: int = 3) -> float:
+    strikes = np.linspace(60.0, 140.0, n_strikes)
+    maturities = np.linspace(0.1, 3.0, n_maturities)
+    grid = heston_price(strikes, maturities, 100.0, **TRUE_PARAMS, rate=0.02)
+    quotes = (np.tile(strikes, n_maturities), np.repeat(maturities, n_strikes), grid.ravel())
+
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        estimate_heston_params(*quotes, spot=100.0, rate=0.02)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    for n_strikes, n_maturities in [(10, 5), (25, 8), (50, 12), (100, 20)]:
+        elapsed = run(n_strikes, n_maturities)
+        print(f"{n_strikes * n_maturities:5d} options: {elapsed * 1e3:8.1f} ms per calibration")
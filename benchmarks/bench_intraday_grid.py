@@ -0,0 +1,34 @@
+"""
+Repeated intraday estimators with and without a shared IntradayGrid.
+
+Run with ``python benchmarks/bench_intraday_grid.py``.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_intraday_series import make_ticks, timed
+from volatilitystats.estimators.bipower_variation import bipower_variation_series
+from volatilitystats.estimators.neighbor_truncation import medrv_series, minrv_series
+from volatilitystats.estimators.realized_kernel import realized_kernel_series
+from volatilitystats.estimators.two_scale_realized_volatility import tsrv_series
+from volatilitystats.utils.intraday_grid import IntradayGrid
+
+ESTIMATORS = [bipower_variation_series, minrv_series, medrv_series, realized_kernel_series, tsrv_series]
+
+def run(df, grid=None):
+    for estimator in ESTIMATORS:
+        estimator(df, "price", "time", grid=grid)
+
+if __name__ == "__main__":
+    for n_days, ticks_per_day in [(2500, 500), (250, 20000)]:
+        df = make_ticks(n_days, ticks_per_day)
+        t_build = timed(lambda: IntradayGrid.from_frame(df, "time", include_overnight=True))
+        grid = IntradayGrid.from_frame(df, "time", include_overnight=True)
+        t_grid = timed(lambda: run(df, grid))
+        t_plain = timed(lambda: run(df))
+        print(
+            f"{n_days:4d} days x {ticks_per_day:5d} ticks, {len(ESTIMATORS)} estimators: "
+            f"grid build {t_build * 1e3:7.1f} ms + {t_grid * 1e3:7.1f} ms, timestamps each call {t_plain * 1e3:7.1f} ms"
+        )
@@ -0,0 +1,44 @@
+"""
+Intraday `*_series` benchmark: segment reductions against per-day groupby.apply.
+
+Run with ``python benchmarks/bench_intraday_series.py``.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from volatilitystats.estimators.bipower_variation import bipower_variation, bipower_variation_series
+from volatilitystats.estimators.realized_kernel import realized_kernel, realized_kernel_series
+from volatilitystats.utils.segments import intraday_log_returns
+
+def make_ticks(n_days: int, ticks_per_day: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range("2015-01-01", periods=n_days)
+    offsets = np.sort(rng.uniform(0, 23400, (n_days, ticks_per_day)), axis=1)
+    times = (days.values[:, None] + np.timedelta64(34200, "s") + (offsets * 1e9).astype("timedelta64[ns]")).ravel()
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 2e-4, len(times))))
+    return pd.DataFrame({"time": times, "price": prices})
+
+def timed(f) -> float:
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+def grouped(df: pd.DataFrame, f) -> pd.Series:
+    log_returns = intraday_log_returns(df, "price", "time")
+    return log_returns.groupby(pd.Grouper(freq="1D")).apply(lambda x: f(x.values))
+
+if __name__ == "__main__":
+    for n_days, ticks_per_day in [(2500, 100), (2500, 500), (750, 2000)]:
+        df = make_ticks(n_days, ticks_per_day)
+        for name, new, old in [
+            ("bipower", lambda: bipower_variation_series(df, "price", "time"), lambda: grouped(df, bipower_variation)),
+            ("kernel", lambda: realized_kernel_series(df, "price", "time"), lambda: grouped(df, realized_kernel)),
+        ]:
+            t_new, t_old = timed(new), timed(old)
+            print(f"{n_days:4d} days x {ticks_per_day:4d} ticks {name:8s}: segments {t_new * 1e3:8.1f} ms, groupby.apply {t_old * 1e3:8.1f} ms")
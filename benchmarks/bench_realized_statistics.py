@@ -0,0 +1,37 @@
+"""
+Weekly and monthly realized measures: roll-up of daily statistics against recomputing from ticks.
+
+Run with ``python benchmarks/bench_realized_statistics.py``.
+"""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_intraday_series import make_ticks, timed
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.estimators.realized_statistics import (
+    measures_from_statistics, realized_statistics, rollup_statistics
+)
+
+MEASURES = ["rv", "bv", "tsrv", "rk", "jump"]
+
+def from_ticks(df):
+    for freq in ["W", "ME"]:
+        realized_measures(df, "price", "time", measures=MEASURES, freq=freq, bandwidth=30)
+
+def from_daily(daily):
+    for freq in ["W", "ME"]:
+        measures_from_statistics(rollup_statistics(daily, freq), measures=MEASURES, bandwidth=30)
+
+if __name__ == "__main__":
+    for n_days, ticks_per_day in [(2500, 500), (750, 5000)]:
+        df = make_ticks(n_days, ticks_per_day)
+        t_daily = timed(lambda: realized_statistics(df, "price", "time"))
+        daily = realized_statistics(df, "price", "time")
+        t_rollup = timed(lambda: from_daily(daily))
+        t_ticks = timed(lambda: from_ticks(df))
+        print(
+            f"{n_days:4d} days x {ticks_per_day:4d} ticks: daily statistics {t_daily * 1e3:7.1f} ms once, "
+            f"weekly + monthly roll-up {t_rollup * 1e3:6.1f} ms, from ticks {t_ticks * 1e3:7.1f} ms"
+        )
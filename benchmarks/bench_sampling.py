@@ -0,0 +1,30 @@
+"""
+Previous-tick calendar sampling benchmark: one searchsorted against per-day resample.
+
+Run with ``python benchmarks/bench_sampling.py``.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bench_intraday_series import make_ticks, timed
+from volatilitystats.utils.sampling import calendar_time_returns
+
+def grouped(df: pd.DataFrame, interval: str) -> pd.Series:
+    prices = df.set_index("time")["price"]
+    return prices.groupby(prices.index.normalize()).apply(
+        lambda x: np.log(x.resample(interval, closed="right", label="right").last().ffill()).diff().dropna()
+    )
+
+if __name__ == "__main__":
+    for n_days, ticks_per_day in [(2500, 500), (750, 5000)]:
+        df = make_ticks(n_days, ticks_per_day)
+        for interval in ["1min", "5min"]:
+            t_new = timed(lambda: calendar_time_returns(df, "price", "time", interval=interval))
+            t_old = timed(lambda: grouped(df, interval))
+            print(f"{n_days:4d} days x {ticks_per_day:4d} ticks {interval:5s}: searchsorted {t_new * 1e3:8.1f} ms, groupby.resample {t_old * 1e3:8.1f} ms")
@@ -9,5 +9,18 @@ from .rogers_satchell_volatility import rogers_satchell_volatility as rogers_sat
 from .standard import standard_volatility as standard_volatility
 from .two_scale_realized_volatility import two_scale_realized_volatility as two_scale_realized_volatility
 from .yangzhang import yang_zhang_volatility as yang_zhang_volatility
+from .realized_measures import realized_measures as realized_measures
+from .multi_scale_realized_volatility import multi_scale_realized_volatility as multi_scale_realized_volatility
+from .neighbor_truncation import min_realized_variance as min_realized_variance, median_realized_variance as median_realized_variance
+from .jump_detection import lee_mykland_jumps as lee_mykland_jumps
+from .streaming import RealizedAccumulator as RealizedAccumulator
+from .out_of_core import iter_realized_measures as iter_realized_measures, chunked_realized_measures as chunked_realized_measures
+from .signature_plot import volatility_signatures as volatility_signatures
+from .hayashi_yoshida import hayashi_yoshida_covariance as hayashi_yoshida_covariance, hayashi_yoshida_series as hayashi_yoshida_series
+from .realized_covariance import realized_covariance_series as realized_covariance_series
+from .pre_averaging import pre_averaged_realized_variance as pre_averaged_realized_variance, pre_averaged_bipower_variation as pre_averaged_bipower_variation
+from .realized_statistics import realized_statistics as realized_statistics, rollup_statistics as rollup_statistics, measures_from_statistics as measures_from_statistics
+from .tick_cleaning import clean_ticks as clean_ticks
+from .intraday_periodicity import intraday_periodicity as intraday_periodicity, intraday_return_matrix as intraday_return_matrix, periodicity_profile as periodicity_profile
 
-__all__ = ['standard_volatility', 'parkinson_volatility', 'yang_zhang_volatility', 'rogers_satchell_volatility', 'garman_klass_volatility', 'overnight_volatility', 'ewma_volatility', 'realized_volatility', 'two_scale_realized_volatility', 'median_realized_volatility', 'bipower_variation']
+__all__ = ['standard_volatility', 'parkinson_volatility', 'yang_zhang_volatility', 'rogers_satchell_volatility', 'garman_klass_volatility', 'overnight_volatility', 'ewma_volatility', 'realized_volatility', 'two_scale_realized_volatility', 'median_realized_volatility', 'bipower_variation', 'realized_measures', 'multi_scale_realized_volatility', 'min_realized_variance', 'median_realized_variance', 'lee_mykland_jumps', 'RealizedAccumulator', 'iter_realized_measures', 'chunked_realized_measures', 'volatility_signatures', 'hayashi_yoshida_covariance', 'hayashi_yoshida_series', 'realized_covariance_series', 'pre_averaged_realized_variance', 'pre_averaged_bipower_variation', 'realized_statistics', 'rollup_statistics', 'measures_from_statistics', 'clean_ticks', 'intraday_periodicity', 'intraday_return_matrix', 'periodicity_profile']
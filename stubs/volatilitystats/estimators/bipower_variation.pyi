@@ -1,5 +1,7 @@
 import numpy as np
 import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
 
 def bipower_variation(returns: np.ndarray | pd.Series) -> float: ...
-def bipower_variation_series(df: pd.DataFrame, price_column: str, time_column: str, freq: str = '1D') -> pd.Series: ...
+def bipower_variation_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', grid: IntradayGrid | None = None) -> pd.Series: ...
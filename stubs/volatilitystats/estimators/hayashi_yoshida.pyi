@@ -0,0 +1,10 @@
+import numpy as np
+import pandas as pd
+from typing import Mapping
+from volatilitystats.utils.tick_store import TickSlice
+
+TickData = pd.DataFrame | TickSlice
+
+def hayashi_yoshida_covariance(x: pd.Series, y: pd.Series) -> float: ...
+def project_psd(matrices: np.ndarray, floor: float = 0.0) -> np.ndarray: ...
+def hayashi_yoshida_series(data: pd.DataFrame | Mapping[str, TickData], price_column: str, time_column: str, asset_column: str | None = None, freq: str = '1D', psd: bool = True, n_jobs: int = 1) -> pd.DataFrame: ...
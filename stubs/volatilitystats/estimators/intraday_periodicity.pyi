@@ -0,0 +1,8 @@
+import numpy as np
+import pandas as pd
+
+PERIODICITY_METHODS: tuple[str, ...]
+
+def intraday_return_matrix(returns: pd.Series) -> tuple[pd.DatetimeIndex, pd.TimedeltaIndex, np.ndarray]: ...
+def periodicity_profile(matrix: np.ndarray, method: str = 'wsd', order: int = 4) -> np.ndarray: ...
+def intraday_periodicity(returns: pd.Series, method: str = 'wsd', order: int = 4) -> tuple[pd.Series, pd.Series]: ...
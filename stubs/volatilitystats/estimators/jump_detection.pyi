@@ -1,5 +1,9 @@
 import numpy as np
 import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
 
 def barndorff_nielsen_shephard_jump_test(returns: np.ndarray | pd.Series, threshold: float = 4.0) -> bool: ...
-def detect_jumps_series(df: pd.DataFrame, price_column: str, time_column: str, freq: str = '1D', threshold: float = 4.0) -> pd.Series: ...
+def detect_jumps_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', threshold: float = 4.0, grid: IntradayGrid | None = None) -> pd.Series: ...
+def lee_mykland_statistics(returns: np.ndarray | pd.Series, window: int, exclude: np.ndarray | None = None) -> np.ndarray: ...
+def lee_mykland_jumps(df: IntradayData, price_column: str, time_column: str, window: int | None = None, significance: float = 0.01, freq: str = '1D', diurnal: str | None = None, grid: IntradayGrid | None = None) -> pd.DataFrame: ...
@@ -1,5 +1,7 @@
 import numpy as np
 import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
 
 def median_realized_volatility(returns: np.ndarray | pd.Series) -> float: ...
-def median_rv_series(df: pd.DataFrame, price_column: str, time_column: str, freq: str = '1D') -> pd.Series: ...
+def median_rv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', grid: IntradayGrid | None = None) -> pd.Series: ...
@@ -0,0 +1,10 @@
+import numpy as np
+import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
+
+def msrv_weights(M: int) -> np.ndarray: ...
+def multi_scale_realized_volatility(returns: np.ndarray | pd.Series, M: int = 10) -> float: ...
+def tsrv_sweep(returns: np.ndarray | pd.Series, max_scale: int) -> pd.Series: ...
+def msrv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', M: int = 10, grid: IntradayGrid | None = None) -> pd.Series: ...
+def tsrv_sweep_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', max_scale: int = 30, grid: IntradayGrid | None = None) -> pd.DataFrame: ...
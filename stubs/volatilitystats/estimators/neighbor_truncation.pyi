@@ -0,0 +1,9 @@
+import numpy as np
+import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
+
+def min_realized_variance(returns: np.ndarray | pd.Series) -> float: ...
+def median_realized_variance(returns: np.ndarray | pd.Series) -> float: ...
+def minrv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', grid: IntradayGrid | None = None) -> pd.Series: ...
+def medrv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', grid: IntradayGrid | None = None) -> pd.Series: ...
@@ -0,0 +1,10 @@
+import numpy as np
+import os
+import pandas as pd
+from collections.abc import Iterable, Iterator, Sequence
+
+TickSource = str | os.PathLike | Iterable[pd.DataFrame]
+
+def iter_tick_chunks(source: TickSource, price_column: str = 'price', time_column: str = 'time', chunksize: int = 1000000) -> Iterator[tuple[np.ndarray, np.ndarray]]: ...
+def iter_realized_measures(source: TickSource, price_column: str = 'price', time_column: str = 'time', measures: Sequence[str] = ..., freq: str = '1D', chunksize: int = 1000000, K: int = 2, kernel: str = 'bartlett', bandwidth: int | str | None = None, threshold: float = 4.0) -> Iterator[pd.DataFrame]: ...
+def chunked_realized_measures(source: TickSource, price_column: str = 'price', time_column: str = 'time', measures: Sequence[str] = ..., freq: str = '1D', chunksize: int = 1000000, K: int = 2, kernel: str = 'bartlett', bandwidth: int | str | None = None, threshold: float = 4.0) -> pd.DataFrame: ...
@@ -0,0 +1,10 @@
+import numpy as np
+import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
+
+def pre_averaging_constants(k: int) -> tuple[float, float]: ...
+def pre_averaged_realized_variance(returns: np.ndarray | pd.Series, theta: float = ...) -> float: ...
+def pre_averaged_bipower_variation(returns: np.ndarray | pd.Series, theta: float = ...) -> float: ...
+def pre_averaged_rv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', theta: float = ..., grid: IntradayGrid | None = None) -> pd.Series: ...
+def pre_averaged_bv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', theta: float = ..., grid: IntradayGrid | None = None) -> pd.Series: ...
@@ -0,0 +1,12 @@
+import numpy as np
+import pandas as pd
+from typing import Mapping
+from .hayashi_yoshida import TickData
+
+def synchronized_returns(data: pd.DataFrame | Mapping[str, TickData], price_column: str, time_column: str, asset_column: str | None = None, interval: str = '5min', session_start: str = '09:30', session_end: str = '16:00') -> tuple[pd.DatetimeIndex, list[str], np.ndarray]: ...
+def pack_upper(matrices: np.ndarray, dtype=...) -> np.ndarray: ...
+def unpack_upper(packed: np.ndarray, n_assets: int) -> np.ndarray: ...
+def daily_covariances(returns: np.ndarray, dtype=...) -> np.ndarray: ...
+def rolling_covariance(packed: np.ndarray, window: int) -> np.ndarray: ...
+def shrink_covariance(packed: np.ndarray, n_assets: int, shrinkage: float, target: str = 'diagonal') -> np.ndarray: ...
+def realized_covariance_series(data: pd.DataFrame | Mapping[str, TickData], price_column: str, time_column: str, asset_column: str | None = None, interval: str = '5min', window: int = 1, shrinkage: float = 0.0, target: str = 'diagonal', dtype=..., packed: bool = False, session_start: str = '09:30', session_end: str = '16:00') -> pd.DataFrame: ...
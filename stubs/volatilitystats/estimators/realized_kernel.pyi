@@ -1,6 +1,11 @@
 import numpy as np
 import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
 
-def realized_kernel(returns: np.ndarray | pd.Series, kernel: str = 'bartlett', bandwidth: int = None) -> float: ...
+def realized_kernel(returns: np.ndarray | pd.Series, kernel: str = 'bartlett', bandwidth: int | str | None = None) -> float: ...
 def kernel_weight(h: int, bandwidth: int, kernel: str) -> float: ...
-def realized_kernel_series(df: pd.DataFrame, price_column: str, time_column: str, freq: str = '1D', kernel: str = 'bartlett', bandwidth: int = None) -> pd.Series: ...
+def kernel_weights(kernel: str, bandwidth: int) -> np.ndarray: ...
+def realized_autocovariances(returns: np.ndarray | pd.Series, max_lag: int) -> np.ndarray: ...
+def optimal_bandwidth(returns: np.ndarray | pd.Series, kernel: str = 'parzen') -> int: ...
+def realized_kernel_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', kernel: str = 'bartlett', bandwidth: int | str | None = None, grid: IntradayGrid | None = None) -> pd.Series: ...
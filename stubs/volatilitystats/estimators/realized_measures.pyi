@@ -0,0 +1,8 @@
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
+
+REALIZED_MEASURES: tuple[str, ...]
+
+def realized_measures(df: IntradayData, price_column: str, time_column: str, measures: Sequence[str] = ..., freq: str = '1D', K: int = 2, kernel: str = 'bartlett', bandwidth: int | str | None = None, threshold: float = 4.0, grid: IntradayGrid | None = None) -> pd.DataFrame: ...
@@ -0,0 +1,10 @@
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
+
+STATISTIC_MEASURES: tuple[str, ...]
+
+def realized_statistics(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', max_lag: int = 30, max_scale: int = 2, grid: IntradayGrid | None = None) -> pd.DataFrame: ...
+def rollup_statistics(statistics: pd.DataFrame, freq: str) -> pd.DataFrame: ...
+def measures_from_statistics(statistics: pd.DataFrame, measures: Sequence[str] = ..., K: int = 2, kernel: str = 'bartlett', bandwidth: int | None = None, threshold: float = 4.0) -> pd.DataFrame: ...
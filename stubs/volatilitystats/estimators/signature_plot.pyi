@@ -0,0 +1,9 @@
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.tick_store import TickSlice
+
+SIGNATURE_INTERVALS: tuple[str, ...]
+SIGNATURE_MEASURES: tuple[str, ...]
+
+def volatility_signatures(df: pd.DataFrame | TickSlice, price_column: str, time_column: str, intervals: Sequence[str] = ..., measures: Sequence[str] = ('rv',), subgrids: int = 1, session_start: str = '09:30', session_end: str = '16:00', kernel: str = 'bartlett', bandwidth: int | str | None = None) -> dict[str, pd.DataFrame]: ...
+def volatility_signature(df: pd.DataFrame | TickSlice, price_column: str, time_column: str, intervals: Sequence[str] = ..., measure: str = 'rv', subgrids: int = 1, session_start: str = '09:30', session_end: str = '16:00', kernel: str = 'bartlett', bandwidth: int | str | None = None) -> pd.DataFrame: ...
@@ -0,0 +1,16 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+class RealizedAccumulator:
+    freq: str
+    include_overnight: bool
+    def __init__(self, freq: str = '1D', include_overnight: bool = True) -> None: ...
+    def update(self, price: float | Sequence[float] | np.ndarray, timestamp: str | pd.Timestamp | Sequence | np.ndarray | pd.DatetimeIndex) -> RealizedAccumulator: ...
+    def merge(self, other: RealizedAccumulator) -> RealizedAccumulator: ...
+    @property
+    def session(self) -> pd.Timestamp | None: ...
+    @property
+    def values(self) -> dict[str, float]: ...
+    def to_frame(self) -> pd.DataFrame: ...
+    def pop_completed(self) -> pd.DataFrame: ...
@@ -0,0 +1,7 @@
+import numpy as np
+import pandas as pd
+
+CLEANING_REASONS: tuple[str, ...]
+
+def rolling_mad_outliers(log_prices: np.ndarray, offsets: np.ndarray, window: int = 50, threshold: float = 10.0) -> np.ndarray: ...
+def clean_ticks(df: pd.DataFrame, price_column: str, time_column: str, session_start: str = '00:00', session_end: str = '24:00', duplicates: str = 'median', window: int = 50, threshold: float = 10.0) -> tuple[pd.DataFrame, pd.DataFrame]: ...
@@ -1,5 +1,8 @@
 import numpy as np
 import pandas as pd
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData
 
 def two_scale_realized_volatility(returns: np.ndarray | pd.Series, K: int = 2) -> float: ...
-def tsrv_series(df: pd.DataFrame, price_column: str, time_column: str, freq: str = '1D', K: int = 2) -> pd.Series: ...
+def subsampled_realized_variances(returns: np.ndarray | pd.Series, max_scale: int) -> np.ndarray: ...
+def tsrv_series(df: IntradayData, price_column: str, time_column: str, freq: str = '1D', K: int = 2, grid: IntradayGrid | None = None) -> pd.Series: ...
@@ -6,6 +6,11 @@ from .garch_in_mean_model import estimate_garch_in_mean_params as estimate_garch
 from .garch_mle import estimate_garch_params as estimate_garch_params
 from .gjr_garch_model import estimate_gjr_garch_params as estimate_gjr_garch_params
 from .harch_model import estimate_harch_params as estimate_harch_params
+from .har_model import estimate_har_params as estimate_har_params, rolling_har_forecast as rolling_har_forecast
 from .stochastic_volatility_model import estimate_sv_params as estimate_sv_params
+from .realized_garch_model import estimate_realized_garch_params as estimate_realized_garch_params
+from .figarch_model import estimate_figarch_params as estimate_figarch_params, estimate_hygarch_params as estimate_hygarch_params
+from .ms_garch_model import estimate_ms_garch_params as estimate_ms_garch_params
+from .heston_model import heston_price as heston_price, estimate_heston_params as estimate_heston_params
 
-__all__ = ['garch', 'estimate_garch_params', 'forecast_garch', 'estimate_egarch_params', 'estimate_gjr_garch_params', 'estimate_sv_params', 'estimate_component_garch_params', 'estimate_garch_in_mean_params', 'estimate_harch_params']
+__all__ = ['garch', 'estimate_garch_params', 'forecast_garch', 'estimate_egarch_params', 'estimate_gjr_garch_params', 'estimate_sv_params', 'estimate_component_garch_params', 'estimate_garch_in_mean_params', 'estimate_harch_params', 'estimate_har_params', 'rolling_har_forecast', 'estimate_realized_garch_params', 'estimate_figarch_params', 'estimate_hygarch_params', 'estimate_ms_garch_params', 'heston_price', 'estimate_heston_params']
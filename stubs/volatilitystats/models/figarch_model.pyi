@@ -0,0 +1,11 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.confidence import compute_confidence_bands as compute_confidence_bands
+
+def fractional_difference_weights(d: float, truncation: int) -> np.ndarray: ...
+def arch_inf_weights(d: float, phi: float, beta: float, truncation: int, alpha: float = 1.0) -> np.ndarray: ...
+def figarch_variance(eps: np.ndarray, omega: float, d: float, phi: float, beta: float, truncation: int = 1000, alpha: float = 1.0) -> np.ndarray: ...
+def figarch_log_likelihood(params: Sequence[float], returns: pd.Series, truncation: int = 1000) -> float: ...
+def estimate_figarch_params(returns: pd.Series, truncation: int = 1000, with_confidence: bool = False, stderr_fraction: float = 0.1) -> dict: ...
+def estimate_hygarch_params(returns: pd.Series, truncation: int = 1000, with_confidence: bool = False, stderr_fraction: float = 0.1) -> dict: ...
@@ -0,0 +1,9 @@
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.confidence import compute_confidence_bands as compute_confidence_bands
+
+HAR_MODELS: tuple[str, ...]
+
+def har_regressors(rv: pd.Series, model: str = 'har-rv', lags: Sequence[int] = (1, 5, 22), bv: pd.Series | None = None, jump_flags: pd.Series | None = None) -> pd.DataFrame: ...
+def estimate_har_params(rv: pd.Series, model: str = 'har-rv', lags: Sequence[int] = (1, 5, 22), bv: pd.Series | None = None, jump_flags: pd.Series | None = None, horizon: int = 1, with_confidence: bool = False, stderr_fraction: float = 0.1) -> dict: ...
+def rolling_har_forecast(rv: pd.Series, model: str = 'har-rv', lags: Sequence[int] = (1, 5, 22), bv: pd.Series | None = None, jump_flags: pd.Series | None = None, horizon: int = 1, window: int | None = None, min_periods: int | None = None) -> dict: ...
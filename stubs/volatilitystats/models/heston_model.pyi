@@ -0,0 +1,6 @@
+import numpy as np
+from typing import Sequence
+
+def heston_characteristic_function(u: np.ndarray, T: np.ndarray, kappa: float | np.ndarray, theta: float | np.ndarray, xi: float | np.ndarray, rho: float | np.ndarray, v0: float | np.ndarray) -> np.ndarray: ...
+def heston_price(strikes: Sequence[float] | np.ndarray, maturities: Sequence[float] | np.ndarray, spot: float, kappa: float, theta: float, xi: float, rho: float, v0: float, rate: float = 0.0, dividend: float = 0.0, option_type: str = 'call', n_nodes: int = 256, u_max: float = 200.0) -> np.ndarray: ...
+def estimate_heston_params(strikes: Sequence[float] | np.ndarray, maturities: Sequence[float] | np.ndarray, prices: Sequence[float] | np.ndarray, spot: float, rate: float = 0.0, dividend: float = 0.0, option_type: str | Sequence[str] = 'call', initial_guess: Sequence[float] | None = None, n_nodes: int = 256, u_max: float = 200.0) -> dict: ...
@@ -0,0 +1,11 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.confidence import compute_confidence_bands as compute_confidence_bands
+
+def stationary_distribution(transition: np.ndarray) -> np.ndarray: ...
+def ms_garch_variances(eps: np.ndarray, omega: np.ndarray, alpha: np.ndarray, beta: np.ndarray) -> np.ndarray: ...
+def hamilton_filter(log_densities: np.ndarray, transition: np.ndarray, initial_probs: np.ndarray) -> tuple[np.ndarray, np.ndarray, float]: ...
+def kim_smoother(predicted: np.ndarray, filtered: np.ndarray, transition: np.ndarray) -> np.ndarray: ...
+def ms_garch_log_likelihood(params: Sequence[float], returns: pd.Series, n_regimes: int = 2) -> float: ...
+def estimate_ms_garch_params(returns: pd.Series, n_regimes: int = 2, with_confidence: bool = False, stderr_fraction: float = 0.1) -> dict: ...
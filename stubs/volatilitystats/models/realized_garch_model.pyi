@@ -0,0 +1,9 @@
+import numpy as np
+import pandas as pd
+from typing import Sequence
+from volatilitystats.utils.confidence import compute_confidence_bands as compute_confidence_bands
+
+def align_realized_measure(returns: pd.Series, realized: pd.Series) -> tuple[np.ndarray, np.ndarray, pd.Index]: ...
+def realized_garch_filter(params: Sequence[float], returns: np.ndarray, realized: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
+def realized_garch_log_likelihood(params: Sequence[float], returns: np.ndarray, realized: np.ndarray) -> float: ...
+def estimate_realized_garch_params(returns: pd.Series, realized: pd.Series, with_confidence: bool = False, stderr_fraction: float = 0.1) -> dict: ...
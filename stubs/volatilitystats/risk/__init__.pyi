@@ -0,0 +1,3 @@
+from .filtered_historical_simulation import fhs_var_es as fhs_var_es, standardized_residuals as standardized_residuals
+
+__all__ = ['standardized_residuals', 'fhs_var_es']
@@ -0,0 +1,5 @@
+import pandas as pd
+from typing import Sequence
+
+def standardized_residuals(returns: pd.Series, result: dict) -> pd.Series: ...
+def fhs_var_es(returns: pd.Series | pd.DataFrame, results: dict | dict[str, dict], levels: Sequence[float] = (0.95, 0.99), horizon: int = 1, n_simulations: int = 10000, chunk_size: int = 64, seed: int | None = None) -> dict[str, pd.DataFrame]: ...
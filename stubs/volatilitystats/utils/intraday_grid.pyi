@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Mapping
+from .tick_store import TickSlice
+
+class IntradayGrid:
+    order: np.ndarray | None
+    times: np.ndarray
+    tz: Any
+    in_session: np.ndarray
+    session_ids: np.ndarray
+    labels: pd.DatetimeIndex
+    offsets: np.ndarray
+    overnight: np.ndarray
+    include_overnight: bool
+    def __init__(self, times: Any, session_start: str = '00:00', session_end: str = '24:00', early_closes: Mapping | None = None, include_overnight: bool = False, name: str = 'time') -> None: ...
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, time_column: str, **kwargs: Any) -> IntradayGrid: ...
+    def __len__(self) -> int: ...
+    @property
+    def return_index(self) -> pd.DatetimeIndex: ...
+    def returns(self, prices: np.ndarray | pd.Series | TickSlice, log_prices: bool = False) -> np.ndarray: ...
+    def log_returns(self, prices: np.ndarray | pd.Series | TickSlice) -> pd.Series: ...
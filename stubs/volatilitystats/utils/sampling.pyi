@@ -0,0 +1,7 @@
+import numpy as np
+import pandas as pd
+from .tick_store import TickSlice
+
+def previous_tick_sample(times: np.ndarray, grid: np.ndarray, first: np.ndarray) -> np.ndarray: ...
+def calendar_time_returns(df: pd.DataFrame | TickSlice, price_column: str, time_column: str, interval: str = '5min', session_start: str = '09:30', session_end: str = '16:00') -> pd.Series: ...
+def tick_time_returns(df: pd.DataFrame | TickSlice, price_column: str, time_column: str, k: int, session_start: str = '00:00', session_end: str = '24:00') -> pd.Series: ...
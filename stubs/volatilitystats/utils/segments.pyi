@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+from .intraday_grid import IntradayGrid
+from .tick_store import TickSlice
+
+IntradayData = Union[pd.DataFrame, pd.Series, TickSlice, tuple[np.ndarray, np.ndarray]]
+
+def intraday_log_returns(df: IntradayData, price_column: str, time_column: str) -> pd.Series: ...
+def period_offsets(log_returns: pd.Series, freq: str) -> tuple[pd.DatetimeIndex, np.ndarray]: ...
+def period_returns(df: IntradayData, price_column: str, time_column: str, freq: str, grid: IntradayGrid | None = None) -> tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]: ...
+def segment_codes(offsets: np.ndarray) -> np.ndarray: ...
+def segment_positions(offsets: np.ndarray) -> np.ndarray: ...
+def range_sum(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray: ...
+def segment_sum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray: ...
+def segment_lag_sum(x: np.ndarray, offsets: np.ndarray, lag: int = 1, y: np.ndarray | None = None) -> np.ndarray: ...
+def segment_median(values: np.ndarray, offsets: np.ndarray) -> np.ndarray: ...
+def segment_autocovariances(r: np.ndarray, offsets: np.ndarray, max_lag: int) -> np.ndarray: ...
@@ -0,0 +1,34 @@
+import os
+from datetime import tzinfo
+import numpy as np
+import pandas as pd
+
+class TickSlice:
+    store: TickStore
+    symbol: str
+    start: str | None
+    end: str | None
+    def __init__(self, store: TickStore, symbol: str, start: str | None = None, end: str | None = None) -> None: ...
+    @property
+    def tz(self) -> tzinfo | None: ...
+    @property
+    def instants(self) -> np.ndarray: ...
+    @property
+    def times(self) -> np.ndarray | pd.DatetimeIndex: ...
+    @property
+    def prices(self) -> np.ndarray: ...
+    def __len__(self) -> int: ...
+    def to_frame(self, price_column: str = 'price', time_column: str = 'time') -> pd.DataFrame: ...
+
+class TickStore:
+    root: str
+    def __init__(self, root: str | os.PathLike) -> None: ...
+    @property
+    def symbols(self) -> list[str]: ...
+    def append(self, symbol: str, times, prices) -> None: ...
+    def days(self, symbol: str) -> pd.DatetimeIndex: ...
+    def slice(self, symbol: str, start: str | None = None, end: str | None = None) -> TickSlice: ...
+    def read(self, symbol: str, start: str | None = None, end: str | None = None) -> tuple[np.ndarray | pd.DatetimeIndex, np.ndarray]: ...
+
+def import_csv(path: str | os.PathLike, store: TickStore | str | os.PathLike, symbol: str | None = None, price_column: str = 'price', time_column: str = 'time', symbol_column: str | None = None, chunksize: int = 1000000) -> TickStore: ...
+def main(argv: list[str] | None = None) -> None: ...
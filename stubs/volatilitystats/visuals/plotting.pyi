@@ -1,3 +1,4 @@
 import pandas as pd
 
 def plot_volatility_series(vol_dict: dict[str, pd.Series], title: str = 'Volatility Comparison', figsize: tuple = (12, 5), ylabel: str = 'Volatility', savepath: str | None = None): ...
+def plot_volatility_signature(signatures: dict[str, pd.DataFrame], title: str = 'Volatility Signature', figsize: tuple = (10, 5), ylabel: str = 'Average realized variance', savepath: str | None = None): ...
@@ -1,3 +1,4 @@
+from pathlib import Path
 from invoke.tasks import task
 import shlex
 
@@ -5,6 +6,11 @@ import shlex
 def test(c):
     c.run("poetry run pytest --cov=volatilitystats --cov-report=term --cov-report=xml")
 
+@task
+def bench(c):
+    for script in sorted(Path("benchmarks").glob("bench_*.py")):
+        c.run(f"poetry run python {script}")
+
 @task
 def docs(c):
     c.run("poetry run sphinx-build docs/source docs/build")
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.models.figarch_model import (
+    arch_inf_weights,
+    estimate_figarch_params,
+    estimate_hygarch_params,
+    figarch_log_likelihood,
+    figarch_variance,
+    fractional_difference_weights,
+)
+
+@pytest.fixture
+def returns():
+    return pd.Series(np.random.default_rng(3).normal(0, 1, 600))
+
+def test_fractional_difference_weights_recursion():
+    d, L = 0.4, 50
+    weights = fractional_difference_weights(d, L)
+    expected = [1.0]
+    for k in range(1, L + 1):
+        expected.append(expected[-1] * (k - 1 - d) / k)
+    np.testing.assert_allclose(weights, expected)
+    assert not weights.flags.writeable
+
+def test_weights_cached_across_short_memory_params():
+    fractional_difference_weights.cache_clear()
+    arch_inf_weights(0.3, 0.2, 0.5, 200)
+    arch_inf_weights(0.3, 0.1, 0.6, 200)
+    info = fractional_difference_weights.cache_info()
+    assert info.misses == 1 and info.hits == 1
+
+def test_fft_variance_matches_direct_filter(returns):
+    eps = returns.values
+    L = 100
+    omega, d, phi, beta = 0.05, 0.4, 0.2, 0.5
+    sigma2 = figarch_variance(eps, omega, d, phi, beta, truncation=L)
+
+    lam = arch_inf_weights(d, phi, beta, L)
+    eps2 = np.concatenate((np.full(L, np.var(eps)), eps**2))
+    direct = [omega / (1 - beta) + sum(lam[k - 1] * eps2[L + t - k] for k in range(1, L + 1)) for t in range(len(eps))]
+    np.testing.assert_allclose(sigma2, direct)
+
+def test_figarch_log_likelihood_invalid_params_length(returns):
+    with pytest.raises(ValueError):
+        figarch_log_likelihood([0.1, 0.4], returns)
+
+def test_figarch_log_likelihood_empty():
+    assert figarch_log_likelihood([0.1, 0.4, 0.2, 0.5], pd.Series([], dtype=float)) == 0.0
+
+def test_estimate_figarch_and_hygarch(returns):
+    result = estimate_figarch_params(returns, truncation=500)
+    assert len(result["volatility"]) == len(returns)
+    assert np.all(result["volatility"] > 0)
+    assert 0 < result["d"] < 1
+
+    hy = estimate_hygarch_params(returns, truncation=500, with_confidence=True)
+    assert "alpha" in hy
+    assert "lower" in hy and "upper" in hy
@@ -0,0 +1,68 @@
+import warnings
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.models.egarch_model import estimate_egarch_params
+from volatilitystats.models.garch_core import garch
+from volatilitystats.risk.filtered_historical_simulation import fhs_var_es, standardized_residuals
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(11)
+    return pd.DataFrame(rng.standard_t(6, size=(800, 3)) * 0.01, columns=["A", "B", "C"])
+
+def garch_result(series, omega=1e-5, alpha=(0.08,), beta=(0.9,)):
+    return {"omega": omega, "alpha": np.array(alpha), "beta": np.array(beta), "volatility": garch(series, omega, alpha, beta)}
+
+def test_standardized_residuals(returns):
+    result = garch_result(returns["A"])
+    z = standardized_residuals(returns["A"], result)
+    np.testing.assert_allclose(z.values, (returns["A"] / result["volatility"]).values)
+
+def test_one_day_var_matches_scaled_residual_quantile(returns):
+    series = returns["A"]
+    result = garch_result(series)
+    out = fhs_var_es(series, result, levels=[0.99], n_simulations=200000, seed=0)
+
+    sigma = result["volatility"].values
+    sigma_next = np.sqrt(1e-5 + 0.08 * series.values[-1] ** 2 + 0.9 * sigma[-1] ** 2)
+    z = standardized_residuals(series, result).values
+    expected = -sigma_next * np.quantile(z, 0.01)
+    assert out["VaR"].loc["A", 0.99] == pytest.approx(expected, rel=0.05)
+    assert out["ES"].loc["A", 0.99] >= out["VaR"].loc["A", 0.99]
+
+def test_batched_assets_and_levels(returns):
+    results = {col: garch_result(returns[col]) for col in returns.columns}
+    out = fhs_var_es(returns, results, levels=[0.9, 0.95, 0.99], horizon=10, n_simulations=5000, chunk_size=2, seed=1)
+    assert out["VaR"].shape == (3, 3)
+    assert (np.diff(out["VaR"].values, axis=1) > 0).all()
+    assert (out["ES"].values >= out["VaR"].values).all()
+
+def test_non_garch_model_uses_constant_volatility(returns):
+    series = returns["B"]
+    vol = pd.Series(0.01, index=series.index, name="EGARCH(1,1) Volatility")
+    with pytest.warns(RuntimeWarning, match="last fitted value"):
+        one_day = fhs_var_es(series, {"volatility": vol}, levels=[0.99], n_simulations=50000, seed=2)
+    with pytest.warns(RuntimeWarning, match="last fitted value"):
+        ten_day = fhs_var_es(series, {"volatility": vol}, levels=[0.99], horizon=10, n_simulations=50000, seed=2)
+    ratio = ten_day["VaR"].iloc[0, 0] / one_day["VaR"].iloc[0, 0]
+    assert 2.2 < ratio < 3.8
+
+def test_dispatch_follows_parameters_not_series_name(returns):
+    series = returns["C"]
+    result = garch_result(series)
+    renamed = dict(result, volatility=result["volatility"].rename("my volatility"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        expected = fhs_var_es(series, result, levels=[0.99], horizon=5, n_simulations=2000, seed=3)
+        out = fhs_var_es(series, renamed, levels=[0.99], horizon=5, n_simulations=2000, seed=3)
+    pd.testing.assert_frame_equal(out["VaR"], expected["VaR"])
+
+    # EGARCH shares the GJR parameter names but not its recursion.
+    egarch = estimate_egarch_params(series)
+    with pytest.warns(RuntimeWarning, match="last fitted value"):
+        fhs_var_es(series, egarch, levels=[0.99], horizon=5, n_simulations=2000, seed=3)
+
+def test_missing_result_raises(returns):
+    with pytest.raises(ValueError):
+        fhs_var_es(returns, {"A": garch_result(returns["A"])})
@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.models.har_model import estimate_har_params, har_regressors, rolling_har_forecast
+
+@pytest.fixture
+def rv():
+    rng = np.random.default_rng(0)
+    n = 400
+    log_rv = np.zeros(n)
+    for t in range(1, n):
+        log_rv[t] = 0.95 * log_rv[t - 1] + rng.normal(0, 0.3)
+    index = pd.date_range("2020-01-01", periods=n, freq="B")
+    return pd.Series(1e-4 * np.exp(log_rv), index=index)
+
+@pytest.fixture
+def bv(rv):
+    return rv * 0.9
+
+def test_har_regressors_match_rolling_means(rv):
+    X = har_regressors(rv)
+    assert list(X.columns) == ["const", "rv_1", "rv_5", "rv_22"]
+    np.testing.assert_allclose(X["rv_5"].values, rv.rolling(5).mean().values, equal_nan=True)
+    np.testing.assert_allclose(X["rv_22"].values, rv.rolling(22).mean().values, equal_nan=True)
+
+def test_estimate_har_rv(rv):
+    result = estimate_har_params(rv)
+    assert len(result["params"]) == 4
+    assert 0 < result["r_squared"] < 1
+    assert len(result["volatility"]) == len(rv)
+    assert np.isfinite(result["forecast"])
+
+def test_estimate_har_jump_models(rv, bv):
+    flags = pd.Series(np.arange(len(rv)) % 7 == 0, index=rv.index)
+    rv_j = estimate_har_params(rv, model="har-rv-j", bv=bv)
+    cj = estimate_har_params(rv, model="har-cj", bv=bv, jump_flags=flags, with_confidence=True)
+    assert "j_1" in rv_j["params"].index
+    assert list(cj["params"].index) == ["const", "c_1", "c_5", "c_22", "j_1", "j_5", "j_22"]
+    assert "lower" in cj and "upper" in cj
+
+def test_jump_model_requires_bv(rv):
+    with pytest.raises(ValueError):
+        har_regressors(rv, model="har-cj")
+
+@pytest.mark.parametrize("window", [None, 150])
+def test_rolling_rls_matches_ols_refit(rv, window):
+    result = rolling_har_forecast(rv, window=window, min_periods=100)
+    X = har_regressors(rv).values
+    y = rv.shift(-1).values
+
+    for s in [200, 300, len(rv) - 1]:
+        last_row = s - 1
+        first_row = 21 if window is None else last_row - window + 1
+        beta, *_ = np.linalg.lstsq(X[first_row:last_row + 1], y[first_row:last_row + 1], rcond=None)
+        np.testing.assert_allclose(result["params"].iloc[s].values, beta, rtol=1e-6, atol=1e-12)
+        assert result["forecast"].iloc[s] == pytest.approx(X[s] @ beta, rel=1e-6)
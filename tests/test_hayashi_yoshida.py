@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.hayashi_yoshida import hayashi_yoshida_covariance, hayashi_yoshida_series, project_psd
+from volatilitystats.estimators.realized_measures import realized_measures
+
+def _brute_force(x: pd.Series, y: pd.Series) -> float:
+    x, y = x.sort_index(), y.sort_index()
+    rx, ry = np.diff(np.log(x.values)), np.diff(np.log(y.values))
+    tx, ty = x.index.values, y.index.values
+    total = 0.0
+    for i in range(len(rx)):
+        for j in range(len(ry)):
+            if tx[i] < ty[j + 1] and ty[j] < tx[i + 1]:
+                total += rx[i] * ry[j]
+    return total
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(43)
+    days = pd.to_datetime(["2024-01-08", "2024-01-09", "2024-01-11"])
+    # Latent correlated log prices on a 1-second grid, observed asynchronously.
+    grid = np.concatenate([day + pd.Timedelta(hours=9.5) + pd.to_timedelta(np.arange(23400), unit="s") for day in days])
+    chol = np.linalg.cholesky(np.array([[1.0, 0.6, 0.3], [0.6, 1.0, 0.2], [0.3, 0.2, 1.0]]))
+    latent = np.cumsum(rng.normal(0, 1e-4, (len(grid), 3)) @ chol.T, axis=0)
+    frames = []
+    for k, (asset, rate) in enumerate([("A", 0.05), ("B", 0.02), ("C", 0.01)]):
+        seen = np.flatnonzero(rng.random(len(grid)) < rate)
+        frames.append(pd.DataFrame({"time": grid[seen], "price": 10 * np.exp(latent[seen, k]), "asset": asset}))
+    return pd.concat(frames).sample(frac=1.0, random_state=0).reset_index(drop=True)
+
+def test_pairwise_matches_brute_force():
+    rng = np.random.default_rng(0)
+    base = pd.Timestamp("2024-01-02 10:00")
+    tx = base + pd.to_timedelta(np.sort(rng.choice(5000, 80, replace=False)), unit="s")
+    ty = base + pd.to_timedelta(np.sort(rng.choice(5000, 50, replace=False)), unit="s")
+    # Shared timestamps and intervals outside the other series' range.
+    ty = ty.append(pd.DatetimeIndex([tx[10], base - pd.Timedelta("1h"), base + pd.Timedelta("3h")]))
+    x = pd.Series(np.exp(rng.normal(0, 0.01, len(tx)).cumsum()), index=tx)
+    y = pd.Series(np.exp(rng.normal(0, 0.01, len(ty)).cumsum()), index=ty)
+    assert hayashi_yoshida_covariance(x, y) == pytest.approx(_brute_force(x, y), rel=1e-12)
+    assert hayashi_yoshida_covariance(y, x) == pytest.approx(_brute_force(x, y), rel=1e-12)
+    # Against itself, HY is the realized variance.
+    assert hayashi_yoshida_covariance(x, x) == pytest.approx(np.sum(np.diff(np.log(x.values)) ** 2))
+
+def test_daily_matrices(ticks):
+    raw = hayashi_yoshida_series(ticks, "price", "time", "asset", psd=False)
+    # Four daily periods, including the empty 2024-01-10.
+    assert raw.shape == (12, 3)
+    np.testing.assert_array_equal(raw.loc[pd.Timestamp("2024-01-10")].values, 0.0)
+    assert list(raw.columns) == ["A", "B", "C"]
+    days = raw.index.get_level_values("time").unique()
+
+    for asset in "ABC":
+        rv = realized_measures(ticks[ticks["asset"] == asset], "price", "time", measures=["rv"])["rv"]
+        np.testing.assert_allclose(raw.xs(asset, level="asset")[asset].values, rv.reindex(days).values, rtol=1e-10)
+
+    for day in days:
+        block = raw.loc[day].values
+        np.testing.assert_allclose(block, block.T)
+    # Correlation is recovered despite asynchronous trading.
+    total = raw.groupby(level="asset").sum().loc[["A", "B", "C"], ["A", "B", "C"]].values
+    corr = total / np.sqrt(np.outer(np.diag(total), np.diag(total)))
+    assert corr[0, 1] == pytest.approx(0.6, abs=0.15)
+
+    psd = hayashi_yoshida_series(ticks, "price", "time", "asset", n_jobs=3)
+    assert np.all(np.linalg.eigvalsh(psd.values.reshape(-1, 3, 3)) >= -1e-15)
+    mapping = {asset: frame for asset, frame in ticks.groupby("asset")}
+    pd.testing.assert_frame_equal(hayashi_yoshida_series(mapping, "price", "time", n_jobs=3), psd)
+
+def test_daily_pair_matches_brute_force(ticks):
+    raw = hayashi_yoshida_series(ticks, "price", "time", "asset", psd=False)
+    prices = {a: f.set_index("time")["price"].sort_index() for a, f in ticks.groupby("asset")}
+    day = pd.Timestamp("2024-01-09")
+    # Returns closing on the day, including the overnight one.
+    b = prices["B"]
+    c = prices["C"]
+    b_day = b[(b.index >= b[b.index < day].index[-1]) & (b.index < day + pd.Timedelta("1D"))]
+    c_day = c[(c.index >= c[c.index < day].index[-1]) & (c.index < day + pd.Timedelta("1D"))]
+    assert raw.loc[(day, "B"), "C"] == pytest.approx(_brute_force(b_day, c_day), rel=1e-10)
+
+def test_project_psd():
+    m = np.array([[1.0, 0.9, -0.9], [0.9, 1.0, 0.9], [-0.9, 0.9, 1.0]])
+    projected = project_psd(m)
+    assert np.linalg.eigvalsh(projected).min() >= -1e-12
+    np.testing.assert_allclose(project_psd(projected), projected, atol=1e-12)
+    stack = np.stack([m, np.eye(3)])
+    np.testing.assert_allclose(project_psd(stack)[1], np.eye(3))
+
+def test_invalid_arguments(ticks):
+    with pytest.raises(ValueError):
+        hayashi_yoshida_series(ticks, "price", "time")
+    with pytest.raises(ValueError):
+        hayashi_yoshida_series(ticks, "price", "time", "asset", n_jobs=0)
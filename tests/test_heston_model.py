@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from scipy.stats import norm
+from volatilitystats.models.heston_model import estimate_heston_params, heston_price
+
+# Fang and Oosterlee (2008), Table 4 reference: S=K=100, T=1, r=q=0.
+REFERENCE_PARAMS = dict(kappa=1.5768, theta=0.0398, xi=0.5751, rho=-0.5711, v0=0.0175)
+REFERENCE_PRICE = 5.785155450
+
+def black_scholes_call(S, K, T, r, q, sigma):
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    d2 = d1 - sigma * np.sqrt(T)
+    return S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+
+def test_heston_reference_value():
+    price = heston_price([100.0], [1.0], 100.0, **REFERENCE_PARAMS)
+    assert price.shape == (1, 1)
+    assert price[0, 0] == pytest.approx(REFERENCE_PRICE, abs=1e-6)
+
+def test_heston_black_scholes_limit():
+    strikes = np.array([70.0, 90.0, 100.0, 110.0, 130.0])
+    maturities = np.array([0.1, 0.5, 2.0])
+    prices = heston_price(strikes, maturities, 100.0, kappa=1.0, theta=0.04, xi=1e-4, rho=0.0, v0=0.04, rate=0.03, dividend=0.01)
+    expected = black_scholes_call(100.0, strikes[None, :], maturities[:, None], 0.03, 0.01, 0.2)
+    np.testing.assert_allclose(prices, expected, atol=1e-6)
+
+def test_heston_put_call_parity():
+    strikes = np.array([80.0, 100.0, 120.0])
+    maturities = np.array([0.5, 1.0])
+    calls = heston_price(strikes, maturities, 100.0, **REFERENCE_PARAMS, rate=0.02)
+    puts = heston_price(strikes, maturities, 100.0, **REFERENCE_PARAMS, rate=0.02, option_type="put")
+    parity = 100.0 - strikes[None, :] * np.exp(-0.02 * maturities[:, None])
+    np.testing.assert_allclose(calls - puts, parity, atol=1e-10)
+
+def test_heston_invalid_option_type():
+    with pytest.raises(ValueError):
+        heston_price([100.0], [1.0], 100.0, **REFERENCE_PARAMS, option_type="digital")
+
+def test_estimate_heston_recovers_parameters():
+    strikes = np.linspace(80.0, 120.0, 9)
+    maturities = np.array([0.25, 0.5, 1.0, 2.0])
+    grid = heston_price(strikes, maturities, 100.0, **REFERENCE_PARAMS, rate=0.01)
+
+    result = estimate_heston_params(
+        np.tile(strikes, len(maturities)),
+        np.repeat(maturities, len(strikes)),
+        grid.ravel(),
+        spot=100.0,
+        rate=0.01
+    )
+    assert result["success"]
+    assert result["rmse"] < 1e-6
+    for name, value in REFERENCE_PARAMS.items():
+        assert result[name] == pytest.approx(value, rel=1e-3, abs=1e-4)
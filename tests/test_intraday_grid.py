@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.bipower_variation import bipower_variation_series
+from volatilitystats.estimators.jump_detection import lee_mykland_jumps
+from volatilitystats.estimators.realized_kernel import realized_kernel_series
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.utils.intraday_grid import IntradayGrid
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(46)
+    days = pd.to_datetime(["2024-11-27", "2024-11-29", "2024-12-02"])
+    times = np.concatenate([
+        day + pd.to_timedelta(np.sort(rng.uniform(8 * 3600, 17 * 3600, 400)), unit="s") for day in days
+    ])
+    prices = 50 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(times))))
+    order = rng.permutation(len(times))
+    return pd.DataFrame({"time": times[order], "price": prices[order]})
+
+def test_grid_matches_freq_path(ticks):
+    grid = IntradayGrid.from_frame(ticks, "time", include_overnight=True)
+    expected = realized_measures(ticks, "price", "time", measures=("rv", "bv", "rk"))
+    result = realized_measures(ticks, "price", "time", grid=grid)
+    # The freq path also labels the empty calendar days in between.
+    expected = expected[expected["rv"] > 0]
+    assert result.index.equals(expected.index)
+    pd.testing.assert_frame_equal(result[expected.columns], expected, rtol=1e-12)
+
+def test_session_excludes_outside_ticks(ticks):
+    grid = IntradayGrid.from_frame(ticks, "time", session_start="09:30", session_end="16:00")
+    ordered = ticks.sort_values("time")
+    expected = []
+    for _, day in ordered.set_index("time")["price"].groupby(lambda t: t.normalize()):
+        session = day.between_time("09:30", "16:00")
+        expected.append(np.sum(np.diff(np.log(session.values)) ** 2))
+    result = realized_measures(ticks, "price", "time", measures=("rv",), grid=grid)["rv"]
+    np.testing.assert_allclose(result.values, expected, rtol=1e-12)
+    assert not grid.overnight.any()
+    assert len(grid) == 3
+
+def test_early_close(ticks):
+    grid = IntradayGrid.from_frame(
+        ticks, "time", session_start="09:30", session_end="16:00", early_closes={"2024-11-29": "13:00"}
+    )
+    kept = pd.DatetimeIndex(grid.times.view("datetime64[ns]"))[grid.in_session]
+    half_day = kept[kept.normalize() == pd.Timestamp("2024-11-29")]
+    assert half_day.max() <= pd.Timestamp("2024-11-29 13:00")
+    assert kept.max() > pd.Timestamp("2024-12-02 15:00")
+
+def test_wrapping_session_labels_by_close():
+    times = pd.to_datetime([
+        "2024-03-04 17:30", "2024-03-04 20:00", "2024-03-05 01:00", "2024-03-05 16:59",
+        "2024-03-05 17:00", "2024-03-05 23:00", "2024-03-06 09:00"
+    ])
+    prices = np.array([100.0, 101.0, 102.0, 101.0, 103.0, 104.0, 102.0])
+    grid = IntradayGrid(times, session_start="17:00", session_end="17:00")
+    assert list(grid.labels) == list(pd.to_datetime(["2024-03-05", "2024-03-06"]))
+    np.testing.assert_array_equal(grid.offsets, [0, 3, 5])
+    np.testing.assert_allclose(grid.returns(prices), np.diff(np.log(prices))[[0, 1, 2, 4, 5]])
+
+def test_grid_reused_across_estimators(ticks):
+    grid = IntradayGrid.from_frame(ticks, "time", session_start="09:30", session_end="16:00")
+    bv = bipower_variation_series(ticks, "price", "time", grid=grid)
+    rk = realized_kernel_series(ticks, "price", "time", grid=grid)
+    measures = realized_measures(ticks, "price", "time", measures=("bv", "rk"), grid=grid)
+    np.testing.assert_allclose(bv.values, measures["bv"].values, rtol=1e-12)
+    np.testing.assert_allclose(rk.values, measures["rk"].values, rtol=1e-12)
+    table = lee_mykland_jumps(ticks, "price", "time", grid=grid)
+    assert table.index.isin(grid.return_index).all()
+
+def test_prices_length_checked(ticks):
+    grid = IntradayGrid.from_frame(ticks, "time")
+    with pytest.raises(ValueError):
+        grid.returns(ticks["price"].values[:-1])
+    with pytest.raises(ValueError):
+        IntradayGrid(ticks["time"], session_start="25:00")
+
+def test_dst_fall_back_matches_freq_path():
+    # New York 1-minute ticks through the repeated 01:00 hour of 2024-11-03, shuffled.
+    rng = np.random.default_rng(3)
+    times = pd.date_range("2024-11-02", "2024-11-05", freq="1min", tz="America/New_York", inclusive="left")
+    prices = 50 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(times))))
+    order = rng.permutation(len(times))
+    df = pd.DataFrame({"time": times[order], "price": prices[order]})
+
+    grid = IntradayGrid.from_frame(df, "time", include_overnight=True)
+    assert len(grid) == 3 and np.all(np.diff(grid.times) > 0)
+    expected = bipower_variation_series(df, "price", "time")
+    result = bipower_variation_series(df, "price", "time", grid=grid)
+    np.testing.assert_allclose(result.values, expected.values, rtol=1e-12)
+    assert grid.return_index.equals(pd.DatetimeIndex(times[1:], name="time"))
+    jumps = lee_mykland_jumps(df, "price", "time", grid=grid)
+    assert jumps.index.tz is not None
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.intraday_periodicity import (
+    PERIODICITY_METHODS, intraday_periodicity, intraday_return_matrix, periodicity_profile
+)
+from volatilitystats.utils.sampling import calendar_time_returns
+
+N_BINS = 78
+
+def _u_shape():
+    x = np.arange(1, N_BINS + 1) / N_BINS
+    f = 1.0 + 1.5 * (x - 0.5) ** 2 * 4
+    return f / np.sqrt(np.mean(f**2))
+
+@pytest.fixture
+def simulated():
+    rng = np.random.default_rng(50)
+    days = 600
+    sigma = np.exp(rng.normal(-6, 0.4, days))
+    returns = sigma[:, None] * _u_shape() / np.sqrt(N_BINS) * rng.standard_normal((days, N_BINS))
+    index = pd.date_range("2022-01-03 09:35", periods=N_BINS, freq="5min")
+    stamps = (pd.bdate_range("2022-01-03", periods=days).values[:, None] + (index - index[0].normalize()).values).ravel()
+    return pd.Series(returns.ravel(), index=pd.DatetimeIndex(stamps, name="time"))
+
+@pytest.mark.parametrize("method", PERIODICITY_METHODS)
+def test_profile_recovers_diurnal_pattern(simulated, method):
+    profile, adjusted = intraday_periodicity(simulated, method=method)
+    tolerance = 0.05 if method == "fff" else 0.15
+    np.testing.assert_allclose(profile.values, _u_shape(), rtol=tolerance)
+    assert np.mean(profile.values**2) == pytest.approx(1.0)
+    assert profile.index[0] == pd.Timedelta("09:35:00") and len(profile) == N_BINS
+    codes = np.arange(len(simulated)) % N_BINS
+    np.testing.assert_allclose(adjusted.values, simulated.values / profile.values[codes])
+    assert adjusted.index.equals(simulated.index)
+
+def test_robust_methods_ignore_jumps(simulated):
+    _, _, clean = intraday_return_matrix(simulated)
+    rng = np.random.default_rng(1)
+    jumped = clean.copy()
+    rows = rng.choice(len(jumped), 60, replace=False)
+    jumped[rows, 10] += 0.05 * np.sign(rng.standard_normal(60))
+    for method in ("wsd", "fff"):
+        before, after = periodicity_profile(clean, method), periodicity_profile(jumped, method)
+        assert abs(after[10] / before[10] - 1) < 0.1
+    assert periodicity_profile(jumped, "sd")[10] > 2 * periodicity_profile(clean, "sd")[10]
+
+def test_matrix_is_a_view_on_regular_grids():
+    rng = np.random.default_rng(3)
+    days = pd.to_datetime(["2024-05-06", "2024-05-07", "2024-05-09"])
+    times = np.concatenate([day + pd.to_timedelta(np.sort(rng.uniform(9.5 * 3600, 16 * 3600, 300)), unit="s") for day in days])
+    ticks = pd.DataFrame({"time": times, "price": 20 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))})
+    returns = calendar_time_returns(ticks, "price", "time", interval="15min")
+
+    labels, bins, matrix = intraday_return_matrix(returns)
+    assert np.shares_memory(matrix, returns.to_numpy())
+    assert labels.equals(pd.DatetimeIndex(days, name="time")) and bins[-1] == pd.Timedelta("16:00:00")
+    np.testing.assert_array_equal(matrix.ravel(), returns.values)
+
+    gappy = returns.drop(returns.index[[3, 40]])
+    _, _, scattered = intraday_return_matrix(gappy)
+    assert np.isnan(scattered.ravel()[[3, 40]]).all()
+    np.testing.assert_array_equal(np.delete(scattered.ravel(), [3, 40]), gappy.values)
+
+def test_midnight_close_and_invalid_input():
+    index = pd.date_range("2024-01-01 12:00", "2024-01-04 00:00", freq="12h")[1:]
+    _, bins, matrix = intraday_return_matrix(pd.Series(np.arange(5.0), index=index))
+    assert list(bins) == [pd.Timedelta("12h"), pd.Timedelta("24h")] and matrix.shape == (3, 2)
+    with pytest.raises(ValueError):
+        periodicity_profile(np.ones((4, 6)), method="fff")
+    with pytest.raises(ValueError):
+        periodicity_profile(np.ones((4, 6)), method="range")
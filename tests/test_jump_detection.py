@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.jump_detection import _diurnal_scale, lee_mykland_jumps, lee_mykland_statistics
+
+@pytest.fixture
+def jump_ticks():
+    rng = np.random.default_rng(31)
+    days = pd.bdate_range("2023-01-02", periods=20)
+    per_day = 1500
+    seconds = np.linspace(0, 23400, per_day, endpoint=False)
+    times = np.concatenate([day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(seconds, unit="s") for day in days])
+    # U-shaped intraday volatility.
+    u = seconds / 23400
+    diurnal = np.tile(0.6 + 1.6 * (u - 0.5) ** 2 * 4, len(days))
+    returns = rng.normal(0, 2e-4, len(times)) * diurnal
+    jump_at = [3 * per_day + 700, 11 * per_day + 200, 17 * per_day + 1200]
+    returns[jump_at] += [0.01, -0.008, 0.009]
+    prices = 100 * np.exp(np.cumsum(returns))
+    return pd.DataFrame({"time": times, "price": prices}), times[jump_at]
+
+def test_statistics_match_direct_window():
+    r = np.random.default_rng(1).normal(size=300)
+    stats = lee_mykland_statistics(r, window=20)
+    i = 150
+    products = np.abs(r[i - 18:i]) * np.abs(r[i - 19:i - 1])
+    assert stats[i] == pytest.approx(r[i] / np.sqrt(products.mean()))
+    assert np.isnan(stats[:18]).all() and np.isfinite(stats[19:]).all()
+    with pytest.raises(ValueError):
+        lee_mykland_statistics(r, window=2)
+
+def test_locates_injected_jumps(jump_ticks):
+    df, jump_times = jump_ticks
+    plain = lee_mykland_jumps(df.sample(frac=1, random_state=0), "price", "time")
+    adjusted = lee_mykland_jumps(df, "price", "time", diurnal="30min")
+    for table in (plain, adjusted):
+        assert pd.DatetimeIndex(jump_times).isin(table.index).all()
+        assert list(table.columns) == ["size", "statistic", "local_volatility", "critical_value"]
+        assert (table["statistic"].abs() > table["critical_value"]).all()
+    # The U-shaped intraday pattern produces false alarms near the close unless deflated.
+    assert len(adjusted) <= len(jump_times) + 2 < len(plain)
+    assert adjusted.loc[jump_times[1], "size"] == pytest.approx(-0.008, abs=1e-3)
+
+def test_overnight_returns_are_not_tested(jump_ticks):
+    df, _ = jump_ticks
+    df = df.copy()
+    day = pd.to_datetime(df["time"]).dt.normalize()
+    df.loc[day >= "2023-01-10", "price"] *= 1.05  # opening gap
+    table = lee_mykland_jumps(df, "price", "time")
+    first_ticks = pd.to_datetime(df["time"]).groupby(day).min()
+    assert not pd.DatetimeIndex(first_ticks).isin(table.index).any()
+
+def test_diurnal_scale_ignores_overnight_gaps():
+    # Homoskedastic intraday returns with large overnight gaps: every bin should get a factor near one.
+    rng = np.random.default_rng(4)
+    days = pd.bdate_range("2023-03-01", periods=40)
+    seconds = np.arange(0, 23400, 60)
+    times = pd.DatetimeIndex(np.concatenate([day + pd.Timedelta(hours=9, minutes=31) + pd.to_timedelta(seconds, unit="s") for day in days]))
+    returns = rng.normal(0, 1e-4, len(times))
+    overnight = np.zeros(len(times), dtype=bool)
+    overnight[::len(seconds)] = True
+    returns[overnight] = rng.normal(0, 5e-3, len(days))
+    scale = _diurnal_scale(times, returns, "30min", overnight)
+    np.testing.assert_allclose(scale[~overnight], 1.0, atol=0.1)
+    assert (scale[overnight] == 1.0).all()
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.models.ms_garch_model import (
+    estimate_ms_garch_params,
+    hamilton_filter,
+    kim_smoother,
+    ms_garch_log_likelihood,
+    stationary_distribution,
+)
+
+@pytest.fixture
+def regime_data():
+    rng = np.random.default_rng(7)
+    n = 1200
+    states = np.zeros(n, dtype=int)
+    transition = np.array([[0.98, 0.02], [0.05, 0.95]])
+    for t in range(1, n):
+        states[t] = rng.random() < transition[states[t - 1], 1]
+    scale = np.where(states == 1, 3.0, 1.0)
+    returns = pd.Series(scale * rng.standard_normal(n))
+    return returns, states
+
+def test_hamilton_filter_matches_loop():
+    rng = np.random.default_rng(0)
+    log_densities = rng.normal(-1, 0.5, size=(50, 3))
+    P = np.array([[0.9, 0.05, 0.05], [0.1, 0.8, 0.1], [0.2, 0.2, 0.6]])
+    xi0 = stationary_distribution(P)
+    predicted, filtered, log_lik = hamilton_filter(log_densities, P, xi0)
+
+    xi, expected_ll = xi0, 0.0
+    for t in range(50):
+        pred = np.array([sum(P[i, j] * xi[i] for i in range(3)) for j in range(3)])
+        joint = pred * np.exp(log_densities[t])
+        expected_ll += np.log(joint.sum())
+        xi = joint / joint.sum()
+        np.testing.assert_allclose(filtered[t], xi)
+    assert log_lik == pytest.approx(expected_ll)
+
+    smoothed = kim_smoother(predicted, filtered, P)
+    np.testing.assert_allclose(smoothed.sum(axis=1), 1.0)
+    np.testing.assert_allclose(smoothed[-1], filtered[-1])
+
+def test_stationary_distribution():
+    P = np.array([[0.98, 0.02], [0.05, 0.95]])
+    pi = stationary_distribution(P)
+    np.testing.assert_allclose(pi @ P, pi)
+    assert pi.sum() == pytest.approx(1.0)
+
+def test_ms_garch_log_likelihood_invalid_params_length(regime_data):
+    returns, _ = regime_data
+    with pytest.raises(ValueError):
+        ms_garch_log_likelihood([0.1, 0.1, 0.05], returns, n_regimes=2)
+
+def test_ms_garch_log_likelihood_empty():
+    params = [0.1, 0.2, 0.05, 0.05, 0.8, 0.8, -3.0, -3.0]
+    assert ms_garch_log_likelihood(params, pd.Series([], dtype=float)) == 0.0
+
+def test_estimate_ms_garch_identifies_regimes(regime_data):
+    returns, states = regime_data
+    result = estimate_ms_garch_params(returns, n_regimes=2, with_confidence=True)
+    assert len(result["volatility"]) == len(returns)
+    np.testing.assert_allclose(result["transition_matrix"].sum(axis=1), 1.0)
+
+    smoothed = result["smoothed_probabilities"]
+    accuracy = np.mean((smoothed["regime_1"].values > 0.5) == (states == 1))
+    assert accuracy > 0.8
+    assert "lower" in result and "upper" in result
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.multi_scale_realized_volatility import (
+    msrv_series, msrv_weights, multi_scale_realized_volatility, tsrv_sweep, tsrv_sweep_series
+)
+from volatilitystats.estimators.two_scale_realized_volatility import (
+    subsampled_realized_variances, two_scale_realized_volatility, tsrv_series
+)
+from volatilitystats.utils.segments import intraday_log_returns
+
+def _sparse_grid_rv(returns, K):
+    prices = np.concatenate(([0.0], np.cumsum(returns)))
+    return np.mean([np.sum(np.diff(prices[k::K]) ** 2) for k in range(K)])
+
+@pytest.fixture
+def noisy_returns():
+    rng = np.random.default_rng(13)
+    efficient = np.cumsum(rng.normal(0, 1e-4, 23401))
+    return np.diff(efficient + rng.normal(0, 3e-4, len(efficient))), 23400 * 1e-8
+
+def test_subsampled_rvs_match_sparse_grids():
+    returns = np.random.default_rng(1).normal(size=200)
+    subsampled = subsampled_realized_variances(returns, 12)
+    # The sliding-difference form counts every complete K-return; sparse grids drop a partial tail.
+    prices = np.concatenate(([0.0], np.cumsum(returns)))
+    np.testing.assert_allclose(subsampled, [np.sum((prices[K:] - prices[:-K]) ** 2) / K for K in range(1, 13)])
+    assert subsampled[4] == pytest.approx(_sparse_grid_rv(returns, 5), rel=0.1)
+    assert subsampled[0] == pytest.approx(np.sum(returns**2))
+
+def test_msrv_weights():
+    weights = msrv_weights(15)
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.sum(weights / np.arange(1, 16)) == pytest.approx(0.0, abs=1e-12)
+    assert not weights.flags.writeable
+    with pytest.raises(ValueError):
+        msrv_weights(1)
+
+def test_msrv_and_tsrv_remove_noise_bias(noisy_returns):
+    returns, iv = noisy_returns
+    assert np.sum(returns**2) > 5 * iv
+    assert multi_scale_realized_volatility(returns, M=60) == pytest.approx(iv, rel=0.25)
+    assert two_scale_realized_volatility(returns, K=60) == pytest.approx(iv, rel=0.25)
+
+def test_tsrv_sweep_matches_single_scale(noisy_returns):
+    returns, _ = noisy_returns
+    sweep = tsrv_sweep(returns[:500], 8)
+    np.testing.assert_allclose(sweep.values, [two_scale_realized_volatility(returns[:500], K) for K in range(1, 9)])
+    assert list(sweep.index) == list(range(1, 9))
+    assert tsrv_sweep(returns[:3], 5).iloc[3:].isna().all()
+
+def test_series_match_per_day():
+    rng = np.random.default_rng(17)
+    days = pd.bdate_range("2024-04-01", periods=4)
+    sizes = [600, 5, 900, 400]
+    times = np.concatenate([
+        day + pd.Timedelta(hours=10) + pd.to_timedelta(np.sort(rng.uniform(0, 20000, m)), unit="s")
+        for day, m in zip(days, sizes)
+    ])
+    df = pd.DataFrame({"time": times, "price": 50 * np.exp(np.cumsum(rng.normal(0, 3e-4, len(times))))})
+    grouped = intraday_log_returns(df, "price", "time").groupby(pd.Grouper(freq="1D"))
+
+    msrv = msrv_series(df, "price", "time", M=8)
+    expected = grouped.apply(lambda x: multi_scale_realized_volatility(x.values, M=8) if len(x) >= 8 else np.nan)
+    pd.testing.assert_series_equal(msrv, expected, check_names=False)
+    assert msrv.name == "MSRV(8)" and np.isnan(msrv.iloc[1])
+
+    sweep = tsrv_sweep_series(df, "price", "time", max_scale=6)
+    pd.testing.assert_series_equal(sweep["TSRV(4)"], tsrv_series(df, "price", "time", K=4), check_names=False)
+    assert sweep.shape == (4, 6)
@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.neighbor_truncation import (
+    _CHUNK, median_realized_variance, medrv_series, min_realized_variance, minrv_series
+)
+from volatilitystats.utils.segments import intraday_log_returns
+
+def _loop_minrv(r):
+    n = len(r)
+    return np.pi / (np.pi - 2) * n / (n - 1) * sum(min(abs(r[i]), abs(r[i - 1])) ** 2 for i in range(1, n))
+
+def _loop_medrv(r):
+    n = len(r)
+    total = sum(np.median(np.abs(r[i - 2:i + 1])) ** 2 for i in range(2, n))
+    return np.pi / (6 - 4 * np.sqrt(3) + np.pi) * n / (n - 2) * total
+
+def test_estimators_match_window_loops():
+    r = np.random.default_rng(6).normal(0, 1e-3, 501)
+    assert min_realized_variance(r) == pytest.approx(_loop_minrv(r))
+    assert median_realized_variance(r) == pytest.approx(_loop_medrv(r))
+    assert np.isnan(min_realized_variance(r[:1]))
+    assert np.isnan(median_realized_variance(r[:2]))
+
+def test_robust_to_a_single_jump():
+    rng = np.random.default_rng(9)
+    r = rng.normal(0, 1e-4, 23400)
+    iv = 23400 * 1e-8
+    r[1000] += 0.02
+    assert np.sum(r**2) > 2 * iv
+    assert min_realized_variance(r) == pytest.approx(iv, rel=0.05)
+    assert median_realized_variance(r) == pytest.approx(iv, rel=0.05)
+
+def test_series_per_day_without_cross_day_windows():
+    rng = np.random.default_rng(2)
+    days = pd.bdate_range("2024-05-06", periods=3)
+    sizes = [400, 2, 700]
+    times = np.concatenate([
+        day + pd.Timedelta(hours=10) + pd.to_timedelta(np.sort(rng.uniform(0, 20000, m)), unit="s")
+        for day, m in zip(days, sizes)
+    ])
+    df = pd.DataFrame({"time": times, "price": 20 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))})
+    grouped = intraday_log_returns(df, "price", "time").groupby(pd.Grouper(freq="1D"))
+
+    pd.testing.assert_series_equal(
+        minrv_series(df, "price", "time"), grouped.apply(lambda x: min_realized_variance(x.values)), check_names=False
+    )
+    medrv = medrv_series(df, "price", "time")
+    pd.testing.assert_series_equal(medrv, grouped.apply(lambda x: median_realized_variance(x.values)), check_names=False)
+    assert np.isnan(medrv.iloc[1]) and medrv.name == "MedRV"
+
+def test_memory_stays_flat_for_long_days():
+    import tracemalloc
+    r = np.random.default_rng(0).normal(0, 1e-4, 2_000_000)
+    tracemalloc.start()
+    median_realized_variance(r)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # One |r| copy plus fixed-size chunk temporaries; no (n × window) materialization.
+    assert peak < r.nbytes + 8 * _CHUNK * r.itemsize
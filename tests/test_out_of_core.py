@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.out_of_core import chunked_realized_measures, iter_realized_measures
+from volatilitystats.estimators.realized_measures import realized_measures
+
+MEASURES = ["rv", "bv", "tsrv", "medrv", "rk", "jump"]
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(19)
+    days = pd.to_datetime(["2024-07-01", "2024-07-02", "2024-07-05", "2024-07-08", "2024-07-09"])
+    times = np.concatenate([
+        day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, m)), unit="s")
+        for day, m in zip(days, [300, 1, 250, 400, 5])
+    ])
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    return pd.DataFrame({"time": times, "price": prices})
+
+@pytest.mark.parametrize("chunksize", [1, 97, 300, 10_000])
+def test_csv_stream_matches_in_memory(tmp_path, ticks, chunksize):
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    expected = realized_measures(ticks, "price", "time", measures=MEASURES, K=3)
+    result = chunked_realized_measures(path, measures=MEASURES, chunksize=chunksize, K=3)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-9)
+
+def test_npy_directory_and_generator(tmp_path, ticks):
+    np.save(tmp_path / "time.npy", ticks["time"].values.astype("datetime64[ns]"))
+    np.save(tmp_path / "price.npy", ticks["price"].values)
+    stream = iter_realized_measures(str(tmp_path), measures=["rv", "bv"], chunksize=200)
+    first = next(stream)
+    # Days are emitted once ticks of a later day have been read (here, in the second chunk).
+    assert list(first.index) == list(pd.date_range("2024-07-01", "2024-07-02"))
+    rest = pd.concat([first, *stream])
+    expected = realized_measures(ticks, "price", "time", measures=["rv", "bv"])
+    np.testing.assert_allclose(rest.values, expected.values, rtol=1e-12)
+    assert rest.index.equals(expected.index)
+
+def test_unsorted_input_raises(ticks):
+    shuffled = ticks.sample(frac=1, random_state=3)
+    with pytest.raises(ValueError):
+        chunked_realized_measures([shuffled], chunksize=50)
+
+def _local_ticks(tz):
+    # A Tokyo session spans UTC midnight; New York days cross the March DST change.
+    rng = np.random.default_rng(5)
+    days = pd.date_range("2024-03-08", "2024-03-13", freq="D")
+    times = np.concatenate([
+        day + pd.Timedelta(hours=8) + pd.to_timedelta(np.sort(rng.uniform(0, 7 * 3600, 200)), unit="s") for day in days
+    ])
+    return pd.DataFrame({
+        "time": pd.DatetimeIndex(times).tz_localize(tz),
+        "price": 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    })
+
+@pytest.mark.parametrize("tz", ["Asia/Tokyo", "America/New_York"])
+def test_tz_aware_periods_follow_local_days(tz):
+    ticks = _local_ticks(tz)
+    expected = realized_measures(ticks, "price", "time", measures=MEASURES, K=3)
+    assert len(expected) == 6
+    result = chunked_realized_measures([ticks], measures=MEASURES, chunksize=150, K=3)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, check_index_type=False, rtol=1e-9)
+    assert result.index.equals(expected.index)
+
+def test_csv_with_utc_offsets(tmp_path):
+    ticks = _local_ticks("Asia/Tokyo")
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    expected = realized_measures(ticks, "price", "time", measures=MEASURES, K=3)
+    result = chunked_realized_measures(path, measures=MEASURES, chunksize=150, K=3)
+    np.testing.assert_allclose(result.values.astype(float), expected.values.astype(float), rtol=1e-9)
+    assert (result.index.tz_localize(None) == expected.index.tz_localize(None)).all()
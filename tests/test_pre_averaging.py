@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.pre_averaging import (
+    pre_averaged_bipower_variation,
+    pre_averaged_bv_series,
+    pre_averaged_realized_variance,
+    pre_averaged_rv_series,
+    pre_averaging_constants,
+)
+
+def _direct(returns, theta=1 / 3):
+    """Reference: explicit weighted sums for every window."""
+    n = len(returns)
+    k = max(int(np.ceil(theta * np.sqrt(n))), 2)
+    j = np.arange(1, k) / k
+    weights = np.minimum(j, 1 - j)
+    averaged = np.array([weights @ returns[i:i + k - 1] for i in range(n - k + 2)])
+    psi1, psi2 = pre_averaging_constants(k)
+    bias = psi1 / ((k / np.sqrt(n)) ** 2 * psi2) * np.sum(returns**2) / (2 * n)
+    prv = n / (n - k + 2) * np.sum(averaged**2) / (k * psi2) - bias
+    pbv = n / (n - 2 * k + 2) * (np.pi / 2) * np.sum(np.abs(averaged[:-k] * averaged[k:])) / (k * psi2) - bias
+    return max(prv, 0.0), max(pbv, 0.0)
+
+@pytest.mark.parametrize("n", [30, 31, 500, 2001])
+def test_matches_direct_convolution(n):
+    returns = np.random.default_rng(n).normal(0, 1e-3, n)
+    prv, pbv = _direct(returns)
+    assert pre_averaged_realized_variance(returns) == pytest.approx(prv, rel=1e-10)
+    assert pre_averaged_bipower_variation(returns) == pytest.approx(pbv, rel=1e-10)
+
+def test_constants_approach_continuous_limits():
+    psi1, psi2 = pre_averaging_constants(1000)
+    assert psi1 == pytest.approx(1.0)
+    assert psi2 == pytest.approx(1 / 12, rel=1e-4)
+
+def test_noise_and_jump_robustness():
+    rng = np.random.default_rng(45)
+    n, iv = 200_000, 1e-4
+    efficient = np.cumsum(rng.normal(0, np.sqrt(iv / n), n + 1))
+    returns = np.diff(efficient + rng.normal(0, 2e-4, n + 1))
+    assert np.sum(returns**2) > 50 * iv
+    assert pre_averaged_realized_variance(returns) == pytest.approx(iv, rel=0.1)
+    jumped = returns.copy()
+    jumped[n // 2] += 0.02
+    assert pre_averaged_realized_variance(jumped) > 2 * iv
+    assert pre_averaged_bipower_variation(jumped) == pytest.approx(iv, rel=0.2)
+
+def test_series_batches_days():
+    rng = np.random.default_rng(7)
+    days = pd.to_datetime(["2024-06-03", "2024-06-04", "2024-06-06"])
+    times = np.concatenate([
+        day + pd.to_timedelta(np.sort(rng.uniform(0, 86_000, m)), unit="s") for day, m in zip(days, [3000, 5, 800])
+    ])
+    df = pd.DataFrame({"time": times, "price": 100 * np.exp(np.cumsum(rng.normal(0, 1e-4, len(times))))})
+    rv = pre_averaged_rv_series(df, "price", "time")
+    bv = pre_averaged_bv_series(df, "price", "time")
+    assert rv.name == "PreAveragedRV" and bv.name == "PreAveragedBV"
+    assert len(rv) == 4 and np.isnan(rv.loc["2024-06-05"])
+
+    log_returns = np.log(df.set_index("time")["price"]).diff().dropna()
+    for day, values in log_returns.groupby(log_returns.index.normalize()):
+        assert rv.loc[day] == pytest.approx(pre_averaged_realized_variance(values.values), rel=1e-10, nan_ok=True)
+        assert bv.loc[day] == pytest.approx(pre_averaged_bipower_variation(values.values), rel=1e-10, nan_ok=True)
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.realized_covariance import (
+    daily_covariances,
+    pack_upper,
+    realized_covariance_series,
+    rolling_covariance,
+    shrink_covariance,
+    synchronized_returns,
+    unpack_upper,
+)
+from volatilitystats.utils.sampling import calendar_time_returns
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(44)
+    days = pd.bdate_range("2024-04-01", periods=6)
+    frames = []
+    for k, asset in enumerate(["X", "Y", "Z"]):
+        for d, day in enumerate(days):
+            if asset == "Z" and d == 2:
+                continue  # Z does not trade on the third day.
+            times = day + pd.to_timedelta(np.sort(rng.uniform(9.5 * 3600, 16 * 3600, 400)), unit="s")
+            frames.append(pd.DataFrame({"time": times, "price": 10 + k + np.cumsum(rng.normal(0, 0.01, 400)), "asset": asset}))
+    return pd.concat(frames, ignore_index=True)
+
+def test_synchronized_returns(ticks):
+    days, assets, returns = synchronized_returns(ticks, "price", "time", "asset", interval="15min")
+    assert assets == ["X", "Y", "Z"]
+    assert len(days) == 6 and returns.shape == (6, 26, 3)
+    np.testing.assert_array_equal(returns[2, :, 2], 0.0)
+    expected = calendar_time_returns(ticks[ticks["asset"] == "Y"], "price", "time", interval="15min")
+    np.testing.assert_allclose(returns[:, :, 1].ravel(), expected.values)
+
+def test_daily_and_rolling(ticks):
+    days, assets, returns = synchronized_returns(ticks, "price", "time", "asset")
+    packed = daily_covariances(returns)
+    full = unpack_upper(packed, 3)
+    for d in range(len(days)):
+        np.testing.assert_allclose(full[d], returns[d].T @ returns[d], rtol=1e-12)
+    np.testing.assert_allclose(pack_upper(full), packed)
+
+    rolled = rolling_covariance(packed, 3)
+    assert np.isnan(rolled[:2]).all()
+    expected = pd.DataFrame(packed).rolling(3).mean().values
+    np.testing.assert_allclose(rolled[2:], expected[2:], rtol=1e-12)
+
+    # float32 storage keeps a float64 running sum.
+    rolled32 = rolling_covariance(packed.astype(np.float32), 3)
+    assert rolled32.dtype == np.float32
+    np.testing.assert_allclose(rolled32[2:], expected[2:], rtol=1e-5)
+
+def test_shrinkage():
+    m = np.array([[4.0, 1.0], [1.0, 2.0]])
+    packed = pack_upper(m)
+    np.testing.assert_allclose(unpack_upper(shrink_covariance(packed, 2, 0.5), 2), [[4.0, 0.5], [0.5, 2.0]])
+    np.testing.assert_allclose(unpack_upper(shrink_covariance(packed, 2, 1.0, "identity"), 2), 3.0 * np.eye(2))
+    with pytest.raises(ValueError):
+        shrink_covariance(packed, 2, 1.5)
+    with pytest.raises(ValueError):
+        shrink_covariance(packed, 2, 0.5, "market")
+
+def test_series_layouts(ticks):
+    full = realized_covariance_series(ticks, "price", "time", "asset", window=2, shrinkage=0.1)
+    assert full.shape == (18, 3)
+    assert np.isnan(full.loc[pd.Timestamp("2024-04-01")].values).all()
+    compact = realized_covariance_series(ticks, "price", "time", "asset", window=2, shrinkage=0.1, dtype=np.float32, packed=True)
+    assert compact.shape == (6, 6) and compact.dtypes.eq(np.float32).all()
+    assert list(compact.columns[1]) == ["X", "Y"]
+    day = pd.Timestamp("2024-04-03")
+    np.testing.assert_allclose(unpack_upper(compact.loc[day].values, 3), full.loc[day].values, rtol=1e-5)
+    mapping = {a: f for a, f in ticks.groupby("asset")}
+    pd.testing.assert_frame_equal(realized_covariance_series(mapping, "price", "time", window=2, shrinkage=0.1), full)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.models.realized_garch_model import (
+    estimate_realized_garch_params,
+    realized_garch_filter,
+    realized_garch_log_likelihood,
+)
+
+TRUE_PARAMS = [-0.2, 0.55, 0.41, -0.18, 1.0, -0.07, 0.07, 0.38]
+
+@pytest.fixture
+def data():
+    omega, beta, gamma, xi, phi, tau1, tau2, sigma_u = TRUE_PARAMS
+    rng = np.random.default_rng(1)
+    n = 1500
+    log_h = np.zeros(n)
+    log_x = np.zeros(n)
+    z = rng.standard_normal(n)
+    log_h[0] = -9.0
+    for t in range(n):
+        if t > 0:
+            log_h[t] = omega + beta * log_h[t - 1] + gamma * log_x[t - 1]
+        log_x[t] = xi + phi * log_h[t] + tau1 * z[t] + tau2 * (z[t] ** 2 - 1) + sigma_u * rng.standard_normal()
+    index = pd.date_range("2015-01-01", periods=n, freq="B")
+    returns = pd.Series(np.exp(0.5 * log_h) * z, index=index)
+    realized = pd.Series(np.exp(log_x), index=index, name="Realized Kernel (bartlett)")
+    return returns, realized
+
+def test_filter_matches_loop(data):
+    returns, realized = data
+    r, x = returns.values, realized.values
+    log_h, _, _ = realized_garch_filter(TRUE_PARAMS, r, x)
+
+    expected = np.empty(len(r))
+    expected[0] = np.log(np.var(r))
+    for t in range(1, len(r)):
+        expected[t] = TRUE_PARAMS[0] + TRUE_PARAMS[1] * expected[t - 1] + TRUE_PARAMS[2] * np.log(x[t - 1])
+    np.testing.assert_allclose(log_h, expected)
+
+def test_log_likelihood_invalid_sigma_u_is_inf(data):
+    returns, realized = data
+    params = list(TRUE_PARAMS)
+    params[7] = 0.0
+    assert np.isinf(realized_garch_log_likelihood(params, returns.values, realized.values))
+
+def test_log_likelihood_empty():
+    assert realized_garch_log_likelihood(TRUE_PARAMS, np.array([]), np.array([])) == 0.0
+
+def test_log_likelihood_invalid_params_length(data):
+    returns, realized = data
+    with pytest.raises(ValueError):
+        realized_garch_log_likelihood(TRUE_PARAMS[:5], returns.values, realized.values)
+
+def test_estimate_realized_garch(data):
+    returns, realized = data
+    result = estimate_realized_garch_params(returns, realized, with_confidence=True)
+    assert len(result["volatility"]) == len(returns)
+    assert np.all(result["volatility"] > 0)
+    assert result["beta"] == pytest.approx(TRUE_PARAMS[1], abs=0.1)
+    assert result["phi"] == pytest.approx(TRUE_PARAMS[4], abs=0.2)
+    assert "lower" in result and "upper" in result
+
+def test_estimate_realized_garch_drops_empty_bins(data):
+    returns, realized = data
+    realized = realized.copy()
+    realized.iloc[::10] = 0.0
+    result = estimate_realized_garch_params(returns, realized)
+    assert len(result["volatility"]) == len(returns) - len(returns[::10])
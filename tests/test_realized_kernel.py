@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.realized_kernel import (
+    kernel_weight, kernel_weights, optimal_bandwidth, realized_autocovariances, realized_kernel, realized_kernel_series
+)
+from volatilitystats.utils.segments import intraday_log_returns
+
+def _loop_kernel(returns, kernel, bandwidth):
+    rk = np.sum(returns**2)
+    for h in range(1, bandwidth + 1):
+        rk += 2 * kernel_weight(h, bandwidth, kernel) * np.sum(returns[h:] * returns[:-h])
+    return max(rk, 0.0)
+
+@pytest.fixture
+def noisy_ticks():
+    rng = np.random.default_rng(21)
+    days = pd.bdate_range("2024-02-05", periods=6)
+    sizes = [3000, 50, 1, 800, 4000, 2]
+    times = np.concatenate([
+        day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, m)), unit="s")
+        for day, m in zip(days, sizes)
+    ])
+    efficient = np.cumsum(rng.normal(0, 2e-4, len(times)))
+    prices = 100 * np.exp(efficient + rng.normal(0, 5e-4, len(times)))
+    return pd.DataFrame({"time": times, "price": prices})
+
+@pytest.mark.parametrize("kernel", ["bartlett", "parzen", "uniform"])
+@pytest.mark.parametrize("bandwidth", [None, 3, 150])
+def test_realized_kernel_matches_lag_loop(kernel, bandwidth):
+    returns = np.random.default_rng(2).normal(0, 1e-3, 5000)
+    expected = _loop_kernel(returns, kernel, int(np.sqrt(len(returns))) if bandwidth is None else bandwidth)
+    assert realized_kernel(returns, kernel=kernel, bandwidth=bandwidth) == pytest.approx(expected, rel=1e-10)
+
+def test_autocovariances_fft_and_direct_paths_agree():
+    returns = np.random.default_rng(4).normal(size=2000)
+    direct = [np.dot(returns[h:], returns[:len(returns) - h]) for h in range(301)]
+    np.testing.assert_allclose(realized_autocovariances(returns, 300), direct, atol=1e-9)
+    np.testing.assert_allclose(realized_autocovariances(returns, 5), direct[:6], atol=1e-9)
+    short = realized_autocovariances(returns[:10], 40)
+    assert np.all(short[10:] == 0.0)
+
+def test_kernel_weights_cached_and_read_only():
+    weights = kernel_weights("parzen", 12)
+    assert weights is kernel_weights("parzen", 12)
+    assert not weights.flags.writeable
+    np.testing.assert_allclose(weights, [kernel_weight(h, 12, "parzen") for h in range(1, 13)])
+    with pytest.raises(ValueError):
+        kernel_weights("gaussian", 3)
+
+def test_series_batches_days(noisy_ticks):
+    log_returns = intraday_log_returns(noisy_ticks, "price", "time")
+    for bandwidth in [None, "optimal"]:
+        result = realized_kernel_series(noisy_ticks, "price", "time", kernel="parzen", bandwidth=bandwidth)
+        expected = log_returns.groupby(pd.Grouper(freq="1D")).apply(
+            lambda x: realized_kernel(x.values, kernel="parzen", bandwidth=bandwidth)
+        )
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-10, atol=1e-18)
+
+def test_optimal_bandwidth_grows_with_noise():
+    rng = np.random.default_rng(8)
+    efficient = np.cumsum(rng.normal(0, 1e-4, 23400))
+    quiet = np.diff(efficient + rng.normal(0, 1e-5, len(efficient)))
+    noisy = np.diff(efficient + rng.normal(0, 2e-4, len(efficient)))
+    assert 1 <= optimal_bandwidth(quiet) < optimal_bandwidth(noisy) < len(noisy)
+    assert optimal_bandwidth(noisy, kernel="bartlett") >= 1
+    with pytest.raises(ValueError):
+        optimal_bandwidth(noisy, kernel="uniform")
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.bipower_variation import bipower_variation_series
+from volatilitystats.estimators.jump_detection import detect_jumps_series
+from volatilitystats.estimators.median_realized_volatility import median_rv_series
+from volatilitystats.estimators.realized_kernel import realized_kernel_series
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.estimators.two_scale_realized_volatility import tsrv_series
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(5)
+    days = pd.to_datetime(["2024-03-04", "2024-03-05", "2024-03-06", "2024-03-08"])
+    times = np.concatenate([
+        day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, 400)), unit="s")
+        for day in days
+    ])
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    prices[700] *= 1.02  # one jump
+    order = rng.permutation(len(times))  # unsorted input
+    return pd.DataFrame({"time": times[order], "price": prices[order]})
+
+def test_battery_matches_series_functions(ticks):
+    table = realized_measures(ticks, "price", "time", measures=["bv", "medrv", "rk", "jump", "rv"])
+    np.testing.assert_allclose(table["bv"], bipower_variation_series(ticks, "price", "time"))
+    np.testing.assert_allclose(table["medrv"], median_rv_series(ticks, "price", "time"), equal_nan=True)
+    np.testing.assert_allclose(table["rk"], realized_kernel_series(ticks, "price", "time"))
+    np.testing.assert_array_equal(table["jump"], detect_jumps_series(ticks, "price", "time"))
+    assert list(table.columns) == ["bv", "medrv", "rk", "jump", "rv"]
+    assert table.index.equals(bipower_variation_series(ticks, "price", "time").index)
+
+def test_battery_tsrv_and_empty_periods(ticks):
+    table = realized_measures(ticks, "price", "time", measures=["tsrv", "rv"], K=3)
+    assert np.isnan(table.loc["2024-03-07", "tsrv"])
+    assert table.loc["2024-03-07", "rv"] == 0.0
+    one_day = ticks[pd.to_datetime(ticks["time"]).dt.normalize() <= "2024-03-06"]
+    np.testing.assert_allclose(table["tsrv"].iloc[:3], tsrv_series(one_day, "price", "time", K=3))
+
+def test_battery_unknown_measure(ticks):
+    with pytest.raises(ValueError):
+        realized_measures(ticks, "price", "time", measures=["rv", "foo"])
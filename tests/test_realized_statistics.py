@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.estimators.realized_statistics import (
+    measures_from_statistics, realized_statistics, rollup_statistics
+)
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(48)
+    days = pd.date_range("2024-01-01", "2024-03-20", freq="D")
+    # Empty and very short days make cross-day products span several days.
+    sizes = rng.choice([0, 1, 2, 3, 40, 200], len(days))
+    times = np.concatenate([
+        day + pd.to_timedelta(np.sort(rng.uniform(9.5 * 3600, 16 * 3600, m)), unit="s") for day, m in zip(days, sizes)
+    ])
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    return pd.DataFrame({"time": times, "price": prices})
+
+def test_daily_measures_match_realized_measures(ticks):
+    daily = realized_statistics(ticks, "price", "time", max_lag=6, max_scale=3)
+    result = measures_from_statistics(daily, K=3, bandwidth=4)
+    expected = realized_measures(ticks, "price", "time", measures=list(result.columns), K=3, bandwidth=4)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-12)
+
+@pytest.mark.parametrize("freq", ["W", "ME", "2D"])
+def test_rollup_matches_direct_statistics(ticks, freq):
+    daily = realized_statistics(ticks, "price", "time", max_lag=6, max_scale=3)
+    rolled = rollup_statistics(daily, freq)
+    direct = realized_statistics(ticks, "price", "time", freq=freq, max_lag=6, max_scale=3)
+    pd.testing.assert_frame_equal(rolled, direct, check_freq=False, rtol=1e-10)
+
+    result = measures_from_statistics(rolled, bandwidth=6)
+    expected = realized_measures(ticks, "price", "time", measures=list(result.columns), freq=freq, bandwidth=6)
+    pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-10)
+
+def test_rollups_chain(ticks):
+    daily = realized_statistics(ticks, "price", "time", max_lag=2)
+    chained = rollup_statistics(rollup_statistics(daily, "2D"), "4D")
+    direct = realized_statistics(ticks, "price", "time", freq="4D", max_lag=2)
+    pd.testing.assert_frame_equal(chained, direct, check_freq=False, rtol=1e-10)
+
+def test_missing_lags_raise(ticks):
+    daily = realized_statistics(ticks, "price", "time", max_lag=3)
+    with pytest.raises(ValueError):
+        measures_from_statistics(rollup_statistics(daily, "ME"), measures=["rk"], bandwidth=4)
+    with pytest.raises(ValueError):
+        measures_from_statistics(daily, measures=["tsrv"], K=4)
+
+def test_default_settings_work_together():
+    # Days of 2000 ticks have sqrt(n) > max_lag, and weekly roll-ups far more so.
+    rng = np.random.default_rng(7)
+    days = pd.bdate_range("2024-04-01", periods=10)
+    times = np.concatenate([day + pd.to_timedelta(np.sort(rng.uniform(9.5 * 3600, 16 * 3600, 2000)), unit="s") for day in days])
+    ticks = pd.DataFrame({"time": times, "price": 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))})
+    daily = realized_statistics(ticks, "price", "time")
+    for table, freq in [(daily, "1D"), (rollup_statistics(daily, "W"), "W")]:
+        result = measures_from_statistics(table)
+        expected = realized_measures(ticks, "price", "time", measures=list(result.columns), freq=freq, bandwidth=30)
+        pd.testing.assert_frame_equal(result, expected, check_freq=False, rtol=1e-10)
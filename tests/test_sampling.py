@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.utils.sampling import calendar_time_returns, tick_time_returns
+from volatilitystats.utils.segments import period_offsets
+from volatilitystats.utils.tick_store import TickStore
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(41)
+    days = pd.to_datetime(["2024-05-06", "2024-05-07", "2024-05-09"])
+    # Include pre-open and post-close prints, which must be ignored.
+    times = np.concatenate([
+        day + pd.to_timedelta(np.sort(rng.uniform(9 * 3600, 16.5 * 3600, m)), unit="s")
+        for day, m in zip(days, [500, 40, 300])
+    ])
+    prices = 20 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    order = rng.permutation(len(times))
+    return pd.DataFrame({"time": times[order], "price": prices[order]})
+
+def _reference_calendar(ticks, interval):
+    out = []
+    for day, group in ticks.set_index("time").sort_index()["price"].groupby(lambda t: t.normalize()):
+        session = group.between_time("09:30", "16:00")
+        grid = pd.date_range(day + pd.Timedelta("09:30:00"), day + pd.Timedelta("16:00:00"), freq=interval)
+        sampled = session.reindex(session.index.union(grid)).ffill().bfill().loc[grid]
+        out.append(np.log(sampled).diff().dropna())
+    return pd.concat(out)
+
+@pytest.mark.parametrize("interval", ["1min", "5min", "15min", "7min"])
+def test_calendar_time_matches_reference(ticks, interval):
+    result = calendar_time_returns(ticks, "price", "time", interval=interval)
+    expected = _reference_calendar(ticks, interval)
+    if interval == "7min":
+        # 390 minutes is not a multiple of 7: the close adds a short final interval.
+        assert len(result) == 3 * (390 // 7 + 1)
+        assert (result.index.time[55::56] == pd.Timestamp("16:00").time()).all()
+    else:
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-12, atol=1e-15)
+        assert result.index.equals(expected.index.rename("time"))
+
+    # Each day's sampled returns add up to the log move from the first to the last in-session tick.
+    session = ticks.set_index("time").sort_index()["price"].between_time("09:30", "16:00")
+    daily = np.log(session).groupby(session.index.normalize()).agg(lambda x: x.iloc[-1] - x.iloc[0])
+    labels, offsets = period_offsets(result, "1D")
+    sums = np.add.reduceat(result.values, offsets[:-1])[np.diff(offsets) > 0]
+    np.testing.assert_allclose(sums, daily.values, atol=1e-12)
+
+def test_tick_time_every_k(ticks):
+    k = 7
+    result = tick_time_returns(ticks, "price", "time", k=k, session_start="09:30", session_end="16:00")
+    expected = []
+    session = ticks.set_index("time").sort_index()["price"].between_time("09:30", "16:00")
+    for _, group in session.groupby(session.index.normalize()):
+        keep = sorted(set(range(0, len(group), k)) | {len(group) - 1})
+        expected.append(np.log(group.iloc[keep]).diff().dropna())
+    expected = pd.concat(expected)
+    np.testing.assert_allclose(result.values, expected.values, rtol=1e-12)
+    assert result.index.equals(expected.index.rename("time"))
+    # k = 1 gives every in-session tick return.
+    assert len(tick_time_returns(ticks, "price", "time", k=1, session_start="09:30", session_end="16:00")) == len(session) - 3
+
+def test_store_handle_and_time_zone(tmp_path, ticks):
+    ordered = ticks.sort_values("time")
+    store = TickStore(tmp_path)
+    store.append("X", ordered["time"].values, ordered["price"].values)
+    pd.testing.assert_series_equal(
+        calendar_time_returns(store.slice("X"), "price", "time"),
+        calendar_time_returns(ticks, "price", "time")
+    )
+
+    local = ticks.assign(time=ticks["time"].dt.tz_localize("America/New_York"))
+    result = calendar_time_returns(local, "price", "time", interval="15min")
+    assert str(result.index.tz) == "America/New_York"
+    np.testing.assert_allclose(result.values, calendar_time_returns(ticks, "price", "time", interval="15min").values)
+
+def test_invalid_arguments(ticks):
+    with pytest.raises(ValueError):
+        calendar_time_returns(ticks, "price", "time", session_start="16:00", session_end="09:30")
+    with pytest.raises(ValueError):
+        tick_time_returns(ticks, "price", "time", k=0)
+
+def test_dst_fall_back_keeps_instant_order():
+    # The repeated 01:00 hour of 2024-11-03 in New York, shuffled.
+    times = pd.date_range("2024-11-03 00:00", "2024-11-03 04:00", freq="1min", tz="America/New_York")
+    prices = 20 * np.exp(np.cumsum(np.random.default_rng(2).normal(0, 1e-3, len(times))))
+    ticks = pd.DataFrame({"time": times, "price": prices}).sample(frac=1, random_state=1)
+
+    result = tick_time_returns(ticks, "price", "time", k=3)
+    chosen = np.r_[np.arange(0, len(times), 3), len(times) - 1]
+    chosen = np.unique(chosen)
+    np.testing.assert_allclose(result.values, np.diff(np.log(prices[chosen])), rtol=1e-12)
+    assert result.index.equals(pd.DatetimeIndex(times[chosen[1:]], name="time"))
+
+    sampled = calendar_time_returns(ticks, "price", "time", interval="30min", session_start="00:00", session_end="03:00")
+    assert sampled.index.tz is not None and sampled.index.is_monotonic_increasing
+    np.testing.assert_allclose(sampled.sum(), np.log(prices[times.get_loc(pd.Timestamp("2024-11-03 03:00", tz="America/New_York"))] / prices[0]))
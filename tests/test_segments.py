@@ -0,0 +1,147 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.bipower_variation import bipower_variation, bipower_variation_series
+from volatilitystats.estimators.jump_detection import barndorff_nielsen_shephard_jump_test, detect_jumps_series
+from volatilitystats.estimators.median_realized_volatility import median_realized_volatility, median_rv_series
+from volatilitystats.estimators.realized_kernel import realized_kernel, realized_kernel_series
+from volatilitystats.estimators.realized_volatility import realized_volatility
+from volatilitystats.estimators.two_scale_realized_volatility import two_scale_realized_volatility, tsrv_series
+from volatilitystats.utils.segments import (
+    intraday_log_returns, period_offsets, period_returns, range_sum, segment_autocovariances, segment_lag_sum, segment_median
+)
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(11)
+    days = pd.to_datetime(["2024-01-02", "2024-01-03", "2024-01-05", "2024-01-08"])
+    sizes = [300, 1, 250, 2]
+    times = np.concatenate([
+        day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, m)), unit="s")
+        for day, m in zip(days, sizes)
+    ])
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 5e-4, len(times))))
+    prices[400:] *= 1.05
+    order = rng.permutation(len(times))
+    return pd.DataFrame({"time": times[order], "price": prices[order]})
+
+def _grouped(ticks, f):
+    log_returns = intraday_log_returns(ticks, "price", "time")
+    return log_returns.groupby(pd.Grouper(freq="1D")).apply(lambda x: f(x.values))
+
+def test_segment_primitives_match_slices():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=50)
+    offsets = np.array([0, 0, 7, 8, 30, 30, 50])
+    for lag in range(4):
+        expected = [np.sum(x[s + lag:e] * x[s:e - lag]) if e - s > lag else 0.0 for s, e in zip(offsets[:-1], offsets[1:])]
+        np.testing.assert_allclose(segment_lag_sum(x, offsets, lag), expected)
+    medians = segment_median(x, offsets)
+    assert np.isnan(medians[0]) and np.isnan(medians[4])
+    np.testing.assert_allclose(medians[[1, 2, 3, 5]], [np.median(x[s:e]) for s, e in [(0, 7), (7, 8), (8, 30), (30, 50)]])
+    gamma = segment_autocovariances(x, offsets, 3)
+    np.testing.assert_allclose(gamma[:, 2], segment_lag_sum(x, offsets, 2))
+    np.testing.assert_allclose(range_sum(x, [5, 3, 10], [9, 3, 50]), [x[5:9].sum(), 0.0, x[10:].sum()])
+
+def test_period_offsets_match_grouper(ticks):
+    log_returns = intraday_log_returns(ticks, "price", "time")
+    labels, offsets = period_offsets(log_returns, "1D")
+    sizes = log_returns.groupby(pd.Grouper(freq="1D")).size()
+    assert labels.equals(sizes.index)
+    np.testing.assert_array_equal(np.diff(offsets), sizes.values)
+
+@pytest.mark.parametrize("freq", ["1D", "2D", "4h", "W", "ME"])
+@pytest.mark.parametrize("tz", [None, "America/New_York"])
+def test_period_offsets_match_resample(ticks, freq, tz):
+    log_returns = intraday_log_returns(ticks, "price", "time")
+    if tz is not None:
+        log_returns = log_returns.tz_localize(tz)
+    labels, offsets = period_offsets(log_returns, freq)
+    sizes = log_returns.resample(freq).size()
+    assert labels.equals(sizes.index) and labels.freq == sizes.index.freq
+    np.testing.assert_array_equal(np.diff(offsets), sizes.values)
+
+def test_prepared_inputs_match_frame(ticks):
+    expected = bipower_variation_series(ticks, "price", "time")
+    ordered = ticks.sort_values("time", ignore_index=True)
+    times = ordered["time"].values.astype("datetime64[ns]")
+    prepared = [
+        ordered,
+        pd.Series(np.log(ordered["price"].values), index=pd.DatetimeIndex(times)),
+        (times.view(np.int64), ordered["price"].values),
+        (times, ordered["price"].values),
+    ]
+    for data in prepared:
+        result = bipower_variation_series(data, "price", "time")
+        np.testing.assert_allclose(result.values, expected.values, rtol=1e-12)
+        assert result.index.equals(expected.index)
+    with pytest.raises(ValueError):
+        intraday_log_returns((times[:-1], ordered["price"].values), "price", "time")
+
+def _peak_bytes(f):
+    tracemalloc.start()
+    try:
+        f()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_sorted_inputs_are_not_copied():
+    n = 1_000_000
+    rng = np.random.default_rng(5)
+    times = np.int64(1_704_067_200 * 10**9) + np.cumsum(rng.integers(1, 10**9, n))
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 1e-4, n)))
+    frame = pd.DataFrame({"time": times.view("datetime64[ns]"), "price": prices})
+    log_prices = pd.Series(np.log(prices), index=pd.DatetimeIndex(times.view("datetime64[ns]")))
+
+    returns = intraday_log_returns(frame, "price", "time")
+    assert np.shares_memory(returns.index.asi8, frame["time"].array.asi8)
+    # Only the returns array itself may be allocated, not a copy of either column.
+    for data in [frame, (times, prices), log_prices]:
+        assert _peak_bytes(lambda: period_returns(data, "price", "time", "1D")) < 1.25 * 8 * n
+    shuffled = frame.iloc[rng.permutation(n)]
+    assert _peak_bytes(lambda: period_returns(shuffled, "price", "time", "1D")) > 2 * 8 * n
+
+def test_series_match_groupby_apply(ticks):
+    pd.testing.assert_series_equal(
+        bipower_variation_series(ticks, "price", "time"), _grouped(ticks, bipower_variation), check_names=False
+    )
+    with np.errstate(invalid="ignore"), pytest.warns(RuntimeWarning):
+        expected_median = _grouped(ticks, median_realized_volatility)
+    pd.testing.assert_series_equal(median_rv_series(ticks, "price", "time"), expected_median, check_names=False)
+    for kernel, bandwidth in [("bartlett", None), ("parzen", None), ("uniform", 3)]:
+        expected = _grouped(ticks, lambda x: realized_kernel(x, kernel=kernel, bandwidth=bandwidth))
+        result = realized_kernel_series(ticks, "price", "time", kernel=kernel, bandwidth=bandwidth)
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+    jumps = detect_jumps_series(ticks, "price", "time", threshold=3.0)
+    pd.testing.assert_series_equal(
+        jumps, _grouped(ticks, lambda x: barndorff_nielsen_shephard_jump_test(x, threshold=3.0)).astype(bool), check_names=False
+    )
+
+def test_tsrv_series_short_periods_are_nan(ticks):
+    result = tsrv_series(ticks, "price", "time", K=3)
+    counts = intraday_log_returns(ticks, "price", "time").resample("1D").size()
+    assert result[counts < 3].isna().all()
+    expected = _grouped(ticks, lambda x: two_scale_realized_volatility(x, K=3) if len(x) >= 3 else np.nan)
+    pd.testing.assert_series_equal(result, expected, check_names=False)
+
+def test_realized_volatility_matches_date_groupby():
+    rng = np.random.default_rng(3)
+    index = pd.date_range("2024-01-01", periods=2000, freq="37min")
+    df = pd.DataFrame({"returns": rng.normal(0, 1e-3, len(index))}, index=index).sample(frac=1, random_state=1)
+    df.iloc[5, 0] = np.nan
+    df = pd.concat([df, pd.DataFrame({"returns": [0.5]}, index=pd.DatetimeIndex([pd.NaT]))])
+    expected = np.sqrt(df.assign(date=df.index.date).groupby("date")["returns"].apply(lambda x: (x**2).sum()))
+    expected = (expected.rolling(3).mean() * np.sqrt(252)).rename("RealizedVolatility")
+    pd.testing.assert_series_equal(realized_volatility(df, window=3), expected)
+
+@pytest.mark.parametrize("freq", ["1D", "2D", "6h", "20min"])
+def test_period_offsets_across_dst(freq):
+    # Round-the-clock ticks near midnight over the March 2024 New York DST change.
+    times = pd.date_range("2024-03-08", "2024-03-14", freq="20min", tz="America/New_York", inclusive="left")
+    log_returns = pd.Series(np.zeros(len(times)), index=times.rename("time"))
+    labels, offsets = period_offsets(log_returns, freq)
+    sizes = log_returns.resample(freq).size()
+    assert labels.equals(sizes.index)
+    np.testing.assert_array_equal(np.diff(offsets), sizes.values)
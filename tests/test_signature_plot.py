@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.realized_kernel import realized_kernel
+from volatilitystats.estimators.signature_plot import volatility_signature, volatility_signatures
+from volatilitystats.utils.sampling import calendar_time_returns
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(42)
+    days = pd.to_datetime(["2024-02-05", "2024-02-06", "2024-02-08"])
+    times = np.concatenate([
+        day + pd.to_timedelta(np.sort(rng.uniform(9.4 * 3600, 16.1 * 3600, 3000)), unit="s")
+        for day in days
+    ])
+    efficient = np.cumsum(rng.normal(0, 3e-4, len(times)))
+    # i.i.d. microstructure noise inflates RV at the highest frequencies.
+    prices = 100 * np.exp(efficient + rng.normal(0, 5e-4, len(times)))
+    return pd.DataFrame({"time": times, "price": prices})
+
+def _daily(returns: pd.Series, f) -> np.ndarray:
+    return returns.groupby(returns.index.normalize()).apply(lambda x: f(x.values)).values
+
+def test_rv_and_rk_match_sampled_returns(ticks):
+    intervals = ["10s", "1min", "7min", "30min"]
+    result = volatility_signatures(ticks, "price", "time", intervals=intervals, measures=["rv", "rk"])
+    assert list(result) == ["rv", "rk"]
+    assert result["rv"].shape == (4, 3)
+    assert list(result["rv"].index) == [pd.Timedelta(i) for i in intervals]
+    for interval in intervals:
+        sampled = calendar_time_returns(ticks, "price", "time", interval=interval)
+        np.testing.assert_allclose(result["rv"].loc[pd.Timedelta(interval)].values, _daily(sampled, lambda r: r @ r), rtol=1e-12)
+        np.testing.assert_allclose(result["rk"].loc[pd.Timedelta(interval)].values, _daily(sampled, realized_kernel), rtol=1e-10)
+
+def test_subgrids_average_shifted_grids(ticks):
+    subgrids = 3
+    rv = volatility_signature(ticks, "price", "time", intervals=["3min"], subgrids=subgrids)
+    session = ticks.set_index("time")["price"].sort_index().between_time("09:30", "16:00")
+    expected = []
+    for day, prices in session.groupby(session.index.normalize()):
+        open_, close = day + pd.Timedelta(hours=9.5), day + pd.Timedelta(hours=16)
+        values = []
+        for j in range(subgrids):
+            grid = pd.DatetimeIndex(sorted({open_, close} | set(pd.date_range(open_ + j * pd.Timedelta("1min"), close, freq="3min"))))
+            sampled = prices.reindex(prices.index.union(grid)).ffill().bfill().loc[grid]
+            values.append(np.sum(np.diff(np.log(sampled.values)) ** 2))
+        expected.append(np.mean(values))
+    np.testing.assert_allclose(rv.iloc[0].values, expected, rtol=1e-12)
+
+def test_signature_shape_and_tsrv(ticks):
+    result = volatility_signatures(ticks, "price", "time", measures=["rv", "tsrv"], subgrids=5)
+    signature = result["rv"].mean(axis=1)
+    # Noise makes the RV signature decrease with the sampling interval.
+    assert signature.iloc[0] > 3 * signature.iloc[-1]
+    # TSRV removes most of the noise bias at fine intervals.
+    tsrv = result["tsrv"].mean(axis=1)
+    assert abs(tsrv.loc[pd.Timedelta("1min")] / signature.loc[pd.Timedelta("30min")] - 1) < 0.5
+    assert abs(tsrv.iloc[0] - signature.iloc[-1]) < abs(signature.iloc[0] - signature.iloc[-1])
+
+def test_invalid_arguments(ticks):
+    with pytest.raises(ValueError):
+        volatility_signatures(ticks, "price", "time", measures=["bv"])
+    with pytest.raises(ValueError):
+        volatility_signature(ticks, "price", "time", subgrids=0)
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+from math import gamma
+from volatilitystats.estimators.bipower_variation import bipower_variation_series
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.estimators.streaming import RealizedAccumulator
+
+@pytest.fixture
+def stream():
+    rng = np.random.default_rng(44)
+    days = pd.bdate_range("2024-06-03", periods=3)
+    times = np.concatenate([
+        day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, 500)), unit="s")
+        for day in days
+    ])
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(times))))
+    prices[800] *= 1.01
+    return pd.DatetimeIndex(times), prices
+
+def _direct(prices):
+    r = np.diff(np.log(prices))
+    a = np.abs(r)
+    n = len(r)
+    mu1 = np.sqrt(2 / np.pi)
+    mu43 = 2 ** (2 / 3) * gamma(7 / 6) / np.sqrt(np.pi)
+    return {
+        "n": n,
+        "rv": np.sum(r**2),
+        "bv": mu1**-2 * np.sum(a[1:] * a[:-1]),
+        "tq": n * mu43**-3 * n / (n - 2) * np.sum((a[2:] * a[1:-1] * a[:-2]) ** (4 / 3)),
+        "qq": n * mu1**-4 * n / (n - 3) * np.sum(a[3:] * a[2:-1] * a[1:-2] * a[:-3]),
+        "rs_pos": np.sum(r[r > 0] ** 2),
+        "rs_neg": np.sum(r[r < 0] ** 2),
+    }
+
+def test_tick_by_tick_matches_batch(stream):
+    times, prices = stream
+    day = times.normalize() == times[0].normalize()
+    single = RealizedAccumulator()
+    for t, p in zip(times[day], prices[day]):
+        single.update(p, t)
+    batch = RealizedAccumulator().update(prices[day], times[day])
+    expected = _direct(prices[day])
+    for key, value in expected.items():
+        assert single.values[key] == pytest.approx(value, rel=1e-10)
+        assert batch.values[key] == pytest.approx(value, rel=1e-10)
+    assert np.isfinite(single.values["jump_statistic"])
+
+def test_rollover_matches_series_estimators(stream):
+    times, prices = stream
+    acc = RealizedAccumulator()
+    for lo in range(0, len(times), 137):
+        acc.update(prices[lo:lo + 137], times[lo:lo + 137])
+    df = pd.DataFrame({"time": times, "price": prices})
+    frame = acc.to_frame()
+    np.testing.assert_allclose(frame["bv"], bipower_variation_series(df, "price", "time"), rtol=1e-10)
+    np.testing.assert_allclose(frame["rv"], realized_measures(df, "price", "time", measures=["rv"])["rv"], rtol=1e-10)
+    assert acc.session == times[-1].normalize()
+
+    completed = acc.pop_completed()
+    assert len(completed) == 2 and len(acc.to_frame()) == 1
+
+def test_merge_of_parallel_slices_equals_one_pass(stream):
+    times, prices = stream
+    whole = RealizedAccumulator().update(prices, times)
+    cuts = [0, 1, 4, 499, 500, 501, 900, len(times)]
+    parts = [RealizedAccumulator().update(prices[a:b], times[a:b]) for a, b in zip(cuts[:-1], cuts[1:])]
+    merged = parts[0]
+    for part in parts[1:]:
+        merged = merged.merge(part)
+    pd.testing.assert_frame_equal(merged.to_frame(), whole.to_frame(), rtol=1e-10)
+
+    with pytest.raises(ValueError):
+        parts[-1].merge(parts[0])
+
+def test_without_overnight_returns(stream):
+    times, prices = stream
+    acc = RealizedAccumulator(include_overnight=False).update(prices, times)
+    second = (times.normalize() == times[-1].normalize())
+    assert acc.values["rv"] == pytest.approx(_direct(prices[second])["rv"])
+    with pytest.raises(ValueError):
+        acc.update(prices[0], times[0])
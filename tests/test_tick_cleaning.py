@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.tick_cleaning import clean_ticks, rolling_mad_outliers
+
+@pytest.fixture
+def raw():
+    rng = np.random.default_rng(49)
+    day = pd.Timestamp("2024-06-03")
+    seconds = np.sort(rng.choice(np.arange(9 * 3600, 17 * 3600), 3000, replace=False))
+    prices = np.round(50 * np.exp(np.cumsum(rng.normal(0, 2e-4, len(seconds)))), 2)
+    return pd.DataFrame({"time": day + pd.to_timedelta(seconds, unit="s"), "price": prices})
+
+def _brute_force(x, offsets, window, threshold):
+    moves = np.concatenate([np.abs(np.diff(x[a:b])) for a, b in zip(offsets[:-1], offsets[1:])])
+    floor = np.median(moves[moves > 0])
+    flags = np.zeros(len(x), dtype=bool)
+    for a, b in zip(offsets[:-1], offsets[1:]):
+        for t in range(a, b):
+            start = min(max(t - window // 2, a), max(b - window - 1, a))
+            neighbors = np.delete(x[start:min(start + window + 1, b)], t - start)
+            if len(neighbors) < 2:
+                continue
+            median = np.median(neighbors)
+            mad = np.median(np.abs(neighbors - median))
+            flags[t] = abs(x[t] - median) > threshold * max(mad, floor)
+    return flags
+
+def test_rolling_mad_matches_brute_force():
+    rng = np.random.default_rng(0)
+    x = np.cumsum(rng.standard_t(2, 700)) * 0.01
+    offsets = np.array([0, 2, 3, 40, 400, 700])
+    for window, threshold in [(10, 3.0), (50, 5.0), (51, 2.0)]:
+        np.testing.assert_array_equal(rolling_mad_outliers(x, offsets, window, threshold), _brute_force(x, offsets, window, threshold))
+
+def test_clean_ticks_reports_every_removal(raw):
+    df = raw
+    spikes = [500, 1500, 2500]
+    df.loc[spikes, "price"] *= [1.08, 0.9, 1.05]
+    df.loc[[1200, 1300], "price"] = [0.0, -1.0]
+    df.loc[1400, "price"] = np.nan
+    # Two extra prints at the timestamp of row 1000.
+    extra = pd.DataFrame({"time": [df.loc[1000, "time"]] * 2, "price": df.loc[1000, "price"] + np.array([0.02, 0.04])})
+    data = pd.concat([df, extra]).sample(frac=1, random_state=2)
+
+    cleaned, removed = clean_ticks(data, "price", "time", session_start="09:30", session_end="16:00")
+    counts = removed["reason"].value_counts()
+    assert counts["non_positive"] == 3
+    assert counts["duplicate"] == 2
+    assert set(removed.loc[removed["reason"] == "outlier", "time"]) == set(df.loc[spikes, "time"])
+    outside = (df["time"].dt.time < pd.Timestamp("09:30").time()) | (df["time"].dt.time > pd.Timestamp("16:00").time())
+    assert counts["out_of_session"] == outside.sum()
+    assert len(cleaned) + len(removed) == len(data)
+
+    assert cleaned["time"].is_monotonic_increasing and cleaned["time"].is_unique
+    collapsed = cleaned.loc[cleaned["time"] == df.loc[1000, "time"], "price"].item()
+    assert collapsed == pytest.approx(df.loc[1000, "price"] + 0.02)
+    last, _ = clean_ticks(data, "price", "time", duplicates="last", window=0)
+    assert last["time"].is_unique
+    tied = data[data["time"] == df.loc[1000, "time"]]
+    assert last.loc[last["time"] == df.loc[1000, "time"], "price"].item() == tied["price"].iloc[-1]
+
+def test_clean_random_walk_keeps_everything(raw):
+    df = raw
+    cleaned, removed = clean_ticks(df, "price", "time")
+    assert removed.empty
+    pd.testing.assert_frame_equal(cleaned, df)
+
+def test_dst_fall_back_hour_is_not_duplicated():
+    # 301 distinct New York instants, 60 of them in the repeated 01:00 hour.
+    times = pd.date_range("2024-11-03 00:00", "2024-11-03 04:00", freq="1min", tz="America/New_York")
+    assert len(times) == 301
+    prices = 20 + 0.01 * np.arange(len(times))
+    df = pd.DataFrame({"time": times, "price": prices}).sample(frac=1, random_state=0)
+    cleaned, removed = clean_ticks(df, "price", "time", window=0)
+    assert removed.empty
+    assert cleaned["time"].equals(pd.Series(times, name="time"))
+    np.testing.assert_array_equal(cleaned["price"].values, prices)
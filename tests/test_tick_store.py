@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+from volatilitystats.estimators.bipower_variation import bipower_variation_series
+from volatilitystats.estimators.out_of_core import chunked_realized_measures
+from volatilitystats.estimators.realized_measures import realized_measures
+from volatilitystats.utils.tick_store import TickStore, import_csv, main
+
+@pytest.fixture
+def ticks():
+    rng = np.random.default_rng(40)
+    days = pd.to_datetime(["2024-03-04", "2024-03-05", "2024-03-07", "2024-03-08"])
+    frames = []
+    for symbol in ["AAA", "BBB"]:
+        times = np.concatenate([
+            day + pd.Timedelta(hours=9, minutes=30) + pd.to_timedelta(np.sort(rng.uniform(0, 23400, 200)), unit="s")
+            for day in days
+        ])
+        prices = 50 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(times))))
+        frames.append(pd.DataFrame({"time": times, "price": prices, "symbol": symbol}))
+    return pd.concat(frames).sort_values("time", kind="stable").reset_index(drop=True)
+
+def test_import_csv_builds_day_index(tmp_path, ticks):
+    path = tmp_path / "ticks.csv"
+    ticks.to_csv(path, index=False)
+    store = import_csv(path, tmp_path / "store", symbol_column="symbol", chunksize=150)
+    assert store.symbols == ["AAA", "BBB"]
+    assert list(store.days("AAA")) == list(pd.to_datetime(["2024-03-04", "2024-03-05", "2024-03-07", "2024-03-08"]))
+
+    aaa = ticks[ticks["symbol"] == "AAA"]
+    times, prices = store.read("AAA", "2024-03-05", "2024-03-07")
+    expected = aaa[(aaa["time"] >= "2024-03-05") & (aaa["time"] < "2024-03-08")]
+    np.testing.assert_array_equal(times, expected["time"].values)
+    np.testing.assert_allclose(prices, expected["price"].values, rtol=1e-15)
+    # Day slices are views on the memory map, not copies.
+    assert isinstance(prices.base, np.memmap) or isinstance(prices, np.memmap)
+
+    # Reopening the directory sees the same data.
+    assert len(TickStore(tmp_path / "store").slice("BBB")) == (ticks["symbol"] == "BBB").sum()
+
+def test_estimators_accept_store_handle(tmp_path, ticks):
+    store = TickStore(tmp_path)
+    aaa = ticks[ticks["symbol"] == "AAA"]
+    store.append("AAA", aaa["time"].values, aaa["price"].values)
+    handle = store.slice("AAA", "2024-03-05", "2024-03-08")
+    subset = aaa[aaa["time"] >= "2024-03-05"]
+
+    pd.testing.assert_series_equal(
+        bipower_variation_series(handle, "price", "time"),
+        bipower_variation_series(subset, "price", "time"),
+        check_freq=False
+    )
+    expected = realized_measures(subset, "price", "time", measures=["rv", "bv"])
+    pd.testing.assert_frame_equal(realized_measures(handle, "price", "time", measures=["rv", "bv"]), expected, check_freq=False)
+    chunked = chunked_realized_measures(handle, measures=["rv", "bv"], chunksize=64)
+    np.testing.assert_allclose(chunked.values, expected.values, rtol=1e-12)
+
+def test_append_continues_open_day_and_rejects_disorder(tmp_path, ticks):
+    store = TickStore(tmp_path)
+    aaa = ticks[ticks["symbol"] == "AAA"]
+    store.append("AAA", aaa["time"].values[:100], aaa["price"].values[:100])
+    store.append("AAA", aaa["time"].values[100:], aaa["price"].values[100:])
+    assert len(store.days("AAA")) == 4
+    assert len(store.slice("AAA", "2024-03-04", "2024-03-04")) == 200
+    assert len(store.slice("AAA", "2024-03-06", "2024-03-06")) == 0
+    with pytest.raises(ValueError):
+        store.append("AAA", aaa["time"].values[:1], aaa["price"].values[:1])
+    with pytest.raises(KeyError):
+        store.slice("ZZZ")
+
+def test_command_line_import(tmp_path, ticks, capsys):
+    path = tmp_path / "ticks.csv"
+    ticks[ticks["symbol"] == "BBB"].to_csv(path, index=False)
+    main([str(path), str(tmp_path / "store"), "--symbol", "BBB"])
+    assert "BBB: 800 ticks over 4 days" in capsys.readouterr().out
+
+def test_tz_aware_ticks_keep_local_days(tmp_path):
+    rng = np.random.default_rng(41)
+    # 15:00-23:00 in New York crosses midnight UTC every evening.
+    times = pd.DatetimeIndex(np.concatenate([
+        (day + pd.Timedelta(hours=15) + pd.to_timedelta(np.sort(rng.uniform(0, 8 * 3600, 150)), unit="s")).values
+        for day in pd.to_datetime(["2024-03-08", "2024-03-11", "2024-03-12"])
+    ])).tz_localize("America/New_York")
+    frame = pd.DataFrame({"time": times, "price": 30 * np.exp(np.cumsum(rng.normal(0, 4e-4, len(times))))})
+    store = TickStore(tmp_path)
+    store.append("NY", frame["time"][:200], frame["price"].values[:200])
+    store.append("NY", frame["time"][200:], frame["price"].values[200:])
+
+    reopened = TickStore(tmp_path)
+    assert list(reopened.days("NY")) == list(pd.to_datetime(["2024-03-08", "2024-03-11", "2024-03-12"]))
+    handle = reopened.slice("NY", "2024-03-11", "2024-03-11")
+    assert len(handle) == 150 and str(handle.tz) == "America/New_York"
+    pd.testing.assert_index_equal(handle.times, pd.DatetimeIndex(times[150:300]))
+    assert np.shares_memory(handle.times.asi8, handle.instants)
+    pd.testing.assert_frame_equal(handle.to_frame(), frame.iloc[150:300].reset_index(drop=True))
+
+    expected = realized_measures(frame, "price", "time", measures=["rv", "bv"])
+    pd.testing.assert_frame_equal(realized_measures(reopened.slice("NY"), "price", "time", measures=["rv", "bv"]), expected, check_freq=False)
+
+    with pytest.raises(ValueError):
+        store.append("NY", frame["time"].dt.tz_localize(None)[-1:], frame["price"].values[-1:])
+    with pytest.raises(ValueError):
+        store.append("NY", frame["time"].dt.tz_convert("Europe/London")[-1:], frame["price"].values[-1:])
+
+def test_import_csv_keeps_utc_offset(tmp_path):
+    times = pd.date_range("2024-05-07 08:00", periods=6, freq="4h", tz="Asia/Tokyo")
+    path = tmp_path / "ticks.csv"
+    pd.DataFrame({"time": times, "price": np.arange(1.0, 7.0)}).to_csv(path, index=False)
+    store = import_csv(path, tmp_path / "store", symbol="TKY")
+    assert list(store.days("TKY")) == list(pd.to_datetime(["2024-05-07", "2024-05-08"]))
+    assert (store.slice("TKY").times == times).all() and len(store.slice("TKY", "2024-05-08")) == 2
@@ -9,6 +9,19 @@ from .realized_volatility import realized_volatility
 from .two_scale_realized_volatility import two_scale_realized_volatility
 from .median_realized_volatility import median_realized_volatility
 from .bipower_variation import bipower_variation
+from .realized_measures import realized_measures
+from .multi_scale_realized_volatility import multi_scale_realized_volatility
+from .neighbor_truncation import min_realized_variance, median_realized_variance
+from .jump_detection import lee_mykland_jumps
+from .streaming import RealizedAccumulator
+from .out_of_core import iter_realized_measures, chunked_realized_measures
+from .signature_plot import volatility_signatures
+from .hayashi_yoshida import hayashi_yoshida_covariance, hayashi_yoshida_series
+from .realized_covariance import realized_covariance_series
+from .pre_averaging import pre_averaged_realized_variance, pre_averaged_bipower_variation
+from .realized_statistics import realized_statistics, rollup_statistics, measures_from_statistics
+from .tick_cleaning import clean_ticks
+from .intraday_periodicity import intraday_periodicity, intraday_return_matrix, periodicity_profile
 
 __all__ = [
     "standard_volatility",
@@ -22,4 +35,25 @@ __all__ = [
     "two_scale_realized_volatility",
     "median_realized_volatility",
     "bipower_variation",
+    "realized_measures",
+    "multi_scale_realized_volatility",
+    "min_realized_variance",
+    "median_realized_variance",
+    "lee_mykland_jumps",
+    "RealizedAccumulator",
+    "iter_realized_measures",
+    "chunked_realized_measures",
+    "volatility_signatures",
+    "hayashi_yoshida_covariance",
+    "hayashi_yoshida_series",
+    "realized_covariance_series",
+    "pre_averaged_realized_variance",
+    "pre_averaged_bipower_variation",
+    "realized_statistics",
+    "rollup_statistics",
+    "measures_from_statistics",
+    "clean_ticks",
+    "intraday_periodicity",
+    "intraday_return_matrix",
+    "periodicity_profile",
 ]
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns, segment_lag_sum
 
 def bipower_variation(
     returns: Union[np.ndarray, pd.Series]
@@ -33,40 +35,37 @@ def bipower_variation(
     return mu1**-2 * np.sum(prod)
 
 def bipower_variation_series(
-    df: pd.DataFrame,
+    df: IntradayData,
     price_column: str,
     time_column: str,
-    freq: str = "1D"
+    freq: str = "1D",
+    grid: Optional[IntradayGrid] = None
 ) -> pd.Series:
     """
     Compute bipower variation by time group.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame containing timestamps and price data.
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
     price_column : str
         Column name for price.
     time_column : str
         Column name for timestamp.
     freq : str, optional
         Resampling frequency, e.g., '1D' for daily, by default "1D".
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
 
     Returns
     -------
     pd.Series
         Time series of bipower variation.
     """
-    df = df.copy()
-    df[time_column] = pd.to_datetime(df[time_column])
-    df.set_index(time_column, inplace=True)
-    df.sort_index(inplace=True)
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
 
-    log_price = np.log(df[price_column])
-    log_returns = log_price.diff().dropna()
-
-    result = log_returns.groupby(pd.Grouper(freq=freq)).apply(
-        lambda x: bipower_variation(x.values)
-    )
-    result.name = "Bipower Variation"
-    return result
+    abs_r = np.abs(returns)
+    mu1 = np.sqrt(2 / np.pi)
+    return pd.Series(mu1**-2 * segment_lag_sum(abs_r, offsets, 1), index=labels, name="Bipower Variation")
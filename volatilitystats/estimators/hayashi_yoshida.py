@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations
+from typing import Dict, Mapping, Optional, Tuple, Union
+from volatilitystats.utils.sampling import _local_index, _sorted_ticks
+from volatilitystats.utils.segments import period_offsets, range_sum
+from volatilitystats.utils.tick_store import TickSlice
+
+TickData = Union[pd.DataFrame, TickSlice]
+
+def _overlap_sums(
+    tx: np.ndarray,
+    ty: np.ndarray,
+    cumulative_y: np.ndarray,
+    lo_y: Optional[np.ndarray] = None,
+    hi_y: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    For every x return (tx[i], tx[i + 1]], the sum of the y returns whose
+    intervals (ty[k], ty[k + 1]] overlap it.
+
+    With both tick arrays sorted, the overlapping y returns form a contiguous
+    run of k, located by merging the two timestamp arrays; their sum is a
+    difference of the prefix sums in `cumulative_y`. `lo_y` / `hi_y`
+    optionally restrict k per x return.
+    """
+    m = len(ty) - 1
+    right = np.searchsorted(ty, tx, side="right")
+    # Left insertion points differ only where a timestamp occurs in both arrays.
+    left = right.copy()
+    tied = np.flatnonzero((right > 0) & (ty[np.maximum(right - 1, 0)] == tx))
+    left[tied] = np.searchsorted(ty, tx[tied], side="left")
+
+    first = np.maximum(right[:-1] - 1, 0)  # first k with ty[k + 1] > tx[i]
+    last = np.minimum(left[1:], m)         # one past the last k with ty[k] < tx[i + 1]
+    if lo_y is not None:
+        first = np.maximum(first, lo_y)
+        last = np.minimum(last, hi_y)
+    last = np.maximum(last, first)
+    return cumulative_y[last] - cumulative_y[first]
+
+def hayashi_yoshida_covariance(x: pd.Series, y: pd.Series) -> float:
+    """
+    Hayashi-Yoshida covariance of two asynchronously observed price series.
+
+    Sums r_x(i) * r_y(j) over every pair of tick returns whose time intervals
+    overlap, so no observation is discarded by synchronizing to a grid.
+
+    Parameters
+    ----------
+    x : pd.Series
+        Prices of the first asset, indexed by timestamp.
+    y : pd.Series
+        Prices of the second asset, indexed by timestamp.
+
+    Returns
+    -------
+    float
+        Realized covariance over the whole sample.
+    """
+    tx, px, _ = _sorted_ticks(pd.DataFrame({"t": x.index, "p": x.values}), "p", "t")
+    ty, py, _ = _sorted_ticks(pd.DataFrame({"t": y.index, "p": y.values}), "p", "t")
+    if len(tx) < 2 or len(ty) < 2:
+        return 0.0
+    rx, ry = np.diff(np.log(px)), np.diff(np.log(py))
+    cumulative = np.concatenate(([0.0], np.cumsum(ry)))
+    sums = _overlap_sums(tx, ty, cumulative)
+    return float(np.dot(rx, sums))
+
+def project_psd(matrices: np.ndarray, floor: float = 0.0) -> np.ndarray:
+    """
+    Nearest positive semidefinite matrices in Frobenius norm.
+
+    Negative eigenvalues are raised to `floor`. A stack of matrices of shape
+    (..., N, N) is handled in one batched eigendecomposition.
+
+    Parameters
+    ----------
+    matrices : np.ndarray
+        Symmetric matrix or stack of symmetric matrices.
+    floor : float
+        Smallest eigenvalue kept.
+
+    Returns
+    -------
+    np.ndarray
+        Projected matrices, same shape as the input.
+    """
+    matrices = np.asarray(matrices, dtype=float)
+    symmetric = 0.5 * (matrices + np.swapaxes(matrices, -1, -2))
+    values, vectors = np.linalg.eigh(symmetric)
+    if np.all(values >= floor):
+        return symmetric
+    values = np.maximum(values, floor)
+    return (vectors * values[..., None, :]) @ np.swapaxes(vectors, -1, -2)
+
+def _asset_ticks(
+    data: Union[pd.DataFrame, Mapping[str, TickData]],
+    price_column: str,
+    time_column: str,
+    asset_column: Optional[str]
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, object]]:
+    """Sorted nanosecond times, prices and time zone per asset."""
+    if isinstance(data, Mapping):
+        items = data.items()
+    else:
+        if asset_column is None:
+            raise ValueError("asset_column is required for a long-format DataFrame.")
+        items = data.groupby(asset_column, sort=True)
+    return {str(asset): _sorted_ticks(frame, price_column, time_column) for asset, frame in items}
+
+def hayashi_yoshida_series(
+    data: Union[pd.DataFrame, Mapping[str, TickData]],
+    price_column: str,
+    time_column: str,
+    asset_column: Optional[str] = None,
+    freq: str = "1D",
+    psd: bool = True,
+    n_jobs: int = 1
+) -> pd.DataFrame:
+    """
+    Hayashi-Yoshida realized covariance matrix for every period.
+
+    Each asset's tick returns are assigned to the period of their closing
+    tick, as in the univariate `*_series` estimators, so the diagonal equals
+    the realized variance series. Off-diagonal terms pair returns of the same
+    period whose intervals overlap, for all periods of an asset pair at once.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Mapping[str, pd.DataFrame or TickSlice]
+        Long-format ticks with an asset column, or one tick set per asset.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    asset_column : str, optional
+        Column holding the asset of each row (long format only).
+    freq : str
+        Period length, e.g., '1D'.
+    psd : bool
+        If True, project every matrix onto the positive semidefinite cone;
+        raw HY matrices need not be PSD.
+    n_jobs : int
+        Number of threads over asset pairs.
+
+    Returns
+    -------
+    pd.DataFrame
+        Stacked N x N matrices: rows indexed by (period, asset), columns by asset.
+    """
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer.")
+    ticks = _asset_ticks(data, price_column, time_column, asset_column)
+    ticks = {asset: value for asset, value in ticks.items() if len(value[0]) > 1}
+    if not ticks:
+        raise ValueError("At least one asset with two or more ticks is required.")
+    assets = list(ticks)
+    tz = next(iter(ticks.values()))[2]
+
+    def ends_index(times: np.ndarray) -> pd.DatetimeIndex:
+        return _local_index(times, tz)
+
+    # Common period labels, then each asset's returns split on them.
+    first = min(t[1] for t, _, _ in ticks.values())
+    last = max(t[-1] for t, _, _ in ticks.values())
+    labels, _ = period_offsets(pd.Series(0.0, index=ends_index(np.array([first, last]))), freq)
+
+    legs = {}
+    for asset, (times, prices, _) in ticks.items():
+        returns = np.diff(np.log(prices))
+        counts = pd.Series(returns, index=ends_index(times[1:])).resample(freq).size().reindex(labels, fill_value=0)
+        offsets = np.concatenate(([0], np.cumsum(counts.values))).astype(np.int64)
+        counts = np.diff(offsets)
+        cumulative = np.concatenate(([0.0], np.cumsum(returns)))
+        legs[asset] = (times, returns, offsets, counts, cumulative)
+
+    n_periods, n_assets = len(labels), len(assets)
+    cov = np.zeros((n_periods, n_assets, n_assets))
+
+    def pair(ij: Tuple[int, int]) -> Tuple[int, int, np.ndarray]:
+        i, j = ij
+        tx, rx, offsets_x, counts_x, _ = legs[assets[i]]
+        if i == j:
+            return i, j, range_sum(rx * rx, offsets_x[:-1], offsets_x[1:])
+        ty, _, offsets_y, _, cumulative_y = legs[assets[j]]
+        # Only y returns of the same period count: their range for each x return.
+        lo_y = np.repeat(offsets_y[:-1], counts_x)
+        hi_y = np.repeat(offsets_y[1:], counts_x)
+        sums = _overlap_sums(tx, ty, cumulative_y, lo_y, hi_y)
+        return i, j, range_sum(rx * sums, offsets_x[:-1], offsets_x[1:])
+
+    tasks = [(i, i) for i in range(n_assets)] + list(combinations(range(n_assets), 2))
+    if n_jobs == 1:
+        results = map(pair, tasks)
+    else:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            results = list(pool.map(pair, tasks))
+    for i, j, values in results:
+        cov[:, i, j] = cov[:, j, i] = values
+
+    if psd:
+        cov = project_psd(cov)
+    index = pd.MultiIndex.from_product([labels, assets], names=[time_column, "asset"])
+    return pd.DataFrame(cov.reshape(n_periods * n_assets, n_assets), index=index, columns=pd.Index(assets, name="asset"))
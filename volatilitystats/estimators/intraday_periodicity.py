@@ -0,0 +1,209 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+from volatilitystats.utils.sampling import _NS_PER_DAY
+
+PERIODICITY_METHODS = ("sd", "mad", "shorth", "wsd", "fff")
+
+# Consistency factors of the robust scale estimators under normality.
+_MAD_FACTOR = 1.486
+_SHORTH_FACTOR = 0.741
+_WSD_FACTOR = 1.081
+# 99% quantile of the chi-squared(1) distribution, the WSD rejection cut-off.
+_WSD_CUTOFF = 6.635
+
+def _day_and_bin(index: pd.DatetimeIndex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Session day and time of day of returns labelled by the end of their interval.
+
+    A return ending at midnight belongs to the day that closes with it, so
+    times of day lie in (0, 24h].
+    """
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    wall = index.as_unit("ns").asi8
+    day = (wall - 1) // _NS_PER_DAY
+    return day, wall - day * _NS_PER_DAY
+
+def _return_matrix(returns: pd.Series) -> Tuple[pd.DatetimeIndex, pd.TimedeltaIndex, np.ndarray, np.ndarray]:
+    """Days, bins, the day x bin matrix and the bin of every return."""
+    if not isinstance(returns.index, pd.DatetimeIndex):
+        raise ValueError("returns must have a DatetimeIndex.")
+    day, time_of_day = _day_and_bin(returns.index)
+    day_values, day_codes = np.unique(day, return_inverse=True)
+    bin_values, bin_codes = np.unique(time_of_day, return_inverse=True)
+    days = pd.DatetimeIndex((day_values * _NS_PER_DAY).view("datetime64[ns]"), name=returns.index.name)
+    if returns.index.tz is not None:
+        days = days.tz_localize(returns.index.tz)
+    bins = pd.TimedeltaIndex(bin_values.view("timedelta64[ns]"), name="time_of_day")
+
+    values = returns.to_numpy(dtype=float)
+    shape = (len(days), len(bins))
+    regular = len(values) == shape[0] * shape[1] and np.all(np.diff(day_codes) >= 0)
+    if regular and np.array_equal(bin_codes.reshape(shape), np.broadcast_to(np.arange(shape[1]), shape)):
+        return days, bins, values.reshape(shape), bin_codes
+    matrix = np.full(shape, np.nan)
+    matrix[day_codes, bin_codes] = values
+    return days, bins, matrix, bin_codes
+
+def intraday_return_matrix(returns: pd.Series) -> Tuple[pd.DatetimeIndex, pd.TimedeltaIndex, np.ndarray]:
+    """
+    Arrange regularly sampled intraday returns into a day x bin matrix.
+
+    When every day has the same bins in the same order, as the output of
+    `calendar_time_returns` does, the matrix is a reshaped view of the
+    Series' values and nothing is copied. Otherwise returns are scattered
+    into a NaN-filled matrix, with NaN marking the bins a day lacks.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Log returns indexed by the end of their sampling interval.
+
+    Returns
+    -------
+    Tuple[pd.DatetimeIndex, pd.TimedeltaIndex, np.ndarray]
+        Days, bin end times of day and the (days, bins) return matrix.
+    """
+    days, bins, matrix, _ = _return_matrix(returns)
+    return days, bins, matrix
+
+def _normalized(scale: np.ndarray) -> np.ndarray:
+    """Rescale a periodicity estimate so that its squares average to one."""
+    return scale / np.sqrt(np.nanmean(scale**2))
+
+def _standardized(matrix: np.ndarray) -> np.ndarray:
+    """
+    Returns divided by their day's bipower volatility per interval.
+
+    sigma_t^2 = (pi / 2) * mean_i |r_{t,i}||r_{t,i-1}|, over the adjacent
+    pairs available that day; days without a positive value are NaN.
+    """
+    products = np.abs(matrix[:, 1:] * matrix[:, :-1])
+    count = np.sum(~np.isnan(products), axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        variance = (np.pi / 2) * np.nansum(products, axis=1) / count
+        scale = np.where(variance > 0, np.sqrt(variance), np.nan)
+    return matrix / scale[:, None]
+
+def _shortest_half(values: np.ndarray) -> np.ndarray:
+    """
+    Shortest-half scale of every column, ignoring NaN.
+
+    0.741 times the width of the shortest window holding h = n // 2 + 1 of
+    the column's n sorted values.
+    """
+    ordered = np.sort(values, axis=0)
+    n = np.sum(~np.isnan(values), axis=0)
+    h = n // 2 + 1
+    start = np.arange(len(values))[:, None]
+    end = np.minimum(start + h - 1, len(values) - 1)
+    widths = np.take_along_axis(ordered, end, axis=0) - ordered
+    widths[start > n - h] = np.inf
+    return np.where(n > 0, _SHORTH_FACTOR * widths.min(axis=0, initial=np.inf), np.nan)
+
+def _flexible_fourier(standardized: np.ndarray, order: int) -> np.ndarray:
+    """
+    exp of a fitted log |r| profile in a quadratic trend and `order` Fourier pairs.
+
+    The regressors depend on the bin only, so the least squares fit over all
+    returns reduces to a count-weighted fit of the per-bin means of log |r|.
+    """
+    n_bins = standardized.shape[1]
+    if 2 * order + 3 > n_bins:
+        raise ValueError(f"order {order} needs at least {2 * order + 3} intraday bins; got {n_bins}.")
+    with np.errstate(divide="ignore"):
+        log_abs = np.log(np.abs(standardized))
+    usable = np.isfinite(log_abs)
+    count = usable.sum(axis=0)
+    mean = np.where(usable, log_abs, 0.0).sum(axis=0) / np.maximum(count, 1)
+
+    x = np.arange(1, n_bins + 1) / n_bins
+    angles = 2 * np.pi * np.arange(1, order + 1) * x[:, None]
+    design = np.column_stack([np.ones(n_bins), x, x**2, np.cos(angles), np.sin(angles)])
+    weights = np.sqrt(count)
+    coefficients = np.linalg.lstsq(design * weights[:, None], mean * weights, rcond=None)[0]
+    return np.exp(design @ coefficients)
+
+def periodicity_profile(matrix: np.ndarray, method: str = "wsd", order: int = 4) -> np.ndarray:
+    """
+    Intraday periodicity factor of every bin from a day x bin return matrix.
+
+    Returns are first divided by their day's bipower volatility, so that
+    days of high and low volatility weigh alike. Each bin's scale is then
+    estimated across all days at once, and the factors are normalized so
+    that their squares average to one.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        (days, bins) log returns; NaN marks missing bins.
+    method : str
+        'sd' (standard deviation), 'mad' (median absolute deviation),
+        'shorth' (shortest half), 'wsd' (weighted standard deviation with
+        shortest-half weights) or 'fff' (Taylor-Xu flexible Fourier form
+        fitted to log absolute returns).
+    order : int
+        Number of sine / cosine pairs in the flexible Fourier form.
+
+    Returns
+    -------
+    np.ndarray
+        One factor per bin.
+
+    References
+    ----------
+    Boudt, Croux and Laurent (2011), "Robust estimation of intraday
+    periodicity in the presence of jumps"
+    Taylor and Xu (1997), "The incremental volatility information in one
+    million foreign exchange quotations"
+    """
+    if method not in PERIODICITY_METHODS:
+        raise ValueError(f"Unsupported method: {method}. Choose from {PERIODICITY_METHODS}.")
+    standardized = _standardized(np.asarray(matrix, dtype=float))
+    with np.errstate(invalid="ignore"):
+        if method == "sd":
+            scale = np.sqrt(np.nanmean(standardized**2, axis=0))
+        elif method == "mad":
+            deviation = np.abs(standardized - np.nanmedian(standardized, axis=0))
+            scale = _MAD_FACTOR * np.nanmedian(deviation, axis=0)
+        elif method == "shorth":
+            scale = _shortest_half(standardized)
+        elif method == "wsd":
+            robust = standardized / _normalized(_shortest_half(standardized))
+            weights = np.where(robust**2 <= _WSD_CUTOFF, 1.0, 0.0)
+            squares = np.where(np.isnan(standardized), 0.0, standardized**2)
+            scale = np.sqrt(_WSD_FACTOR * np.sum(weights * squares, axis=0) / np.sum(weights, axis=0))
+        else:
+            scale = _flexible_fourier(standardized, order)
+    return _normalized(scale)
+
+def intraday_periodicity(
+    returns: pd.Series,
+    method: str = "wsd",
+    order: int = 4
+) -> Tuple[pd.Series, pd.Series]:
+    """
+    Estimate the intraday volatility pattern and deflate returns by it.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Regularly sampled log returns indexed by the end of their interval,
+        e.g., the output of `calendar_time_returns`, over many days.
+    method : str
+        Scale estimator; see `periodicity_profile`.
+    order : int
+        Number of Fourier pairs for method 'fff'.
+
+    Returns
+    -------
+    Tuple[pd.Series, pd.Series]
+        The periodicity factors indexed by bin end time of day, and the
+        returns divided by the factor of their bin (same index as
+        `returns`), ready for the jump tests and realized estimators.
+    """
+    _, bins, matrix, bin_codes = _return_matrix(returns)
+    profile = periodicity_profile(matrix, method, order)
+    adjusted = pd.Series(returns.to_numpy(dtype=float) / profile[bin_codes], index=returns.index, name=returns.name)
+    return pd.Series(profile, index=bins, name="periodicity"), adjusted
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, intraday_log_returns, period_offsets, period_returns, segment_codes, segment_lag_sum, segment_sum
 
 def barndorff_nielsen_shephard_jump_test(
     returns: Union[np.ndarray, pd.Series],
@@ -46,19 +48,21 @@ def barndorff_nielsen_shephard_jump_test(
     return np.abs(z_score) > threshold
 
 def detect_jumps_series(
-    df: pd.DataFrame,
+    df: IntradayData,
     price_column: str,
     time_column: str,
     freq: str = "1D",
-    threshold: float = 4.0
+    threshold: float = 4.0,
+    grid: Optional[IntradayGrid] = None
 ) -> pd.Series:
     """
     Detect jumps in each period using the BNS test.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame with timestamps and price.
+    df : pd.DataFrame or IntradayData
+        DataFrame with timestamps and price, or any other
+        input accepted by `intraday_log_returns`.
     price_column : str
         Name of price column.
     time_column : str
@@ -67,22 +71,206 @@ def detect_jumps_series(
         Resampling frequency.
     threshold : float
         Z-score threshold.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
 
     Returns
     -------
     pd.Series
         Boolean time series indicating jump presence.
     """
-    df = df.copy()
-    df[time_column] = pd.to_datetime(df[time_column])
-    df.set_index(time_column, inplace=True)
-    df.sort_index(inplace=True)
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    return pd.Series(_bns_jump_flags(returns, offsets, threshold), index=labels, name="Jump Detected")
+
+def _bns_jump_flags(returns: np.ndarray, offsets: np.ndarray, threshold: float) -> np.ndarray:
+    """BNS jump flags for every period delimited by `offsets`."""
+    n = np.diff(offsets)
+    r2 = returns**2
+    rv = segment_sum(r2, offsets)
+    bv = segment_lag_sum(np.abs(returns), offsets, 1) * (np.pi / 2)
+    var = (np.pi / 2 + np.pi - 5) * segment_sum(r2**2, offsets) / np.maximum(n, 1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z_score = (rv - bv) / np.sqrt(var / np.maximum(n, 1))
+    return (n >= 3) & (var > 0) & (np.abs(z_score) > threshold)
+
+def lee_mykland_statistics(
+    returns: Union[np.ndarray, pd.Series],
+    window: int,
+    exclude: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Lee-Mykland statistics L_i = r_i / sigma_i for every return at once.
+
+    sigma_i^2 = mean of |r_j||r_{j-1}| over the window - 2 bipower products
+    preceding r_i, obtained from cumulative sums.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns in time order.
+    window : int
+        Window length K (number of returns, including the tested one).
+    exclude : np.ndarray, optional
+        Boolean mask of returns (e.g., overnight returns) that neither enter
+        local volatilities nor get tested.
+
+    Returns
+    -------
+    np.ndarray
+        Statistics; NaN where fewer than half of the window's products are available.
+
+    References
+    ----------
+    Lee and Mykland (2008), "Jumps in Financial Markets: A New Nonparametric Test and Jump Dynamics"
+    """
+    if window < 3:
+        raise ValueError("window must be at least 3.")
+    returns = np.asarray(returns, dtype=float)
+    n = len(returns)
+    abs_r = np.abs(returns)
+    usable = np.ones(n, dtype=bool) if exclude is None else ~np.asarray(exclude, dtype=bool)
+
+    # Product j pairs r_j with r_{j-1}; cs[k] sums products j < k.
+    valid = np.zeros(n, dtype=bool)
+    valid[1:] = usable[1:] & usable[:-1]
+    products = np.zeros(n)
+    products[1:] = abs_r[1:] * abs_r[:-1]
+    products[~valid] = 0.0
+    cs = np.concatenate(([0.0], np.cumsum(products)))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+
+    i = np.arange(n)
+    lo = np.maximum(i - window + 2, 0)
+    local_sum = cs[i] - cs[lo]
+    local_count = counts[i] - counts[lo]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        stats = returns / np.sqrt(local_sum / local_count)
+    enough = (i >= window - 1) & (local_count >= (window - 2) / 2) & usable
+    return np.where(enough, stats, np.nan)
+
+def _lee_mykland_critical_values(n: np.ndarray, significance: float) -> np.ndarray:
+    """Gumbel critical values for max |L_i| over n returns."""
+    c = np.sqrt(2 / np.pi)
+    log_n = np.log(np.maximum(n, 3))
+    C_n = np.sqrt(2 * log_n) / c - (np.log(np.pi) + np.log(log_n)) / (2 * c * np.sqrt(2 * log_n))
+    S_n = 1 / (c * np.sqrt(2 * log_n))
+    beta = -np.log(-np.log(1 - significance))
+    return C_n + S_n * beta
+
+def _diurnal_scale(times: pd.DatetimeIndex, returns: np.ndarray, bin_width: str, exclude: np.ndarray) -> np.ndarray:
+    """
+    Per-return intraday periodicity factor from bipower products in time-of-day bins.
+
+    As in `lee_mykland_statistics`, excluded returns (overnight gaps) and the
+    products touching them enter no bin; such returns get a factor of one.
+    Factors are normalized so that their squares average to one over the
+    remaining returns.
+    """
+    bins = ((times - times.normalize()) // pd.Timedelta(bin_width)).to_numpy()
+    _, codes = np.unique(bins, return_inverse=True)
+    usable = ~exclude
+    valid = np.zeros(len(returns), dtype=bool)
+    valid[1:] = usable[1:] & usable[:-1]
+    if not valid.any():
+        return np.ones(len(returns))
+    products = np.zeros(len(returns))
+    products[1:] = np.abs(returns[1:]) * np.abs(returns[:-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # NaN for bins without a product.
+        level = np.bincount(codes, weights=np.where(valid, products, 0.0)) / np.bincount(codes, weights=valid)
+    scale2 = level[codes] / np.nanmean(level[codes][usable])
+    return np.sqrt(np.where(usable & (scale2 > 0), scale2, 1.0))
+
+def lee_mykland_jumps(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    window: Optional[int] = None,
+    significance: float = 0.01,
+    freq: str = "1D",
+    diurnal: Optional[str] = None,
+    grid: Optional[IntradayGrid] = None
+) -> pd.DataFrame:
+    """
+    Locate intraday jumps with the Lee-Mykland test.
+
+    Every return is standardized by a rolling bipower volatility of the
+    preceding returns and compared with the Gumbel critical value for the
+    maximum over a period, so the false-alarm rate is about `significance`
+    per period. The first return of each period (the overnight return) is
+    neither tested nor used in local volatilities.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame with timestamps and price, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Name of price column.
+    time_column : str
+        Name of timestamp column.
+    window : int, optional
+        Local volatility window K. Defaults to sqrt(252 * n) with n the median
+        number of returns per non-empty period.
+    significance : float
+        Significance level of the per-period maximum test.
+    freq : str
+        Session frequency used for critical values and overnight returns.
+    diurnal : str, optional
+        Time-of-day bin width (e.g., '30min'). If given, returns are deflated
+        by an intraday periodicity factor before testing.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, `freq` is ignored
+        and only the returns the grid marks as overnight are left untested.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per detected jump, indexed by timestamp, with columns "size"
+        (log return), "statistic" (L_i), "local_volatility" and "critical_value".
+        `pd.Series(True, index=table.index)` is a jump series suitable for
+        `plot_price_with_jumps`.
+    """
+    if grid is not None:
+        _, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+        times = grid.return_index
+    else:
+        log_returns = intraday_log_returns(df, price_column, time_column)
+        _, offsets = period_offsets(log_returns, freq)
+        returns, times = log_returns.values, log_returns.index
+    counts = np.diff(offsets)
+
+    if window is None:
+        active = counts[counts > 0]
+        window = int(np.sqrt(252 * np.median(active))) if len(active) else 3
+    window = max(window, 3)
+
+    if grid is not None:
+        overnight = grid.overnight
+    else:
+        overnight = np.zeros(len(returns), dtype=bool)
+        overnight[offsets[:-1][counts > 0]] = True
+
+    scale = np.ones(len(returns))
+    if diurnal is not None and len(returns):
+        scale = _diurnal_scale(times, returns, diurnal, overnight)
+
+    stats = lee_mykland_statistics(returns / scale, window, exclude=overnight)
+    critical = _lee_mykland_critical_values(counts, significance)[segment_codes(offsets)]
+    jumps = np.abs(np.nan_to_num(stats)) > critical
 
-    log_price = np.log(df[price_column])
-    log_returns = log_price.diff().dropna()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        local_volatility = np.abs(returns / stats) * np.sqrt(np.pi / 2)
 
-    result = log_returns.groupby(pd.Grouper(freq=freq)).apply(
-        lambda x: barndorff_nielsen_shephard_jump_test(x.values, threshold=threshold)
+    return pd.DataFrame(
+        {
+            "size": returns[jumps],
+            "statistic": stats[jumps],
+            "local_volatility": local_volatility[jumps],
+            "critical_value": critical[jumps]
+        },
+        index=times[jumps]
     )
-    result.name = "Jump Detected"
-    return result
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns, segment_median
 
 def median_realized_volatility(
     returns: Union[np.ndarray, pd.Series]
@@ -21,46 +23,44 @@ def median_realized_volatility(
     Notes
     -----
     More robust to extreme outliers than squared-based estimators.
+    This is the median of all absolute returns in the day; for the MedRV of
+    Andersen, Dobrev and Schaumburg (2012) see `median_realized_variance`.
     """
     returns = np.asarray(returns)
     med_rv = np.median(np.abs(returns))
     return med_rv * np.sqrt(np.pi / 2)
 
 def median_rv_series(
-    df: pd.DataFrame,
+    df: IntradayData,
     price_column: str,
     time_column: str,
-    freq: str = "1D"
+    freq: str = "1D",
+    grid: Optional[IntradayGrid] = None
 ) -> pd.Series:
     """
     Compute median-based realized volatility for each time group.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame containing timestamps and price data.
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
     price_column : str
         Column name for price.
     time_column : str
         Column name for timestamp.
     freq : str, optional
         Resampling frequency, e.g., '1D' for daily, by default "1D".
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
 
     Returns
     -------
     pd.Series
         Time series of median realized volatility.
     """
-    df = df.copy()
-    df[time_column] = pd.to_datetime(df[time_column])
-    df.set_index(time_column, inplace=True)
-    df.sort_index(inplace=True)
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
 
-    log_price = np.log(df[price_column])
-    log_returns = log_price.diff().dropna()
-
-    result = log_returns.groupby(pd.Grouper(freq=freq)).apply(
-        lambda x: median_realized_volatility(x.values)
-    )
-    result.name = "Median Realized Volatility"
-    return result
+    medians = segment_median(np.abs(returns), offsets)
+    return pd.Series(medians * np.sqrt(np.pi / 2), index=labels, name="Median Realized Volatility")
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+from functools import lru_cache
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns
+from .two_scale_realized_volatility import _subsampled_rv_segments, _tsrv_from_subsampled
+
+@lru_cache(maxsize=64)
+def msrv_weights(M: int) -> np.ndarray:
+    """
+    Optimal MSRV weights a_1..a_M of Zhang (2006).
+
+    a_i = 12 (i / M^2) (i / M - 1/2 - 1 / (2M)) / (1 - 1 / M^2). The weights
+    sum to one and satisfy sum_i a_i / i = 0, which cancels the noise bias.
+    """
+    if M < 2:
+        raise ValueError("MSRV needs at least two scales (M >= 2).")
+    i = np.arange(1, M + 1)
+    weights = 12 * (i / M**2) * (i / M - 0.5 - 1 / (2 * M)) / (1 - 1 / M**2)
+    weights.flags.writeable = False
+    return weights
+
+def multi_scale_realized_volatility(
+    returns: Union[np.ndarray, pd.Series],
+    M: int = 10
+) -> float:
+    """
+    Multi-Scale Realized Volatility (MSRV) estimator.
+
+    Combines the subsampled realized variances at scales K = 1..M with the
+    optimal weights of `msrv_weights`.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+    M : int
+        Number of scales.
+
+    Returns
+    -------
+    float
+        Multi-scale realized variance estimate.
+
+    References
+    ----------
+    Zhang (2006), "Efficient Estimation of Stochastic Volatility Using Noisy Observations: A Multi-Scale Approach"
+    """
+    returns = np.asarray(returns, dtype=float)
+    if len(returns) < M:
+        raise ValueError("Number of returns must be at least the number of scales (M).")
+    return float(_msrv_segments(returns, np.array([0, len(returns)]), M)[0])
+
+def tsrv_sweep(
+    returns: Union[np.ndarray, pd.Series],
+    max_scale: int
+) -> pd.Series:
+    """
+    TSRV for every number of sub-grids K = 1..max_scale, from one pass.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+    max_scale : int
+        Largest number of sub-grids.
+
+    Returns
+    -------
+    pd.Series
+        TSRV indexed by K; NaN where K exceeds the number of returns.
+    """
+    returns = np.asarray(returns, dtype=float)
+    offsets = np.array([0, len(returns)])
+    values = _tsrv_sweep_segments(returns, offsets, max_scale)[0]
+    return pd.Series(values, index=pd.RangeIndex(1, max_scale + 1, name="K"), name="TSRV")
+
+def _msrv_segments(returns: np.ndarray, offsets: np.ndarray, M: int) -> np.ndarray:
+    """MSRV for every period delimited by `offsets`; periods with fewer than M returns are NaN."""
+    weights = msrv_weights(M)
+    subsampled = _subsampled_rv_segments(returns, offsets, M)
+    return np.where(np.diff(offsets) >= M, subsampled @ weights, np.nan)
+
+def _tsrv_sweep_segments(returns: np.ndarray, offsets: np.ndarray, max_scale: int) -> np.ndarray:
+    """TSRV(K) for K = 1..max_scale and every period, shape (n_periods, max_scale)."""
+    subsampled = _subsampled_rv_segments(returns, offsets, max_scale)
+    return _tsrv_from_subsampled(subsampled, np.diff(offsets), np.arange(1, max_scale + 1))
+
+def msrv_series(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str = "1D",
+    M: int = 10,
+    grid: Optional[IntradayGrid] = None
+) -> pd.Series:
+    """
+    Compute MSRV for each group defined by resampling frequency.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    freq : str, optional
+        Resampling frequency, e.g., '1D' for daily, by default "1D".
+    M : int
+        Number of scales.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.Series
+        Time series of MSRV values; NaN for periods with fewer than M returns.
+    """
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    return pd.Series(_msrv_segments(returns, offsets, M), index=labels, name=f"MSRV({M})")
+
+def tsrv_sweep_series(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str = "1D",
+    max_scale: int = 30,
+    grid: Optional[IntradayGrid] = None
+) -> pd.DataFrame:
+    """
+    TSRV for K = 1..max_scale in each period, for choosing K or diagnosing noise.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    freq : str, optional
+        Resampling frequency, e.g., '1D' for daily, by default "1D".
+    max_scale : int
+        Largest number of sub-grids.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per period and one column "TSRV(K)" per scale.
+    """
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    values = _tsrv_sweep_segments(returns, offsets, max_scale)
+    return pd.DataFrame(values, index=labels, columns=[f"TSRV({K})" for K in range(1, max_scale + 1)])
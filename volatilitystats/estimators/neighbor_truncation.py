@@ -0,0 +1,171 @@
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns, range_sum
+
+# Scaling constants of Andersen, Dobrev and Schaumburg (2012).
+_MINRV_SCALE = np.pi / (np.pi - 2)
+_MEDRV_SCALE = np.pi / (6 - 4 * np.sqrt(3) + np.pi)
+
+# Number of windows reduced per step; temporaries stay O(_CHUNK) for any day length.
+_CHUNK = 1 << 18
+
+def _window_sums(abs_r: np.ndarray, offsets: np.ndarray, width: int) -> np.ndarray:
+    """
+    Per-period sums of squared min (width 2) or median (width 3) of consecutive |r|.
+
+    Windows are zero-copy sliding views; only windows lying inside one period
+    contribute, and they are reduced in fixed-size chunks.
+    """
+    total = np.zeros(len(offsets) - 1)
+    if len(abs_r) < width:
+        return total
+
+    windows = sliding_window_view(abs_r, width)
+    # Window w covers ticks w..w + width - 1, so it lies in a period [s, e) iff s <= w < e - width + 1.
+    starts = offsets[:-1]
+    ends = np.maximum(offsets[1:] - (width - 1), starts)
+
+    for lo in range(0, len(windows), _CHUNK):
+        hi = min(lo + _CHUNK, len(windows))
+        w = windows[lo:hi]
+        if width == 2:
+            stat = np.minimum(w[:, 0], w[:, 1])
+        else:
+            a, b, c = w[:, 0], w[:, 1], w[:, 2]
+            stat = np.maximum(np.minimum(a, b), np.minimum(np.maximum(a, b), c))
+        total += range_sum(stat * stat, np.clip(starts - lo, 0, hi - lo), np.clip(ends - lo, 0, hi - lo))
+    return total
+
+def _minrv_segments(returns: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """MinRV for every period delimited by `offsets`; periods with fewer than 2 returns are NaN."""
+    n = np.diff(offsets).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        minrv = _MINRV_SCALE * n / (n - 1) * _window_sums(np.abs(returns), offsets, 2)
+    return np.where(n >= 2, minrv, np.nan)
+
+def _medrv_segments(returns: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """MedRV for every period delimited by `offsets`; periods with fewer than 3 returns are NaN."""
+    n = np.diff(offsets).astype(float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        medrv = _MEDRV_SCALE * n / (n - 2) * _window_sums(np.abs(returns), offsets, 3)
+    return np.where(n >= 3, medrv, np.nan)
+
+def min_realized_variance(
+    returns: Union[np.ndarray, pd.Series]
+) -> float:
+    """
+    MinRV estimator of integrated variance (robust to jumps).
+
+    MinRV = pi / (pi - 2) * n / (n - 1) * sum_i min(|r_i|, |r_{i-1}|)^2.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+
+    Returns
+    -------
+    float
+        MinRV estimate; NaN for fewer than two returns.
+
+    References
+    ----------
+    Andersen, Dobrev and Schaumburg (2012), "Jump-Robust Volatility Estimation using Nearest Neighbor Truncation"
+    """
+    returns = np.asarray(returns, dtype=float)
+    return float(_minrv_segments(returns, np.array([0, len(returns)]))[0])
+
+def median_realized_variance(
+    returns: Union[np.ndarray, pd.Series]
+) -> float:
+    """
+    MedRV estimator of integrated variance (robust to jumps and zero returns).
+
+    MedRV = pi / (6 - 4 sqrt(3) + pi) * n / (n - 2)
+    * sum_i med(|r_i|, |r_{i-1}|, |r_{i-2}|)^2.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+
+    Returns
+    -------
+    float
+        MedRV estimate; NaN for fewer than three returns.
+
+    References
+    ----------
+    Andersen, Dobrev and Schaumburg (2012), "Jump-Robust Volatility Estimation using Nearest Neighbor Truncation"
+    """
+    returns = np.asarray(returns, dtype=float)
+    return float(_medrv_segments(returns, np.array([0, len(returns)]))[0])
+
+def minrv_series(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str = "1D",
+    grid: Optional[IntradayGrid] = None
+) -> pd.Series:
+    """
+    Compute MinRV for each time group.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    freq : str, optional
+        Resampling frequency, e.g., '1D' for daily, by default "1D".
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.Series
+        Time series of MinRV.
+    """
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    return pd.Series(_minrv_segments(returns, offsets), index=labels, name="MinRV")
+
+def medrv_series(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str = "1D",
+    grid: Optional[IntradayGrid] = None
+) -> pd.Series:
+    """
+    Compute MedRV for each time group.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    freq : str, optional
+        Resampling frequency, e.g., '1D' for daily, by default "1D".
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.Series
+        Time series of MedRV.
+    """
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    return pd.Series(_medrv_segments(returns, offsets), index=labels, name="MedRV")
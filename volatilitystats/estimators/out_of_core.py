@@ -0,0 +1,230 @@
+import os
+import numpy as np
+import pandas as pd
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+from volatilitystats.utils.segments import period_offsets
+from volatilitystats.utils.tick_store import TickSlice
+from .realized_measures import REALIZED_MEASURES, _check_measures, _measure_segments
+
+TickSource = Union[str, os.PathLike, TickSlice, Iterable[pd.DataFrame]]
+
+def _to_nanoseconds(values) -> Tuple[np.ndarray, object]:
+    """Timestamps (strings, datetimes or int64 nanoseconds) as int64 UTC nanoseconds and their time zone."""
+    if not isinstance(values, (pd.Series, pd.DatetimeIndex)):
+        values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return np.asarray(values, dtype=np.int64), None
+    index = pd.DatetimeIndex(pd.to_datetime(values))
+    return index.as_unit("ns").asi8, index.tz
+
+def _index(times: np.ndarray, tz) -> pd.DatetimeIndex:
+    """DatetimeIndex of int64 UTC nanoseconds, in the time zone of the source."""
+    index = pd.DatetimeIndex(times.view("datetime64[ns]"))
+    return index if tz is None else index.tz_localize("UTC").tz_convert(tz)
+
+def iter_tick_chunks(
+    source: TickSource,
+    price_column: str = "price",
+    time_column: str = "time",
+    chunksize: int = 1_000_000
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Read ticks in chunks of at most `chunksize` rows.
+
+    Parameters
+    ----------
+    source : str, path-like, TickSlice or iterable of pd.DataFrame
+        A CSV file; a tick store handle; a directory holding `<time_column>.npy` (int64 nanoseconds
+        or datetime64) and `<price_column>.npy`, read through memory maps; or
+        any iterable of DataFrames with the two columns.
+    price_column : str
+        Column (or array file) name for price.
+    time_column : str
+        Column (or array file) name for timestamp.
+    chunksize : int
+        Maximum number of ticks per chunk.
+
+    Yields
+    ------
+    Tuple[np.ndarray, np.ndarray]
+        int64 nanosecond timestamps (UTC for tz-aware sources) and float prices.
+    """
+    for times, prices, _ in _tick_chunks(source, price_column, time_column, chunksize):
+        yield times, prices
+
+def _tick_chunks(
+    source: TickSource,
+    price_column: str,
+    time_column: str,
+    chunksize: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray, object]]:
+    """`iter_tick_chunks` with the time zone of each chunk's timestamps."""
+    if chunksize < 1:
+        raise ValueError("chunksize must be positive.")
+
+    if isinstance(source, TickSlice):
+        times, prices, tz = source.instants, source.prices, source.tz
+        for lo in range(0, len(times), chunksize):
+            yield np.asarray(times[lo:lo + chunksize]), np.asarray(prices[lo:lo + chunksize]), tz
+        return
+
+    if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+        times = np.load(os.path.join(source, f"{time_column}.npy"), mmap_mode="r")
+        prices = np.load(os.path.join(source, f"{price_column}.npy"), mmap_mode="r")
+        if len(times) != len(prices):
+            raise ValueError("Time and price arrays must have the same length.")
+        for lo in range(0, len(times), chunksize):
+            t = np.asarray(times[lo:lo + chunksize])
+            yield (t.view(np.int64) if t.dtype.kind == "M" else t.astype(np.int64)), np.asarray(prices[lo:lo + chunksize], dtype=float), None
+        return
+
+    if isinstance(source, (str, os.PathLike)):
+        frames = pd.read_csv(source, usecols=[time_column, price_column], chunksize=chunksize)
+    else:
+        frames = source
+
+    for frame in frames:
+        for lo in range(0, len(frame), chunksize):
+            part = frame.iloc[lo:lo + chunksize]
+            times, tz = _to_nanoseconds(part[time_column])
+            yield times, np.asarray(part[price_column], dtype=float), tz
+
+def iter_realized_measures(
+    source: TickSource,
+    price_column: str = "price",
+    time_column: str = "time",
+    measures: Sequence[str] = REALIZED_MEASURES,
+    freq: str = "1D",
+    chunksize: int = 1_000_000,
+    K: int = 2,
+    kernel: str = "bartlett",
+    bandwidth: Union[int, str, None] = None,
+    threshold: float = 4.0
+) -> Iterator[pd.DataFrame]:
+    """
+    Realized measures from a time-sorted tick file, emitted period by period.
+
+    Ticks are read `chunksize` rows at a time. A period is evaluated and
+    yielded as soon as a tick from a later period arrives, so memory is
+    bounded by one chunk plus the ticks of the period still open. The last
+    price of each evaluated block is carried forward, so returns that span
+    chunk or period boundaries are the same as in a single in-memory pass.
+
+    Parameters
+    ----------
+    source : str, path-like, TickSlice or iterable of pd.DataFrame
+        Tick source; see `iter_tick_chunks`. Ticks must be in time order.
+    price_column : str
+        Name of the price column.
+    time_column : str
+        Name of the timestamp column.
+    measures : Sequence[str]
+        Measures to compute; see `realized_measures`.
+    freq : str
+        Period length, e.g., '1D'.
+    chunksize : int
+        Maximum number of ticks read at once.
+    K, kernel, bandwidth, threshold
+        Estimator settings; see `realized_measures`.
+
+    Yields
+    ------
+    pd.DataFrame
+        Rows for one or more newly completed periods, with the same values as
+        `realized_measures` on the full data.
+    """
+    _check_measures(measures)
+    settings = (measures, K, kernel, bandwidth, threshold)
+
+    # Ticks of the period still open, kept as a list of chunk pieces to avoid repeated copies.
+    pieces_t, pieces_lp = [], []
+    previous_lp: Optional[float] = None
+    next_label: Optional[pd.Timestamp] = None
+
+    for times, prices, tz in _tick_chunks(source, price_column, time_column, chunksize):
+        if len(times) == 0:
+            continue
+        if np.any(np.diff(times) < 0) or (pieces_t and times[0] < pieces_t[-1][-1]):
+            raise ValueError("Ticks must be sorted by time.")
+        log_prices = np.log(prices)
+
+        # Everything before the period of the newest tick is complete; periods follow local wall time.
+        open_start = _index(times[-1:], tz).floor(freq, ambiguous=True, nonexistent="shift_forward").asi8[0]
+        cut = int(np.searchsorted(times, open_start, side="left"))
+        if cut == 0 and (not pieces_t or pieces_t[-1][-1] >= open_start):
+            pieces_t.append(times)
+            pieces_lp.append(log_prices)
+            continue
+
+        block_lp = np.concatenate(pieces_lp + [log_prices[:cut]])
+        block_t = np.concatenate(pieces_t + [times[:cut]])
+        table, next_label = _evaluate(block_t, block_lp, tz, previous_lp, next_label, freq, settings)
+        previous_lp = float(block_lp[-1])
+        pieces_t, pieces_lp = [times[cut:]], [log_prices[cut:]]
+        if len(table):
+            yield table
+
+    if pieces_t:
+        table, _ = _evaluate(np.concatenate(pieces_t), np.concatenate(pieces_lp), tz, previous_lp, next_label, freq, settings)
+        if len(table):
+            yield table
+
+def _evaluate(
+    times: np.ndarray,
+    log_prices: np.ndarray,
+    tz,
+    previous_lp: Optional[float],
+    next_label: Optional[pd.Timestamp],
+    freq: str,
+    settings: tuple
+) -> Tuple[pd.DataFrame, Optional[pd.Timestamp]]:
+    """Measures for a block of complete periods, with empty periods since the last block filled in."""
+    if previous_lp is None:
+        returns = np.diff(log_prices)
+        times = times[1:]
+    else:
+        returns = np.diff(log_prices, prepend=previous_lp)
+    if len(returns) == 0:
+        return pd.DataFrame(), next_label
+
+    log_returns = pd.Series(returns, index=_index(times, tz))
+    labels, offsets = period_offsets(log_returns, freq)
+    table = pd.DataFrame(_measure_segments(returns, offsets, *settings), index=labels)
+
+    if next_label is not None and labels[0] > next_label:
+        empty = _measure_segments(np.empty(0), np.array([0, 0]), *settings)
+        gap = pd.date_range(next_label, labels[0], freq=freq, inclusive="left", unit=labels.unit)
+        filler = pd.DataFrame({m: np.repeat(v, len(gap)) for m, v in empty.items()}, index=gap)
+        table = pd.concat((filler, table))
+    # date_range steps in wall time, so a day after a DST change still starts at midnight.
+    return table, pd.date_range(labels[-1], periods=2, freq=freq)[-1]
+
+def chunked_realized_measures(
+    source: TickSource,
+    price_column: str = "price",
+    time_column: str = "time",
+    measures: Sequence[str] = REALIZED_MEASURES,
+    freq: str = "1D",
+    chunksize: int = 1_000_000,
+    K: int = 2,
+    kernel: str = "bartlett",
+    bandwidth: Union[int, str, None] = None,
+    threshold: float = 4.0
+) -> pd.DataFrame:
+    """
+    Batch form of `iter_realized_measures`: all periods in one DataFrame.
+
+    Returns
+    -------
+    pd.DataFrame
+        One column per requested measure, one row per period, indexed by the
+        period label (named after `time_column`).
+    """
+    tables = list(iter_realized_measures(
+        source, price_column, time_column, measures, freq, chunksize, K, kernel, bandwidth, threshold
+    ))
+    if not tables:
+        return pd.DataFrame(columns=list(measures), index=pd.DatetimeIndex([], name=time_column))
+    result = pd.concat(tables)
+    result.index.name = time_column
+    return result
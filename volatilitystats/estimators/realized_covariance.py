@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+from typing import List, Mapping, Optional, Tuple, Union
+from volatilitystats.utils.sampling import calendar_time_returns
+from .hayashi_yoshida import TickData
+
+# Cap on the (days x assets x assets) block multiplied at once.
+_BATCH_CELLS = 1 << 24
+
+def synchronized_returns(
+    data: Union[pd.DataFrame, Mapping[str, TickData]],
+    price_column: str,
+    time_column: str,
+    asset_column: Optional[str] = None,
+    interval: str = "5min",
+    session_start: str = "09:30",
+    session_end: str = "16:00"
+) -> Tuple[pd.DatetimeIndex, List[str], np.ndarray]:
+    """
+    Previous-tick returns of many assets on a common calendar grid.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Mapping[str, pd.DataFrame or TickSlice]
+        Long-format ticks with an asset column, or one tick set per asset.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    asset_column : str, optional
+        Column holding the asset of each row (long format only).
+    interval : str
+        Grid spacing, e.g., '5min'.
+    session_start : str
+        Session open as a time of day.
+    session_end : str
+        Session close as a time of day.
+
+    Returns
+    -------
+    Tuple[pd.DatetimeIndex, List[str], np.ndarray]
+        Days, assets and a (days, intervals, assets) return array. An asset
+        without ticks on a day has zero returns for that day.
+    """
+    if isinstance(data, Mapping):
+        items = data.items()
+    else:
+        if asset_column is None:
+            raise ValueError("asset_column is required for a long-format DataFrame.")
+        items = data.groupby(asset_column, sort=True)
+
+    sampled = {
+        str(asset): calendar_time_returns(frame, price_column, time_column, interval, session_start, session_end)
+        for asset, frame in items
+    }
+    if not sampled:
+        raise ValueError("No assets given.")
+    assets = list(sampled)
+    # The union of the per-asset grids covers every day on which any asset traded.
+    frame = pd.concat(sampled, axis=1).sort_index().fillna(0.0)
+    days = frame.index.normalize().unique()
+    returns = frame.to_numpy(dtype=float).reshape(len(days), -1, len(assets))
+    return days.rename(time_column), assets, returns
+
+def pack_upper(matrices: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """Row-major upper triangles (diagonal included) of a stack of symmetric matrices."""
+    n = matrices.shape[-1]
+    rows, cols = np.triu_indices(n)
+    return np.asarray(matrices[..., rows, cols], dtype=dtype)
+
+def unpack_upper(packed: np.ndarray, n_assets: int) -> np.ndarray:
+    """Symmetric matrices from the output of `pack_upper`."""
+    packed = np.asarray(packed)
+    rows, cols = np.triu_indices(n_assets)
+    out = np.empty(packed.shape[:-1] + (n_assets, n_assets), dtype=packed.dtype)
+    out[..., rows, cols] = packed
+    out[..., cols, rows] = packed
+    return out
+
+def daily_covariances(returns: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """
+    Packed realized covariance matrices sum_t r_t r_t' for every day.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        (days, intervals, assets) synchronized returns.
+    dtype : data-type
+        Storage type of the result, e.g., np.float32.
+
+    Returns
+    -------
+    np.ndarray
+        (days, n_assets * (n_assets + 1) / 2) upper triangles.
+    """
+    n_days, _, n_assets = returns.shape
+    out = np.empty((n_days, n_assets * (n_assets + 1) // 2), dtype=dtype)
+    rows = max(1, _BATCH_CELLS // max(1, n_assets * n_assets))
+    for lo in range(0, n_days, rows):
+        block = returns[lo:lo + rows]
+        out[lo:lo + rows] = pack_upper(np.swapaxes(block, 1, 2) @ block, dtype)
+    return out
+
+def rolling_covariance(packed: np.ndarray, window: int) -> np.ndarray:
+    """
+    Rolling mean of packed daily matrices, updated incrementally.
+
+    Each step adds the newest day and subtracts the one leaving the window;
+    the running sum is kept in float64 whatever the storage type.
+
+    Parameters
+    ----------
+    packed : np.ndarray
+        (days, P) packed matrices.
+    window : int
+        Number of days averaged.
+
+    Returns
+    -------
+    np.ndarray
+        (days, P) rolling means in the input dtype; NaN before a full window.
+    """
+    if window < 1:
+        raise ValueError("window must be a positive integer.")
+    out = np.full(packed.shape, np.nan, dtype=packed.dtype)
+    running = np.zeros(packed.shape[1])
+    for t in range(len(packed)):
+        running += packed[t]
+        if t >= window:
+            running -= packed[t - window]
+        if t >= window - 1:
+            out[t] = running / window
+    return out
+
+def shrink_covariance(packed: np.ndarray, n_assets: int, shrinkage: float, target: str = "diagonal") -> np.ndarray:
+    """
+    Linear shrinkage (1 - delta) * S + delta * T of packed covariance matrices.
+
+    Parameters
+    ----------
+    packed : np.ndarray
+        (..., P) packed matrices.
+    n_assets : int
+        Matrix dimension.
+    shrinkage : float
+        Intensity delta in [0, 1].
+    target : str
+        'diagonal' (the matrix's own variances) or 'identity' (average
+        variance times the identity).
+
+    Returns
+    -------
+    np.ndarray
+        Shrunk packed matrices.
+    """
+    if not 0.0 <= shrinkage <= 1.0:
+        raise ValueError("shrinkage must be in [0, 1].")
+    rows, cols = np.triu_indices(n_assets)
+    diagonal = rows == cols
+    target_values = np.zeros_like(packed)
+    if target == "diagonal":
+        target_values[..., diagonal] = packed[..., diagonal]
+    elif target == "identity":
+        target_values[..., diagonal] = packed[..., diagonal].mean(axis=-1, keepdims=True)
+    else:
+        raise ValueError("target must be 'diagonal' or 'identity'.")
+    return ((1.0 - shrinkage) * packed + shrinkage * target_values).astype(packed.dtype)
+
+def realized_covariance_series(
+    data: Union[pd.DataFrame, Mapping[str, TickData]],
+    price_column: str,
+    time_column: str,
+    asset_column: Optional[str] = None,
+    interval: str = "5min",
+    window: int = 1,
+    shrinkage: float = 0.0,
+    target: str = "diagonal",
+    dtype=np.float64,
+    packed: bool = False,
+    session_start: str = "09:30",
+    session_end: str = "16:00"
+) -> pd.DataFrame:
+    """
+    Daily (or rolling-mean) realized covariance matrices on a synchronized grid.
+
+    Parameters
+    ----------
+    data : pd.DataFrame or Mapping[str, pd.DataFrame or TickSlice]
+        Long-format ticks with an asset column, or one tick set per asset.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    asset_column : str, optional
+        Column holding the asset of each row (long format only).
+    interval : str
+        Grid spacing, e.g., '5min'.
+    window : int
+        Days in the rolling mean; 1 gives the daily matrices.
+    shrinkage : float
+        Shrinkage intensity toward `target`; see `shrink_covariance`.
+    target : str
+        Shrinkage target, 'diagonal' or 'identity'.
+    dtype : data-type
+        Storage type, e.g., np.float32 to halve memory.
+    packed : bool
+        If True, return one row per day holding the upper triangle, with
+        (asset, asset) column pairs. If False, return stacked full matrices.
+    session_start : str
+        Session open as a time of day.
+    session_end : str
+        Session close as a time of day.
+
+    Returns
+    -------
+    pd.DataFrame
+        Packed rows indexed by day, or full matrices indexed by (day, asset).
+    """
+    days, assets, returns = synchronized_returns(
+        data, price_column, time_column, asset_column, interval, session_start, session_end
+    )
+    values = daily_covariances(returns, dtype)
+    if window > 1:
+        values = rolling_covariance(values, window)
+    if shrinkage > 0.0:
+        values = shrink_covariance(values, len(assets), shrinkage, target)
+
+    if packed:
+        rows, cols = np.triu_indices(len(assets))
+        columns = pd.MultiIndex.from_arrays([np.array(assets)[rows], np.array(assets)[cols]], names=["row", "column"])
+        return pd.DataFrame(values, index=days, columns=columns)
+    full = unpack_upper(values, len(assets))
+    index = pd.MultiIndex.from_product([days, assets], names=[time_column, "asset"])
+    return pd.DataFrame(full.reshape(-1, len(assets)), index=index, columns=pd.Index(assets, name="asset"))
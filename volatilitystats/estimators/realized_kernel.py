@@ -1,11 +1,29 @@
 import numpy as np
 import pandas as pd
-from typing import Union
+from functools import lru_cache
+from scipy.fft import irfft, next_fast_len, rfft
+from typing import Optional, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import (
+    IntradayData, period_returns, segment_autocovariances, segment_codes, segment_positions, segment_sum
+)
+
+# Optimal bandwidth constants c* of Barndorff-Nielsen et al.; H* = c* xi^a n^b.
+_OPTIMAL_BANDWIDTH = {
+    "bartlett": (2.28, 1.0, 0.5),
+    "parzen": (3.5134, 0.8, 0.6),
+}
+
+# Number of equal-count blocks per period for the sparse RV used as an IV proxy.
+_SPARSE_BLOCKS = 20
+
+# Largest number of padded cells processed in one batched FFT.
+_FFT_BATCH_CELLS = 1 << 22
 
 def realized_kernel(
     returns: Union[np.ndarray, pd.Series],
     kernel: str = "bartlett",
-    bandwidth: int = None
+    bandwidth: Union[int, str, None] = None
 ) -> float:
     """
     Realized Kernel estimator for high-frequency volatility.
@@ -16,8 +34,9 @@ def realized_kernel(
         High-frequency log returns.
     kernel : str, optional
         Kernel type: 'bartlett', 'parzen', or 'uniform'. Default is 'bartlett'.
-    bandwidth : int, optional
-        Bandwidth (number of lags). If None, uses default sqrt(n).
+    bandwidth : int or 'optimal', optional
+        Bandwidth (number of lags). If None, uses default sqrt(n). If
+        'optimal', uses the data-driven rule of `optimal_bandwidth`.
 
     Returns
     -------
@@ -29,20 +48,9 @@ def realized_kernel(
     Barndorff-Nielsen, Hansen, Lunde, and Shephard (2008)
     "Designing Realized Kernels to Measure the Ex-Post Variation of Equity Prices in the Presence of Noise"
     """
-    returns = np.asarray(returns)
-    n = len(returns)
-    if bandwidth is None:
-        bandwidth = int(np.sqrt(n))
-
-    gamma_0 = np.sum(returns ** 2)
-    rk = gamma_0
-
-    for h in range(1, bandwidth + 1):
-        gamma_h = np.sum(returns[h:] * returns[:-h])
-        weight = kernel_weight(h, bandwidth, kernel)
-        rk += 2 * weight * gamma_h
-
-    return max(rk, 0.0)
+    returns = np.asarray(returns, dtype=float)
+    offsets = np.array([0, len(returns)])
+    return float(_realized_kernel_segments(returns, offsets, kernel, bandwidth)[0])
 
 def kernel_weight(h: int, bandwidth: int, kernel: str) -> float:
     """Kernel weights for realized kernel estimator."""
@@ -56,21 +64,88 @@ def kernel_weight(h: int, bandwidth: int, kernel: str) -> float:
     else:
         raise ValueError(f"Unsupported kernel type: {kernel}")
 
+@lru_cache(maxsize=256)
+def kernel_weights(kernel: str, bandwidth: int) -> np.ndarray:
+    """
+    Read-only vector of kernel weights for lags 1..bandwidth.
+
+    Cached per (kernel, bandwidth), so repeated days with the same bandwidth
+    share one table.
+    """
+    x = np.arange(1, bandwidth + 1) / (bandwidth + 1)
+    if kernel == "bartlett":
+        weights = 1 - x
+    elif kernel == "parzen":
+        weights = np.where(x <= 0.5, 1 - 6 * x**2 + 6 * x**3, 2 * (1 - x)**3)
+    elif kernel == "uniform":
+        weights = np.ones(bandwidth)
+    else:
+        raise ValueError(f"Unsupported kernel type: {kernel}")
+    weights.flags.writeable = False
+    return weights
+
+def realized_autocovariances(
+    returns: Union[np.ndarray, pd.Series],
+    max_lag: int
+) -> np.ndarray:
+    """
+    Realized autocovariances gamma_h = sum_t r_t r_{t-h} for h = 0..max_lag.
+
+    Small lag counts use direct lagged products; large ones use a single
+    zero-padded FFT, costing O(n log n) instead of O(n * max_lag).
+    """
+    returns = np.asarray(returns, dtype=float)
+    return _batched_autocovariances(returns, np.array([0, len(returns)]), max_lag)[0]
+
+def optimal_bandwidth(
+    returns: Union[np.ndarray, pd.Series],
+    kernel: str = "parzen"
+) -> int:
+    """
+    Data-driven realized kernel bandwidth of Barndorff-Nielsen et al.
+
+    H* = c* xi^a n^b with xi^2 = omega^2 / IV, where the noise variance
+    omega^2 is estimated by RV / (2n) and IV by a sparse RV on about 20
+    equal-count blocks. Parzen uses (c*, a, b) = (3.5134, 4/5, 3/5) and
+    Bartlett (2.28, 1, 1/2).
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+    kernel : str
+        'bartlett' or 'parzen'.
+
+    Returns
+    -------
+    int
+        Bandwidth, at least 1.
+
+    References
+    ----------
+    Barndorff-Nielsen, Hansen, Lunde, and Shephard (2009)
+    "Realized Kernels in Practice: Trades and Quotes"
+    """
+    returns = np.asarray(returns, dtype=float)
+    return int(_optimal_bandwidths(returns, np.array([0, len(returns)]), kernel)[0])
+
 def realized_kernel_series(
-    df: pd.DataFrame,
+    df: IntradayData,
     price_column: str,
     time_column: str,
     freq: str = "1D",
     kernel: str = "bartlett",
-    bandwidth: int = None
+    bandwidth: Union[int, str, None] = None,
+    grid: Optional[IntradayGrid] = None
 ) -> pd.Series:
     """
     Compute realized kernel estimator for each time group.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame with timestamps and price data.
+    df : pd.DataFrame or IntradayData
+        DataFrame with timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
     price_column : str
         Name of the price column.
     time_column : str
@@ -79,24 +154,111 @@ def realized_kernel_series(
         Frequency to group by (e.g., '1D').
     kernel : str
         Kernel function type.
-    bandwidth : int, optional
-        Bandwidth parameter.
+    bandwidth : int or 'optimal', optional
+        Bandwidth parameter; see `realized_kernel`. Defaults to sqrt(n) per period.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
 
     Returns
     -------
     pd.Series
         Time series of realized kernel volatility.
+
+    Notes
+    -----
+    All periods are evaluated together: autocovariances for every period come
+    from one batched computation rather than a per-period loop.
     """
-    df = df.copy()
-    df[time_column] = pd.to_datetime(df[time_column])
-    df.set_index(time_column, inplace=True)
-    df.sort_index(inplace=True)
-
-    log_price = np.log(df[price_column])
-    log_returns = log_price.diff().dropna()
-
-    result = log_returns.groupby(pd.Grouper(freq=freq)).apply(
-        lambda x: realized_kernel(x.values, kernel=kernel, bandwidth=bandwidth)
-    )
-    result.name = f"Realized Kernel ({kernel})"
-    return result
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    values = _realized_kernel_segments(returns, offsets, kernel, bandwidth)
+    return pd.Series(values, index=labels, name=f"Realized Kernel ({kernel})")
+
+def _optimal_bandwidths(returns: np.ndarray, offsets: np.ndarray, kernel: str) -> np.ndarray:
+    """Vectorized `optimal_bandwidth` for every period delimited by `offsets`."""
+    if kernel not in _OPTIMAL_BANDWIDTH:
+        raise ValueError(f"No optimal bandwidth rule for kernel '{kernel}'. Choose from {list(_OPTIMAL_BANDWIDTH)}.")
+    c, a, b = _OPTIMAL_BANDWIDTH[kernel]
+
+    n = np.diff(offsets)
+    n_periods = len(n)
+    safe_n = np.maximum(n, 1)
+    rv = segment_sum(returns**2, offsets)
+
+    # Aggregate each period into equal-count blocks and square the block returns.
+    codes = segment_codes(offsets)
+    blocks = segment_positions(offsets) * _SPARSE_BLOCKS // safe_n[codes]
+    block_returns = np.bincount(codes * _SPARSE_BLOCKS + blocks, weights=returns, minlength=n_periods * _SPARSE_BLOCKS)
+    iv = np.sum(block_returns.reshape(n_periods, _SPARSE_BLOCKS) ** 2, axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xi = np.sqrt(rv / (2 * safe_n) / iv)
+        H = np.ceil(c * xi**a * safe_n**b)
+    H = np.where(np.isfinite(H), H, 1)
+    return np.clip(H, 1, np.maximum(n - 1, 1)).astype(np.int64)
+
+def _batched_autocovariances(returns: np.ndarray, offsets: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Autocovariances for lags 0..max_lag of every period, shape (n_periods, max_lag + 1).
+
+    Periods are packed row-wise into zero-padded blocks and transformed
+    together; when max_lag is small relative to the FFT length the direct
+    lagged-product path is cheaper and is used instead.
+    """
+    n = np.diff(offsets)
+    n_periods = len(n)
+    if n_periods == 0 or max_lag <= 2 * np.log2(max(int(n.max()), 2)):
+        return segment_autocovariances(returns, offsets, max_lag)
+
+    gamma = np.zeros((n_periods, max_lag + 1))
+    positions = segment_positions(offsets)
+    start = 0
+    while start < n_periods:
+        # Grow the batch while the padded block stays within the cell budget.
+        stop = start + 1
+        longest = int(n[start])
+        length = next_fast_len(longest + max_lag + 1, real=True)
+        while stop < n_periods:
+            candidate = next_fast_len(max(longest, int(n[stop])) + max_lag + 1, real=True)
+            if candidate * (stop + 1 - start) > _FFT_BATCH_CELLS:
+                break
+            longest = max(longest, int(n[stop]))
+            length = candidate
+            stop += 1
+
+        lo, hi = offsets[start], offsets[stop]
+        block = np.zeros((stop - start, length))
+        block[segment_codes(offsets[start:stop + 1] - lo), positions[lo:hi]] = returns[lo:hi]
+        spectrum = rfft(block, axis=1)
+        gamma[start:stop] = irfft(spectrum.real**2 + spectrum.imag**2, n=length, axis=1)[:, :max_lag + 1]
+        start = stop
+
+    # Lags at or beyond a period's length are exactly zero.
+    gamma[np.arange(max_lag + 1)[None, :] >= n[:, None]] = 0.0
+    return gamma
+
+def _realized_kernel_segments(
+    returns: np.ndarray,
+    offsets: np.ndarray,
+    kernel: str,
+    bandwidth: Union[int, str, None]
+) -> np.ndarray:
+    """Realized kernel for every period delimited by `offsets`."""
+    n = np.diff(offsets)
+    if bandwidth is None:
+        bandwidths = np.sqrt(n).astype(np.int64)
+    elif isinstance(bandwidth, str):
+        if bandwidth != "optimal":
+            raise ValueError("bandwidth must be an integer, None or 'optimal'.")
+        bandwidths = _optimal_bandwidths(returns, offsets, kernel)
+    else:
+        bandwidths = np.full(len(n), bandwidth, dtype=np.int64)
+    max_lag = int(bandwidths.max()) if len(n) else 0
+
+    weights = np.zeros((len(n), max_lag))
+    for H in np.unique(bandwidths):
+        weights[bandwidths == H, :H] = kernel_weights(kernel, int(H))
+
+    gamma = _batched_autocovariances(returns, offsets, max_lag)
+    rk = gamma[:, 0] + 2 * np.sum(weights * gamma[:, 1:], axis=1)
+    return np.maximum(rk, 0.0)
@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns, segment_lag_sum, segment_median, segment_sum
+from .jump_detection import _bns_jump_flags
+from .realized_kernel import _realized_kernel_segments
+from .two_scale_realized_volatility import _tsrv_segments
+
+REALIZED_MEASURES = ("rv", "bv", "tsrv", "medrv", "rk", "jump")
+
+def realized_measures(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    measures: Sequence[str] = REALIZED_MEASURES,
+    freq: str = "1D",
+    K: int = 2,
+    kernel: str = "bartlett",
+    bandwidth: Union[int, str, None] = None,
+    threshold: float = 4.0,
+    grid: Optional[IntradayGrid] = None
+) -> pd.DataFrame:
+    """
+    Compute several realized measures per period from one pass over tick data.
+
+    The tick frame is parsed, sorted, logged and differenced once and split
+    into periods once; every requested measure is then evaluated for all
+    periods together with segment reductions.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame with timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Name of the price column.
+    time_column : str
+        Name of the timestamp column.
+    measures : Sequence[str]
+        Any of "rv" (realized variance), "bv" (bipower variation),
+        "tsrv" (two-scale RV), "medrv" (median RV), "rk" (realized kernel)
+        and "jump" (BNS jump flag).
+    freq : str
+        Resampling frequency, e.g., '1D'.
+    K : int
+        Number of sub-grids for TSRV.
+    kernel : str
+        Kernel type for the realized kernel.
+    bandwidth : int or 'optimal', optional
+        Realized kernel bandwidth; defaults to sqrt(n) per period;
+        'optimal' selects it per period from the data.
+    threshold : float
+        Z-score threshold for the jump test.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        One column per requested measure, one row per period. Values agree
+        with the corresponding `*_series` functions.
+    """
+    _check_measures(measures)
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    out = _measure_segments(returns, offsets, measures, K, kernel, bandwidth, threshold)
+    return pd.DataFrame(out, index=labels)
+
+def _check_measures(measures: Sequence[str]) -> None:
+    unknown = [m for m in measures if m not in REALIZED_MEASURES]
+    if unknown:
+        raise ValueError(f"Unsupported measures: {unknown}. Choose from {REALIZED_MEASURES}.")
+
+def _measure_segments(
+    r: np.ndarray,
+    offsets: np.ndarray,
+    measures: Sequence[str],
+    K: int,
+    kernel: str,
+    bandwidth: Union[int, str, None],
+    threshold: float
+) -> Dict[str, np.ndarray]:
+    """Requested measures for every period delimited by `offsets`."""
+    out = {}
+    for m in measures:
+        if m == "rv":
+            out[m] = segment_sum(r**2, offsets)
+        elif m == "bv":
+            out[m] = (np.pi / 2) * segment_lag_sum(np.abs(r), offsets, 1)
+        elif m == "tsrv":
+            out[m] = _tsrv_segments(r, offsets, K)
+        elif m == "medrv":
+            out[m] = segment_median(np.abs(r), offsets) * np.sqrt(np.pi / 2)
+        elif m == "rk":
+            out[m] = _realized_kernel_segments(r, offsets, kernel, bandwidth)
+        else:
+            out[m] = _bns_jump_flags(r, offsets, threshold)
+    return out
@@ -0,0 +1,275 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence, Tuple, Union
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import (
+    IntradayData, period_offsets, period_returns, segment_autocovariances, segment_lag_sum, segment_sum
+)
+from .realized_kernel import kernel_weights
+from .two_scale_realized_volatility import _subsampled_rv_segments, _tsrv_from_subsampled
+
+STATISTIC_MEASURES = ("rv", "bv", "tsrv", "rk", "jump")
+
+def _edge_width(statistics: pd.DataFrame) -> int:
+    """Number of boundary returns kept on each side of a period."""
+    return sum(1 for column in statistics.columns if column.startswith("head_"))
+
+def _lag_columns(statistics: pd.DataFrame, prefix: str) -> list:
+    return [column for column in statistics.columns if column.startswith(prefix)]
+
+def realized_statistics(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str = "1D",
+    max_lag: int = 30,
+    max_scale: int = 2,
+    grid: Optional[IntradayGrid] = None
+) -> pd.DataFrame:
+    """
+    Additive sufficient statistics of the tick returns of every period.
+
+    Each row holds the return count, the power sums behind RV, bipower
+    variation and the BNS jump test, the autocovariances sum_t r_t r_{t-h}
+    for h = 1..max_lag, the K-tick sums behind TSRV for K = 2..max_scale,
+    and the first and last returns of the period. The boundary returns make
+    the table mergeable: `rollup_statistics` turns daily rows into weekly or
+    monthly ones, adding back every product that spans two days, without
+    reading ticks again.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    freq : str
+        Base period, e.g., '1D'.
+    max_lag : int
+        Largest autocovariance lag kept, which bounds the realized kernel
+        bandwidth available from the table.
+    max_scale : int
+        Largest TSRV sub-grid count K kept.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per period with columns n, rv, rs_pos, rq, bp, gamma_1..,
+        sub_2.., head_0.. and tail_0.. (boundary returns, NaN-padded).
+    """
+    if max_lag < 0 or max_scale < 1:
+        raise ValueError("max_lag must be non-negative and max_scale positive.")
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    n = np.diff(offsets)
+    r2 = returns**2
+
+    columns = {
+        "n": n,
+        "rv": segment_sum(r2, offsets),
+        "rs_pos": segment_sum(np.where(returns > 0, r2, 0.0), offsets),
+        "rq": segment_sum(r2**2, offsets),
+        "bp": segment_lag_sum(np.abs(returns), offsets, 1),
+    }
+    gamma = segment_autocovariances(returns, offsets, max_lag)
+    for h in range(1, max_lag + 1):
+        columns[f"gamma_{h}"] = gamma[:, h]
+    subsampled = _subsampled_rv_segments(returns, offsets, max_scale) * np.arange(1, max_scale + 1)
+    for K in range(2, max_scale + 1):
+        columns[f"sub_{K}"] = subsampled[:, K - 1]
+
+    width = max(max_lag, max_scale - 1, 1)
+    position = np.arange(width)
+    head_index = offsets[:-1, None] + position
+    tail_index = offsets[1:, None] - width + position
+    last = max(len(returns) - 1, 0)
+    source = returns if len(returns) else np.zeros(1)
+    head = np.where(position < n[:, None], source[np.clip(head_index, 0, last)], np.nan)
+    tail = np.where(position >= width - n[:, None], source[np.clip(tail_index, 0, last)], np.nan)
+    for k in range(width):
+        columns[f"head_{k}"] = head[:, k]
+    for k in range(width):
+        columns[f"tail_{k}"] = tail[:, k]
+    return pd.DataFrame(columns, index=labels)
+
+def _seam_returns(
+    n: np.ndarray,
+    head: np.ndarray,
+    tail: np.ndarray,
+    offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Boundary returns of consecutive rows laid out back to back.
+
+    Each row contributes its first and last `width` returns (all of them if
+    it has fewer than 2 * width). Returns the values, their row, their
+    position within the coarse period delimited by `offsets`, and that
+    period's code.
+    """
+    width = head.shape[1]
+    position = np.arange(width)
+    in_head = np.minimum(n, width)
+    in_tail = np.minimum(n - in_head, width)
+    keep = np.concatenate((position < in_head[:, None], position >= width - in_tail[:, None]), axis=1)
+    values = np.concatenate((head, tail), axis=1)[keep]
+    within = np.concatenate((np.broadcast_to(position, head.shape), n[:, None] - width + position), axis=1)
+
+    codes = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+    rows = np.repeat(np.arange(len(n)), keep.sum(axis=1))
+    # Returns in earlier rows of the same coarse period.
+    before = np.concatenate(([0], np.cumsum(n)))
+    before = before[:-1] - before[offsets[:-1]][codes]
+    return values, rows, before[rows] + within[keep], codes[rows]
+
+def rollup_statistics(statistics: pd.DataFrame, freq: str) -> pd.DataFrame:
+    """
+    Aggregate a statistics table to a coarser frequency.
+
+    Sums are added across the rows of each coarse period, and every lagged
+    or multi-tick product that spans a row boundary is rebuilt from the
+    boundary returns. The result has the same layout as the input, so
+    roll-ups can be chained, and agrees with `realized_statistics` computed
+    at `freq` directly.
+
+    Parameters
+    ----------
+    statistics : pd.DataFrame
+        Output of `realized_statistics` (or of an earlier roll-up), with
+        periods nested in those of `freq`.
+    freq : str
+        Coarser frequency, e.g., 'W' or 'ME'.
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per coarse period, including empty ones.
+    """
+    labels, offsets = period_offsets(pd.Series(0.0, index=statistics.index), freq)
+    width = _edge_width(statistics)
+    gamma_columns = _lag_columns(statistics, "gamma_")
+    sub_columns = _lag_columns(statistics, "sub_")
+    head_columns = [f"head_{k}" for k in range(width)]
+    tail_columns = [f"tail_{k}" for k in range(width)]
+    n = statistics["n"].to_numpy(dtype=np.int64)
+    n_periods = len(labels)
+
+    sums = [column for column in statistics.columns if column not in head_columns + tail_columns]
+    out = {column: segment_sum(statistics[column].to_numpy(dtype=float), offsets) for column in sums}
+    out["n"] = segment_sum(n, offsets).astype(np.int64)
+
+    values, rows, position, codes = _seam_returns(
+        n, statistics[head_columns].to_numpy(dtype=float), statistics[tail_columns].to_numpy(dtype=float), offsets
+    )
+    cumulative = np.concatenate(([0.0], np.cumsum(values)))
+
+    def spanning(w: int) -> np.ndarray:
+        # Start of every run of w consecutive returns in one coarse period that crosses a row boundary.
+        starts = np.arange(max(len(values) - w + 1, 0))
+        ends = starts + w - 1
+        valid = (codes[starts] == codes[ends]) & (position[ends] - position[starts] == w - 1) & (rows[starts] != rows[ends])
+        return starts[valid]
+
+    starts = spanning(2)
+    out["bp"] += np.bincount(codes[starts], np.abs(values[starts] * values[starts + 1]), n_periods)
+    for column in gamma_columns:
+        h = int(column.split("_")[1])
+        starts = spanning(h + 1)
+        out[column] += np.bincount(codes[starts], values[starts] * values[starts + h], n_periods)
+    for column in sub_columns:
+        K = int(column.split("_")[1])
+        starts = spanning(K)
+        out[column] += np.bincount(codes[starts], (cumulative[starts + K] - cumulative[starts]) ** 2, n_periods)
+
+    total = out["n"]
+    head = np.full((n_periods, width), np.nan)
+    tail = np.full((n_periods, width), np.nan)
+    first = position < width
+    head[codes[first], position[first]] = values[first]
+    last = position >= total[codes] - width
+    tail[codes[last], width - total[codes[last]] + position[last]] = values[last]
+    for k in range(width):
+        out[f"head_{k}"] = head[:, k]
+    for k in range(width):
+        out[f"tail_{k}"] = tail[:, k]
+    return pd.DataFrame({column: out[column] for column in statistics.columns}, index=labels)
+
+def measures_from_statistics(
+    statistics: pd.DataFrame,
+    measures: Sequence[str] = STATISTIC_MEASURES,
+    K: int = 2,
+    kernel: str = "bartlett",
+    bandwidth: Union[int, None] = None,
+    threshold: float = 4.0
+) -> pd.DataFrame:
+    """
+    Realized measures from a statistics table, at the table's frequency.
+
+    Parameters
+    ----------
+    statistics : pd.DataFrame
+        Output of `realized_statistics` or `rollup_statistics`.
+    measures : Sequence[str]
+        Any of "rv", "bv", "tsrv", "rk" and "jump", as in `realized_measures`.
+    K : int
+        Number of sub-grids for TSRV; at most the table's `max_scale`.
+    kernel : str
+        Kernel type for the realized kernel.
+    bandwidth : int, optional
+        Realized kernel bandwidth; defaults to sqrt(n) per period, capped at
+        the table's `max_lag` (so periods of more than max_lag**2 returns
+        use max_lag). An explicit value must not exceed `max_lag`.
+    threshold : float
+        Z-score threshold for the jump test.
+
+    Returns
+    -------
+    pd.DataFrame
+        One column per requested measure, matching `realized_measures` on the
+        same ticks and frequency (up to the bandwidth cap above).
+    """
+    unknown = [m for m in measures if m not in STATISTIC_MEASURES]
+    if unknown:
+        raise ValueError(f"Unsupported measures: {unknown}. Choose from {STATISTIC_MEASURES}.")
+    n = statistics["n"].to_numpy(dtype=np.int64)
+    rv = statistics["rv"].to_numpy(dtype=float)
+    bv = (np.pi / 2) * statistics["bp"].to_numpy(dtype=float)
+
+    out = {}
+    for m in measures:
+        if m == "rv":
+            out[m] = rv
+        elif m == "bv":
+            out[m] = bv
+        elif m == "tsrv":
+            if K != 1 and f"sub_{K}" not in statistics:
+                raise ValueError(f"The statistics hold sub-grid sums up to K = {len(_lag_columns(statistics, 'sub_')) + 1}.")
+            subsampled = np.column_stack([rv] + [statistics[f"sub_{k}"].to_numpy(dtype=float) / k for k in range(2, K + 1)])
+            out[m] = _tsrv_from_subsampled(subsampled, n, np.array([K]))[:, 0]
+        elif m == "rk":
+            gamma_columns = _lag_columns(statistics, "gamma_")
+            if bandwidth is None:
+                bandwidths = np.minimum(np.sqrt(n).astype(np.int64), len(gamma_columns))
+            else:
+                bandwidths = np.full(len(n), bandwidth, dtype=np.int64)
+            max_lag = int(bandwidths.max()) if len(n) else 0
+            if max_lag > len(gamma_columns):
+                raise ValueError(
+                    f"A bandwidth of {max_lag} needs more autocovariance lags than the {len(gamma_columns)} kept; "
+                    "pass a smaller bandwidth or build the statistics with a larger max_lag."
+                )
+            gamma = statistics[gamma_columns[:max_lag]].to_numpy(dtype=float)
+            weights = np.zeros((len(n), max_lag))
+            for H in np.unique(bandwidths):
+                weights[bandwidths == H, :H] = kernel_weights(kernel, int(H))
+            out[m] = np.maximum(rv + 2 * np.sum(weights * gamma, axis=1), 0.0)
+        else:
+            var = (np.pi / 2 + np.pi - 5) * statistics["rq"].to_numpy(dtype=float) / np.maximum(n, 1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                z_score = (rv - bv) / np.sqrt(var / np.maximum(n, 1))
+            out[m] = (n >= 3) & (var > 0) & (np.abs(z_score) > threshold)
+    return pd.DataFrame(out, index=statistics.index)
@@ -30,11 +30,16 @@ def realized_volatility(
     if returns_col not in df.columns:
         raise ValueError(f"Column '{returns_col}' not found in input DataFrame.")
 
-    df = df.copy()
-    df['date'] = df.index.date
-    df['squared'] = df[returns_col] ** 2
-
-    daily_var = df.groupby('date')['squared'].sum()
+    # Integer day codes instead of an array of Python date objects; NaT rows get -1 and belong to no day.
+    day_codes, days = pd.factorize(df.index.normalize(), sort=True)
+    squared = df[returns_col].to_numpy(dtype=float) ** 2
+    squared = np.where(np.isnan(squared), 0.0, squared)
+    dated = day_codes >= 0
+    day_codes, squared = day_codes[dated], squared[dated]
+    daily_var = pd.Series(
+        np.bincount(day_codes, weights=squared, minlength=len(days)),
+        index=pd.Index(days.date, name="date")
+    )
     daily_vol = np.sqrt(daily_var)
     annualized_vol = daily_vol.rolling(window).mean() * np.sqrt(annualization_factor)
 
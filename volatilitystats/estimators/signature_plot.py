@@ -0,0 +1,159 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence, Union
+from volatilitystats.utils.sampling import _local_index, _session_ticks, _sorted_ticks, previous_tick_sample
+from volatilitystats.utils.segments import range_sum
+from volatilitystats.utils.tick_store import TickSlice
+from .realized_kernel import _realized_kernel_segments
+
+SIGNATURE_INTERVALS = ("1s", "5s", "15s", "30s", "1min", "2min", "5min", "10min", "15min", "20min", "30min")
+SIGNATURE_MEASURES = ("rv", "tsrv", "rk")
+
+# Cap on the (days x grid points) block sampled at once.
+_BATCH_CELLS = 1 << 22
+
+def volatility_signatures(
+    df: Union[pd.DataFrame, TickSlice],
+    price_column: str,
+    time_column: str,
+    intervals: Sequence[str] = SIGNATURE_INTERVALS,
+    measures: Sequence[str] = ("rv",),
+    subgrids: int = 1,
+    session_start: str = "09:30",
+    session_end: str = "16:00",
+    kernel: str = "bartlett",
+    bandwidth: Union[int, str, None] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Daily realized measures at many sampling intervals, for signature plots.
+
+    Ticks are sorted and their log prices sampled once: the previous-tick
+    grids of every interval and grid offset are concatenated and located with
+    a single binary search per block of days.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or TickSlice
+        Tick data, or a tick store handle.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    intervals : Sequence[str]
+        Sampling intervals, e.g., '1s' to '30min'.
+    measures : Sequence[str]
+        Any of:
+        - 'rv': realized variance, averaged over the `subgrids` offset grids.
+        - 'tsrv': two-scale RV with the sampling interval as the slow scale,
+          [X, X]^(avg) - (n_bar / n) [X, X]^(all ticks), where n_bar counts
+          the sampled returns that span at least one tick.
+        - 'rk': realized kernel of the returns on the unshifted grid.
+    subgrids : int
+        Number of grids per interval, offset by interval / subgrids.
+    session_start : str
+        Session open as a time of day.
+    session_end : str
+        Session close as a time of day.
+    kernel : str
+        Kernel for 'rk'.
+    bandwidth : int, 'optimal' or None
+        Bandwidth for 'rk'; see `realized_kernel`.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        For each measure, an interval x day matrix: rows indexed by the
+        sampling interval, columns by the day.
+    """
+    unknown = set(measures) - set(SIGNATURE_MEASURES)
+    if unknown:
+        raise ValueError(f"Unknown measures: {sorted(unknown)}. Choose from {list(SIGNATURE_MEASURES)}.")
+    if subgrids < 1:
+        raise ValueError("subgrids must be a positive integer.")
+    steps = np.array([pd.Timedelta(interval).value for interval in intervals], dtype=np.int64)
+    if np.any(steps <= 0):
+        raise ValueError("Sampling intervals must be positive.")
+
+    times, prices, tz = _sorted_ticks(df, price_column, time_column)
+    keep, offsets, bounds = _session_ticks(times, session_start, session_end, tz)
+    times, log_prices = times[keep], np.log(prices[keep])
+    n_days = len(bounds)
+
+    # Grid marks (relative to the open) for every (interval, offset) pair, concatenated.
+    length = bounds[0, 1] - bounds[0, 0] if n_days else 0
+    blocks = [
+        np.unique(np.r_[0, np.arange(j * step // subgrids, length, step), length])
+        for step in steps for j in range(subgrids)
+    ]
+    starts = np.cumsum([0] + [len(b) for b in blocks])
+    marks = np.concatenate(blocks)
+    boundary = starts[1:-1] - 1
+
+    rv = np.empty((n_days, len(blocks)))
+    moves = np.empty((n_days, len(blocks)))
+    rk = np.empty((n_days, len(steps)))
+    rows = max(1, _BATCH_CELLS // len(marks))
+    for lo in range(0, n_days, rows):
+        hi = min(lo + rows, n_days)
+        grid = bounds[lo:hi, :1] + marks
+        first = np.repeat(offsets[lo:hi], len(marks))
+        positions = previous_tick_sample(times, grid.ravel(), first).reshape(hi - lo, len(marks))
+        returns = np.diff(log_prices[positions], axis=1)
+        returns[:, boundary] = 0.0
+        rv[lo:hi] = np.add.reduceat(returns * returns, starts[:-1], axis=1)
+        # Sampled returns that span at least one tick; a grid finer than the ticks repeats prices.
+        moved = np.diff(positions, axis=1) != 0
+        moved[:, boundary] = False
+        moves[lo:hi] = np.add.reduceat(moved, starts[:-1], axis=1)
+
+        if "rk" in measures:
+            for i in range(len(steps)):
+                a, b = starts[i * subgrids], starts[i * subgrids + 1] - 1
+                block = np.ascontiguousarray(returns[:, a:b]).ravel()
+                block_offsets = np.arange(0, len(block) + 1, b - a)
+                rk[lo:hi, i] = _realized_kernel_segments(block, block_offsets, kernel, bandwidth)
+
+    days = _local_index(bounds[:, 0], tz, time_column).normalize()
+    index = pd.TimedeltaIndex(steps, name="interval")
+
+    rv_avg = rv.reshape(n_days, len(steps), subgrids).mean(axis=2)
+    result = {}
+    if "rv" in measures:
+        result["rv"] = pd.DataFrame(rv_avg.T, index=index, columns=days)
+    if "tsrv" in measures:
+        tick_returns = np.diff(log_prices)
+        tick_rv = range_sum(tick_returns**2, offsets[:-1], offsets[1:] - 1)
+        n = np.diff(offsets) - 1
+        n_bar = moves.reshape(n_days, len(steps), subgrids).mean(axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tsrv = np.maximum(rv_avg - n_bar / n[:, None] * tick_rv[:, None], 0.0)
+        tsrv[n < 1] = np.nan
+        result["tsrv"] = pd.DataFrame(tsrv.T, index=index, columns=days)
+    if "rk" in measures:
+        result["rk"] = pd.DataFrame(rk.T, index=index, columns=days)
+    return {m: result[m] for m in measures}
+
+def volatility_signature(
+    df: Union[pd.DataFrame, TickSlice],
+    price_column: str,
+    time_column: str,
+    intervals: Sequence[str] = SIGNATURE_INTERVALS,
+    measure: str = "rv",
+    subgrids: int = 1,
+    session_start: str = "09:30",
+    session_end: str = "16:00",
+    kernel: str = "bartlett",
+    bandwidth: Union[int, str, None] = None
+) -> pd.DataFrame:
+    """
+    Interval x day matrix of one realized measure; see `volatility_signatures`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Rows indexed by sampling interval, columns by day. The row means give
+        the volatility signature plot.
+    """
+    return volatility_signatures(
+        df, price_column, time_column, intervals, [measure], subgrids, session_start, session_end, kernel, bandwidth
+    )[measure]
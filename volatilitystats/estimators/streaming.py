@@ -0,0 +1,282 @@
+import numpy as np
+import pandas as pd
+from math import gamma, log, pi, sqrt
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+def _mu(p: float) -> float:
+    """E|Z|^p for standard normal Z."""
+    return 2 ** (p / 2) * gamma((p + 1) / 2) / sqrt(pi)
+
+_MU1 = _mu(1.0)
+_MU43 = _mu(4 / 3)
+# Asymptotic variance factor of the ratio jump statistic (Huang and Tauchen, 2005).
+_THETA = _MU1**-4 + 2 * _MU1**-2 - 5
+
+class _SessionStats:
+    """
+    Sufficient statistics of one contiguous slice of ticks within a session.
+
+    Besides running power sums, the first and last three returns are kept so
+    that two adjacent slices can be joined exactly: every multipower product
+    spanning the seam involves at most three returns on either side.
+    """
+
+    __slots__ = ("n", "first_log", "last_log", "head", "tail", "rv", "rs_pos", "rs_neg", "bp", "tp", "qp")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.first_log: Optional[float] = None
+        self.last_log: Optional[float] = None
+        self.head: Tuple[float, ...] = ()
+        self.tail: Tuple[float, ...] = ()
+        self.rv = self.rs_pos = self.rs_neg = 0.0
+        self.bp = self.tp = self.qp = 0.0
+
+    @classmethod
+    def point(cls, log_price: float) -> "_SessionStats":
+        """Statistics of a single tick (no returns yet)."""
+        state = cls()
+        state.first_log = state.last_log = log_price
+        return state
+
+    @classmethod
+    def from_log_prices(cls, log_prices: np.ndarray) -> "_SessionStats":
+        state = cls()
+        if len(log_prices) == 0:
+            return state
+        r = np.diff(log_prices)
+        a = np.abs(r)
+        a43 = a ** (4 / 3)
+        state.n = len(r)
+        state.first_log = float(log_prices[0])
+        state.last_log = float(log_prices[-1])
+        state.head = tuple(r[:3].tolist())
+        state.tail = tuple(r[-3:].tolist()) if len(r) else ()
+        state.rv = float(np.dot(r, r))
+        state.rs_pos = float(np.sum(np.where(r > 0, r * r, 0.0)))
+        state.rs_neg = state.rv - state.rs_pos
+        state.bp = float(np.dot(a[1:], a[:-1]))
+        state.tp = float(np.sum(a43[2:] * a43[1:-1] * a43[:-2]))
+        state.qp = float(np.sum(a[3:] * a[2:-1] * a[1:-2] * a[:-3]))
+        return state
+
+    def join(self, other: "_SessionStats") -> "_SessionStats":
+        """Statistics of `self` followed immediately by `other`."""
+        if self.first_log is None:
+            return other.copy()
+        if other.first_log is None:
+            return self.copy()
+
+        seam = other.first_log - self.last_log
+        sequence = [abs(x) for x in self.tail + (seam,) + other.head]
+        k = len(self.tail)
+
+        def spanning(width: int, power: float = 1.0) -> float:
+            # Products over windows of `width` consecutive returns that contain the seam.
+            total = 0.0
+            for start in range(max(0, k - width + 1), min(k, len(sequence) - width) + 1):
+                product = 1.0
+                for x in sequence[start:start + width]:
+                    product *= x
+                total += product**power
+            return total
+
+        joined = _SessionStats()
+        joined.n = self.n + other.n + 1
+        joined.first_log = self.first_log
+        joined.last_log = other.last_log
+        joined.head = (self.head + (seam,) + other.head)[:3]
+        joined.tail = (self.tail + (seam,) + other.tail)[-3:]
+        joined.rv = self.rv + other.rv + seam * seam
+        joined.rs_pos = self.rs_pos + other.rs_pos + (seam * seam if seam > 0 else 0.0)
+        joined.rs_neg = self.rs_neg + other.rs_neg + (seam * seam if seam < 0 else 0.0)
+        joined.bp = self.bp + other.bp + spanning(2)
+        joined.tp = self.tp + other.tp + spanning(3, 4 / 3)
+        joined.qp = self.qp + other.qp + spanning(4)
+        return joined
+
+    def copy(self) -> "_SessionStats":
+        clone = _SessionStats()
+        for name in self.__slots__:
+            setattr(clone, name, getattr(self, name))
+        return clone
+
+    def values(self) -> Dict[str, float]:
+        n = self.n
+        bv = _MU1**-2 * self.bp
+        tq = n * _MU43**-3 * n / (n - 2) * self.tp if n > 2 else np.nan
+        qq = n * _MU1**-4 * n / (n - 3) * self.qp if n > 3 else np.nan
+        jump = np.nan
+        if n > 2 and self.rv > 0 and bv > 0:
+            jump = ((self.rv - bv) / self.rv) / np.sqrt(_THETA / n * max(1.0, tq / bv**2))
+        return {
+            "n": n,
+            "rv": self.rv,
+            "bv": bv,
+            "tq": tq,
+            "qq": qq,
+            "rs_pos": self.rs_pos,
+            "rs_neg": self.rs_neg,
+            "jump_statistic": jump
+        }
+
+class RealizedAccumulator:
+    """
+    Incremental realized measures over a stream of ticks.
+
+    Ticks are fed one at a time or in batches with `update`. For every session
+    (period of length `freq`) the accumulator keeps O(1) state: realized
+    variance, bipower variation, tripower and quadpower quarticity, realized
+    semivariances and the ratio jump statistic of Huang and Tauchen (2005).
+    Values are available at any time; a tick in a new session rolls the
+    accumulator over. Accumulators built on consecutive slices of a stream can
+    be combined with `merge`, giving the same result as one pass.
+
+    Parameters
+    ----------
+    freq : str
+        Session length, e.g., '1D'.
+    include_overnight : bool
+        If True, the return from the previous session's last tick to a
+        session's first tick belongs to the new session, as in the `*_series`
+        estimators. If False, sessions start afresh.
+
+    Examples
+    --------
+    >>> acc = RealizedAccumulator()
+    >>> acc.update(prices, timestamps)
+    >>> acc.values["bv"]
+    """
+
+    def __init__(self, freq: str = "1D", include_overnight: bool = True) -> None:
+        self.freq = freq
+        self.include_overnight = include_overnight
+        self._period = pd.Timedelta(freq)
+        self._sessions: Dict[pd.Timestamp, _SessionStats] = {}
+        self._last_time: Optional[pd.Timestamp] = None
+
+    def update(
+        self,
+        price: Union[float, Sequence[float], np.ndarray],
+        timestamp: Union[str, pd.Timestamp, Sequence, np.ndarray, pd.DatetimeIndex]
+    ) -> "RealizedAccumulator":
+        """
+        Add one tick or a time-ordered batch of ticks.
+
+        Returns
+        -------
+        RealizedAccumulator
+            The accumulator itself, for chaining.
+        """
+        if np.ndim(price) == 0:
+            # Single tick: skip the array machinery.
+            time = pd.Timestamp(timestamp)
+            if self._last_time is not None and time < self._last_time:
+                raise ValueError("Ticks must arrive in time order.")
+            label = self.session
+            if label is None or not (label <= time < label + self._period):
+                label = time.floor(self.freq)
+            self._append([(label, _SessionStats.point(log(float(price))))], time)
+            return self
+
+        log_prices = np.log(np.asarray(price, dtype=float))
+        times = pd.DatetimeIndex(np.atleast_1d(pd.to_datetime(timestamp)))
+        if len(times) != len(log_prices):
+            raise ValueError("price and timestamp must have the same length.")
+        if len(times) == 0:
+            return self
+        if self._last_time is not None and times[0] < self._last_time:
+            raise ValueError("Ticks must arrive in time order.")
+        if not times.is_monotonic_increasing:
+            raise ValueError("Ticks within a batch must be in time order.")
+
+        labels = times.floor(self.freq)
+        breaks = np.flatnonzero(labels[1:] != labels[:-1]) + 1
+        bounds = np.concatenate(([0], breaks, [len(times)]))
+        batch = []
+        for lo, hi in zip(bounds[:-1], bounds[1:]):
+            state = _SessionStats.from_log_prices(log_prices[lo:hi])
+            if lo > 0 and self.include_overnight:
+                state = self._open_session(float(log_prices[lo - 1]), state)
+            batch.append((labels[lo], state))
+        self._append(batch, times[-1])
+        return self
+
+    def merge(self, other: "RealizedAccumulator") -> "RealizedAccumulator":
+        """
+        Combine with an accumulator built on the ticks that directly follow.
+
+        Parameters
+        ----------
+        other : RealizedAccumulator
+            Accumulator over a later, adjacent slice of the same stream.
+
+        Returns
+        -------
+        RealizedAccumulator
+            A new accumulator equivalent to a single pass over both slices.
+        """
+        if (other.freq, other.include_overnight) != (self.freq, self.include_overnight):
+            raise ValueError("Accumulators must share freq and include_overnight.")
+        if self._last_time is not None and other._sessions and next(iter(other._sessions)) < self.session:
+            raise ValueError("The merged accumulator must cover later ticks.")
+
+        merged = RealizedAccumulator(self.freq, self.include_overnight)
+        merged._sessions = {label: state.copy() for label, state in self._sessions.items()}
+        merged._last_time = self._last_time
+        if other._sessions:
+            merged._append([(label, state.copy()) for label, state in other._sessions.items()], other._last_time)
+        return merged
+
+    def _append(self, items: list, last_time: pd.Timestamp) -> None:
+        """
+        Attach time-ordered (label, state) pairs after the current session, in place.
+
+        Only the first pair can continue the current session or need the
+        previous close; later pairs are complete sessions.
+        """
+        items = list(items)
+        if self._sessions:
+            current = self.session
+            previous = self._sessions[current]
+            label, state = items[0]
+            if label == current:
+                self._sessions[current] = previous.join(state)
+                items = items[1:]
+            elif self.include_overnight:
+                items[0] = (label, self._open_session(previous.last_log, state))
+
+        for label, state in items:
+            self._sessions[label] = state
+        self._last_time = last_time
+
+    @staticmethod
+    def _open_session(previous_close: float, state: _SessionStats) -> _SessionStats:
+        """Prefix a session with the previous close so its overnight return is counted."""
+        return _SessionStats.point(previous_close).join(state)
+
+    @property
+    def session(self) -> Optional[pd.Timestamp]:
+        """Label of the current session."""
+        return next(reversed(self._sessions)) if self._sessions else None
+
+    @property
+    def values(self) -> Dict[str, float]:
+        """Current-session measures: n, rv, bv, tq, qq, rs_pos, rs_neg and jump_statistic."""
+        if not self._sessions:
+            return _SessionStats().values()
+        return self._sessions[self.session].values()
+
+    def to_frame(self) -> pd.DataFrame:
+        """Measures for every session seen so far, one row per session."""
+        rows = [state.values() for state in self._sessions.values()]
+        return pd.DataFrame(rows, index=pd.DatetimeIndex(list(self._sessions), name="session"))
+
+    def pop_completed(self) -> pd.DataFrame:
+        """Return and discard every session except the current one."""
+        current = self.session
+        frame = self.to_frame()
+        if current is None:
+            return frame
+        self._sessions = {current: self._sessions[current]}
+        return frame.iloc[:-1]
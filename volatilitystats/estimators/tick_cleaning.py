@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+from typing import Tuple
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import _tick_arrays, segment_median
+
+CLEANING_REASONS = ("out_of_session", "non_positive", "duplicate", "outlier")
+
+# Rows of the (ticks x window) matrix sorted at once.
+_CHUNK_ROWS = 1 << 15
+
+def _excluding_median(values: np.ndarray, count: np.ndarray) -> np.ndarray:
+    """Row medians of the `count` smallest entries of each row, sorting it in place."""
+    values.sort(axis=1)
+    rows = np.arange(len(values))
+    return 0.5 * (values[rows, np.maximum(count - 1, 0) // 2] + values[rows, count // 2])
+
+def rolling_mad_outliers(
+    log_prices: np.ndarray,
+    offsets: np.ndarray,
+    window: int = 50,
+    threshold: float = 10.0
+) -> np.ndarray:
+    """
+    Flag ticks far from the median of their neighbors, session by session.
+
+    Each tick is compared with the median of the `window` surrounding ticks
+    of its session (half before, half after, shifted inwards at the session
+    edges; the tick itself excluded). It is an outlier if it deviates by more
+    than `threshold` times the median absolute deviation of those neighbors.
+    The MAD is floored at the median non-zero absolute tick return, so that
+    one-tick moves amid runs of identical prices are not flagged.
+
+    Parameters
+    ----------
+    log_prices : np.ndarray
+        Time-sorted log prices.
+    offsets : np.ndarray
+        Session i covers log_prices[offsets[i]:offsets[i + 1]].
+    window : int
+        Number of neighbors.
+    threshold : float
+        Cut-off in MADs.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean outlier mask.
+    """
+    if window < 2:
+        raise ValueError("window must be at least 2.")
+    n = len(log_prices)
+    flags = np.zeros(n, dtype=bool)
+    if n == 0:
+        return flags
+
+    lengths = np.diff(offsets)
+    lo = np.repeat(offsets[:-1], lengths)
+    hi = np.repeat(offsets[1:], lengths)
+    width = window + 1
+    ticks = np.arange(n)
+    start = np.clip(ticks - window // 2, lo, np.maximum(hi - width, lo))
+    count = np.minimum(width, hi - lo) - 1  # neighbors of each tick
+
+    moves = np.abs(np.diff(log_prices))
+    moves = moves[(moves > 0) & (lo[1:] == lo[:-1])]
+    floor = float(np.median(moves)) if len(moves) else 0.0
+
+    # Pad so that windows of short sessions can be read at full width.
+    windows = np.lib.stride_tricks.sliding_window_view(np.concatenate((log_prices, np.full(width, np.inf))), width)
+    columns = np.arange(width)
+    for a in range(0, n, _CHUNK_ROWS):
+        b = min(a + _CHUNK_ROWS, n)
+        values = windows[start[a:b]]
+        # The tick itself and anything past the session end are set to +inf and sort last.
+        values[np.arange(b - a), ticks[a:b] - start[a:b]] = np.inf
+        values[columns > count[a:b, None]] = np.inf
+        median = _excluding_median(values, count[a:b])
+        deviation = np.abs(log_prices[a:b] - median)
+        with np.errstate(invalid="ignore"):  # sessions of a single tick have no neighbors
+            np.subtract(values, median[:, None], out=values)
+        mad = _excluding_median(np.abs(values, out=values), count[a:b])
+        flags[a:b] = (count[a:b] >= 2) & (deviation > threshold * np.maximum(mad, floor))
+    return flags
+
+def clean_ticks(
+    df: pd.DataFrame,
+    price_column: str,
+    time_column: str,
+    session_start: str = "00:00",
+    session_end: str = "24:00",
+    duplicates: str = "median",
+    window: int = 50,
+    threshold: float = 10.0
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Clean raw ticks before the realized estimators.
+
+    Ticks are sorted once and every filter is an array operation over the
+    whole sample, in the order of Barndorff-Nielsen et al. (2009):
+    out-of-session prints are dropped, then zero, negative and non-finite
+    prices, then ticks sharing a timestamp are collapsed into one, and
+    finally bounce-back outliers are removed with `rolling_mad_outliers`
+    (on log prices, within each session).
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw ticks.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    session_start : str
+        Session open as a time of day; see `IntradayGrid`.
+    session_end : str
+        Session close as a time of day.
+    duplicates : str
+        'median' or 'last': price kept for ticks with the same timestamp.
+    window : int
+        Neighbors in the outlier filter; 0 disables it.
+    threshold : float
+        Outlier cut-off in median absolute deviations.
+
+    Returns
+    -------
+    Tuple[pd.DataFrame, pd.DataFrame]
+        The cleaned, time-sorted ticks, and the removed rows with a "reason"
+        column (one of `CLEANING_REASONS`). Collapsed duplicates are reported
+        once per dropped row.
+
+    References
+    ----------
+    Barndorff-Nielsen, Hansen, Lunde and Shephard (2009), "Realized kernels
+    in practice: trades and quotes"
+    """
+    if duplicates not in ("median", "last"):
+        raise ValueError("duplicates must be 'median' or 'last'.")
+    times, raw, _ = _tick_arrays(df, price_column, time_column)
+    grid = IntradayGrid(times, session_start, session_end)
+    order = np.arange(len(times)) if grid.order is None else grid.order
+    times = times[order]
+    raw = raw[order]
+    prices = raw.copy()
+
+    # Reason codes over sorted ticks: 0 kept, then 1 + position in CLEANING_REASONS.
+    reason = np.zeros(len(prices), dtype=np.int8)
+    reason[~grid.in_session] = 1
+    with np.errstate(invalid="ignore"):
+        reason[(reason == 0) & ~(np.isfinite(prices) & (prices > 0))] = 2
+
+    alive = np.flatnonzero(reason == 0)
+    # Ties are found on instants; wall-clock times repeat during a DST fall-back.
+    stamps = times.asi8[alive]
+    last_of_run = np.r_[stamps[1:] != stamps[:-1], True] if len(alive) else np.zeros(0, dtype=bool)
+    reason[alive[~last_of_run]] = 3
+    if duplicates == "median" and not last_of_run.all():
+        # Only runs of two or more ticks need a median.
+        ends = np.flatnonzero(last_of_run)
+        starts = np.concatenate(([0], ends[:-1] + 1))
+        tied = ends > starts
+        members = np.repeat(tied, ends - starts + 1)
+        runs = np.concatenate(([0], np.cumsum(ends[tied] - starts[tied] + 1)))
+        prices[alive[ends[tied]]] = segment_median(prices[alive[members]], runs)
+    alive = alive[last_of_run]
+
+    if window > 0 and len(alive):
+        sessions = grid.session_ids[alive]
+        offsets = np.concatenate(([0], np.flatnonzero(sessions[1:] != sessions[:-1]) + 1, [len(alive)]))
+        outliers = rolling_mad_outliers(np.log(prices[alive]), offsets, window, threshold)
+        reason[alive[outliers]] = 4
+        alive = alive[~outliers]
+
+    cleaned = pd.DataFrame({time_column: times[alive], price_column: prices[alive]})
+    dropped = np.flatnonzero(reason > 0)
+    removed = pd.DataFrame({
+        time_column: times[dropped],
+        price_column: raw[dropped],
+        "reason": pd.Categorical.from_codes(reason[dropped] - 1, categories=list(CLEANING_REASONS))
+    })
+    return cleaned, removed
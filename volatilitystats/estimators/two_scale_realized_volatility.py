@@ -1,6 +1,12 @@
 import numpy as np
 import pandas as pd
-from typing import Union
+from typing import Optional, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from volatilitystats.utils.intraday_grid import IntradayGrid
+from volatilitystats.utils.segments import IntradayData, period_returns, range_sum, segment_positions
+
+# Rows of the (returns × scales) matrix materialized at once.
+_CHUNK_ROWS = 1 << 16
 
 def two_scale_realized_volatility(
     returns: Union[np.ndarray, pd.Series],
@@ -19,41 +25,89 @@ def two_scale_realized_volatility(
     Returns
     -------
     float
-        Two-Scale Realized Variance estimate.
+        Two-Scale Realized Variance estimate, [X, X]^(K) - (n_bar / n) [X, X]^(1)
+        with n_bar = (n - K + 1) / K, floored at zero.
 
     References
     ----------
     Zhang, Mykland, Aït-Sahalia (2005). "A Tale of Two Time Scales." Journal of the American Statistical Association.
     """
-    returns = np.asarray(returns)
+    returns = np.asarray(returns, dtype=float)
     n = len(returns)
 
     if n < K:
         raise ValueError("Number of returns must be greater than number of sub-grids (K).")
 
-    rv = np.sum(returns ** 2)
-    subsampled_rvs = [
-        np.sum(returns[k::K] ** 2) * K for k in range(K)
-    ]
+    return float(_tsrv_segments(returns, np.array([0, n]), K)[0])
+
+def subsampled_realized_variances(
+    returns: Union[np.ndarray, pd.Series],
+    max_scale: int
+) -> np.ndarray:
+    """
+    Subsampled realized variances [X, X]^(K) for every scale K = 1..max_scale.
+
+    [X, X]^(K) = (1/K) sum_i (X_i - X_{i-K})^2 is the average of the realized
+    variances of the K sparse grids offset by 0..K-1 ticks. All scales are
+    computed together from cumulative log prices.
+
+    Parameters
+    ----------
+    returns : array-like
+        High-frequency log returns within a day.
+    max_scale : int
+        Largest subsampling scale.
+
+    Returns
+    -------
+    np.ndarray
+        Array of length max_scale; entry K - 1 holds [X, X]^(K). Scales larger
+        than the number of returns are zero.
+    """
+    returns = np.asarray(returns, dtype=float)
+    return _subsampled_rv_segments(returns, np.array([0, len(returns)]), max_scale)[0]
+
+def _subsampled_rv_segments(returns: np.ndarray, offsets: np.ndarray, max_scale: int) -> np.ndarray:
+    """
+    [X, X]^(K) for K = 1..max_scale and every period, shape (n_periods, max_scale).
+
+    K-tick returns ending at tick t are differences of the cumulative log
+    price, read for all K at once through a sliding-window view; only ticks
+    with at least K - 1 predecessors in the same period contribute.
+    """
+    if max_scale < 1:
+        raise ValueError("max_scale must be at least 1.")
 
-    rv_bar = np.mean(subsampled_rvs)
-    tsrv = rv_bar - (rv / n)
-    return max(tsrv, 0.0)
+    cumulative = np.concatenate((np.zeros(max_scale), np.cumsum(returns)))
+    # Row t holds the cumulative price K ticks before tick t, for K = 1..max_scale.
+    lagged = sliding_window_view(cumulative, max_scale)[:len(returns), ::-1]
+    positions = segment_positions(offsets)
+    lags = np.arange(max_scale)
+
+    total = np.zeros((len(offsets) - 1, max_scale))
+    for lo in range(0, len(returns), _CHUNK_ROWS):
+        hi = min(lo + _CHUNK_ROWS, len(returns))
+        diffs = cumulative[max_scale + lo:max_scale + hi, None] - lagged[lo:hi]
+        squares = np.where(positions[lo:hi, None] >= lags, diffs**2, 0.0)
+        total += range_sum(squares, np.clip(offsets[:-1] - lo, 0, hi - lo), np.clip(offsets[1:] - lo, 0, hi - lo))
+    return total / np.arange(1, max_scale + 1)
 
 def tsrv_series(
-    df: pd.DataFrame,
+    df: IntradayData,
     price_column: str,
     time_column: str,
     freq: str = "1D",
-    K: int = 2
+    K: int = 2,
+    grid: Optional[IntradayGrid] = None
 ) -> pd.Series:
     """
     Compute TSRV for each group defined by resampling frequency.
 
     Parameters
     ----------
-    df : pd.DataFrame
-        DataFrame containing timestamps and price data.
+    df : pd.DataFrame or IntradayData
+        DataFrame containing timestamps and price data, or any other
+        input accepted by `intraday_log_returns`.
     price_column : str
         Column name for price.
     time_column : str
@@ -62,20 +116,28 @@ def tsrv_series(
         Resampling frequency, e.g., '1D' for daily, by default "1D".
     K : int
         Number of sub-grids.
+    grid : IntradayGrid, optional
+        Session grid built from `df`'s timestamps; if given, timestamps are
+        not parsed again and `freq` is ignored.
 
     Returns
     -------
     pd.Series
-        Time series of TSRV values.
+        Time series of TSRV values; NaN for periods with fewer than K returns.
     """
-    df = df.copy()
-    df[time_column] = pd.to_datetime(df[time_column])
-    df.set_index(time_column, inplace=True)
-    df.sort_index(inplace=True)
+    labels, returns, offsets = period_returns(df, price_column, time_column, freq, grid)
+    return pd.Series(_tsrv_segments(returns, offsets, K), index=labels, name=f"TSRV({K})")
 
-    log_price = np.log(df[price_column])
-    log_returns = log_price.diff().dropna()
+def _tsrv_from_subsampled(subsampled: np.ndarray, n: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """TSRV(K) = [X, X]^(K) - (n_bar_K / n) [X, X]^(1), floored at zero; NaN where n < K."""
+    n = np.asarray(n, dtype=float)[:, None]
+    scales = np.asarray(scales)[None, :]
+    n_bar = (n - scales + 1) / scales
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tsrv = np.maximum(subsampled[:, scales[0] - 1] - n_bar / n * subsampled[:, :1], 0.0)
+    return np.where(n >= scales, tsrv, np.nan)
 
-    tsrv_by_period = log_returns.groupby(pd.Grouper(freq=freq)).apply(lambda x: two_scale_realized_volatility(x.values, K=K))
-    tsrv_by_period.name = f"TSRV({K})"
-    return tsrv_by_period
+def _tsrv_segments(returns: np.ndarray, offsets: np.ndarray, K: int) -> np.ndarray:
+    """TSRV for every period delimited by `offsets`; periods with fewer than K returns are NaN."""
+    subsampled = _subsampled_rv_segments(returns, offsets, K)
+    return _tsrv_from_subsampled(subsampled, np.diff(offsets), np.array([K]))[:, 0]
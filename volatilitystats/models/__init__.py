@@ -7,6 +7,11 @@ from .stochastic_volatility_model import estimate_sv_params
 from .component_garch_model import estimate_component_garch_params
 from .garch_in_mean_model import estimate_garch_in_mean_params
 from .harch_model import estimate_harch_params
+from .har_model import estimate_har_params, rolling_har_forecast
+from .realized_garch_model import estimate_realized_garch_params
+from .figarch_model import estimate_figarch_params, estimate_hygarch_params
+from .ms_garch_model import estimate_ms_garch_params
+from .heston_model import heston_price, estimate_heston_params
 
 __all__ = [
     "garch",
@@ -18,4 +23,12 @@ __all__ = [
     "estimate_component_garch_params",
     "estimate_garch_in_mean_params",
     "estimate_harch_params",
+    "estimate_har_params",
+    "rolling_har_forecast",
+    "estimate_realized_garch_params",
+    "estimate_figarch_params",
+    "estimate_hygarch_params",
+    "estimate_ms_garch_params",
+    "heston_price",
+    "estimate_heston_params",
 ]
@@ -0,0 +1,267 @@
+from collections import deque
+import numpy as np
+import pandas as pd
+from typing import Optional, Sequence
+from volatilitystats.utils.confidence import compute_confidence_bands
+
+HAR_MODELS = ("har-rv", "har-rv-j", "har-cj")
+
+def _trailing_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over `window` observations computed from cumulative sums."""
+    out = np.full(len(x), np.nan)
+    if window > len(x):
+        return out
+    csum = np.concatenate(([0.0], np.cumsum(x)))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+def _leading_mean(x: np.ndarray, horizon: int) -> np.ndarray:
+    """Mean of the next `horizon` observations (t+1, ..., t+horizon)."""
+    out = np.full(len(x), np.nan)
+    if horizon >= len(x):
+        return out
+    csum = np.concatenate(([0.0], np.cumsum(x)))
+    out[:len(x) - horizon] = (csum[horizon + 1:] - csum[1:len(x) - horizon + 1]) / horizon
+    return out
+
+def har_regressors(
+    rv: pd.Series,
+    model: str = "har-rv",
+    lags: Sequence[int] = (1, 5, 22),
+    bv: Optional[pd.Series] = None,
+    jump_flags: Optional[pd.Series] = None
+) -> pd.DataFrame:
+    """
+    Build the HAR design matrix from a daily realized variance series.
+
+    Parameters
+    ----------
+    rv : pd.Series
+        Daily realized variance (e.g., output of `tsrv_series` or `realized_kernel_series`).
+    model : {"har-rv", "har-rv-j", "har-cj"}
+        HAR specification.
+    lags : Sequence[int]
+        Averaging windows for the cascade components (daily, weekly, monthly).
+    bv : pd.Series, optional
+        Daily bipower variation (e.g., `bipower_variation_series`). Required for
+        "har-rv-j" and "har-cj".
+    jump_flags : pd.Series, optional
+        Boolean jump indicator per day (e.g., `detect_jumps_series`). When given,
+        only significant jumps enter the jump component.
+
+    Returns
+    -------
+    pd.DataFrame
+        Regressors indexed like `rv`, including a constant column.
+    """
+    model = model.lower()
+    if model not in HAR_MODELS:
+        raise ValueError(f"Unsupported HAR model: {model}. Choose from {HAR_MODELS}.")
+
+    rv_values = rv.astype(float).values
+    columns = {"const": np.ones(len(rv_values))}
+
+    if model == "har-rv":
+        for lag in lags:
+            columns[f"rv_{lag}"] = _trailing_mean(rv_values, lag)
+        return pd.DataFrame(columns, index=rv.index)
+
+    if bv is None:
+        raise ValueError(f"Model '{model}' requires the bipower variation series `bv`.")
+
+    bv_values = bv.reindex(rv.index).astype(float).values
+    jump = np.maximum(rv_values - bv_values, 0.0)
+    if jump_flags is not None:
+        jump = jump * jump_flags.reindex(rv.index).fillna(False).astype(bool).values
+
+    if model == "har-rv-j":
+        for lag in lags:
+            columns[f"rv_{lag}"] = _trailing_mean(rv_values, lag)
+        columns[f"j_{lags[0]}"] = jump
+    else:
+        continuous = rv_values - jump
+        for lag in lags:
+            columns[f"c_{lag}"] = _trailing_mean(continuous, lag)
+        for lag in lags:
+            columns[f"j_{lag}"] = _trailing_mean(jump, lag)
+
+    return pd.DataFrame(columns, index=rv.index)
+
+def estimate_har_params(
+    rv: pd.Series,
+    model: str = "har-rv",
+    lags: Sequence[int] = (1, 5, 22),
+    bv: Optional[pd.Series] = None,
+    jump_flags: Optional[pd.Series] = None,
+    horizon: int = 1,
+    with_confidence: bool = False,
+    stderr_fraction: float = 0.1
+) -> dict:
+    """
+    Estimate a HAR-RV, HAR-RV-J or HAR-CJ model by OLS.
+
+    Parameters
+    ----------
+    rv : pd.Series
+        Daily realized variance.
+    model : {"har-rv", "har-rv-j", "har-cj"}
+        HAR specification.
+    lags : Sequence[int]
+        Averaging windows for the cascade components.
+    bv : pd.Series, optional
+        Daily bipower variation, required for jump models.
+    jump_flags : pd.Series, optional
+        Boolean jump indicator per day.
+    horizon : int
+        Forecast horizon; the target is the mean RV over the next `horizon` days.
+    with_confidence : bool
+        If True, compute confidence bands.
+    stderr_fraction : float
+        Multiplier to simulate stderr when not estimated directly.
+
+    Returns
+    -------
+    dict
+        Coefficients, fitted variance and volatility, R² and the out-of-sample
+        forecast from the last observation.
+
+    References
+    ----------
+    Corsi (2009), "A Simple Approximate Long-Memory Model of Realized Volatility"
+    Andersen, Bollerslev and Diebold (2007), "Roughing It Up"
+    """
+    X = har_regressors(rv, model=model, lags=lags, bv=bv, jump_flags=jump_flags)
+    y = _leading_mean(rv.astype(float).values, horizon)
+
+    x_values = X.values
+    valid = np.isfinite(x_values).all(axis=1) & np.isfinite(y)
+    if valid.sum() <= x_values.shape[1]:
+        raise ValueError("Not enough observations to estimate the HAR model.")
+
+    beta, *_ = np.linalg.lstsq(x_values[valid], y[valid], rcond=None)
+    fitted_values = x_values @ beta
+
+    resid = y[valid] - fitted_values[valid]
+    r_squared = 1 - np.sum(resid**2) / np.sum((y[valid] - y[valid].mean()) ** 2)
+
+    # Fitted values are forecasts made at t for t+1, so label them by the next day.
+    fitted = pd.Series(fitted_values, index=rv.index, name=f"{model.upper()} Fitted").shift(1)
+    volatility = np.sqrt(fitted.clip(lower=0)).rename(f"{model.upper()} Volatility")
+
+    output = {
+        "params": pd.Series(beta, index=X.columns),
+        "r_squared": r_squared,
+        "fitted": fitted,
+        "forecast": fitted_values[-1],
+        "volatility": volatility
+    }
+
+    if with_confidence:
+        stderr = pd.Series(stderr_fraction * volatility, index=volatility.index)
+        lower, upper = compute_confidence_bands(volatility, stderr)
+        output["stderr"] = stderr
+        output["lower"] = lower
+        output["upper"] = upper
+
+    return output
+
+def _rls_update(P: np.ndarray, b: np.ndarray, x: np.ndarray, y: float, sign: float) -> None:
+    """
+    Add (sign=+1) or remove (sign=-1) one observation from an RLS state in place.
+
+    Uses the Sherman-Morrison identity on P = (X'X)^{-1}, so each update is O(k²).
+    """
+    Px = P @ x
+    P -= sign * np.outer(Px, Px) / (1 + sign * (x @ Px))
+    b += sign * y * x
+
+def rolling_har_forecast(
+    rv: pd.Series,
+    model: str = "har-rv",
+    lags: Sequence[int] = (1, 5, 22),
+    bv: Optional[pd.Series] = None,
+    jump_flags: Optional[pd.Series] = None,
+    horizon: int = 1,
+    window: Optional[int] = None,
+    min_periods: Optional[int] = None
+) -> dict:
+    """
+    Out-of-sample HAR forecasts with rolling or expanding refits.
+
+    Coefficients are updated by recursive least squares: each new day adds one
+    observation and, for a rolling window, drops the oldest one, instead of
+    refitting OLS from scratch.
+
+    Parameters
+    ----------
+    rv : pd.Series
+        Daily realized variance.
+    model : {"har-rv", "har-rv-j", "har-cj"}
+        HAR specification.
+    lags : Sequence[int]
+        Averaging windows for the cascade components.
+    bv : pd.Series, optional
+        Daily bipower variation, required for jump models.
+    jump_flags : pd.Series, optional
+        Boolean jump indicator per day.
+    horizon : int
+        Forecast horizon in days.
+    window : int, optional
+        Number of regression rows in the rolling window. If None, the estimation
+        window expands.
+    min_periods : int, optional
+        Rows required before the first forecast. Defaults to `window`, or to
+        twice the number of regressors for expanding fits.
+
+    Returns
+    -------
+    dict
+        "forecast": forecasts made at each origin date, and
+        "params": coefficient paths (one row per origin).
+    """
+    X = har_regressors(rv, model=model, lags=lags, bv=bv, jump_flags=jump_flags)
+    y = _leading_mean(rv.astype(float).values, horizon)
+    x_values = X.values
+    n, k = x_values.shape
+
+    if min_periods is None:
+        min_periods = window if window is not None else 2 * k
+    if window is not None and window < min_periods:
+        raise ValueError("`window` must be at least `min_periods`.")
+    if min_periods <= k:
+        raise ValueError("`min_periods` must exceed the number of regressors.")
+
+    usable = np.isfinite(x_values).all(axis=1) & np.isfinite(y)
+    forecasts = np.full(n, np.nan)
+    params = np.full((n, k), np.nan)
+
+    rows = deque()  # regression rows currently in the estimation sample
+    P = b = None
+
+    # At origin s the target of row t is known once t + horizon <= s.
+    for s in range(n):
+        t_new = s - horizon
+        if t_new >= 0 and usable[t_new]:
+            if P is None:
+                rows.append(t_new)
+                if len(rows) == min_periods:
+                    idx = list(rows)
+                    Xs = x_values[idx]
+                    P = np.linalg.pinv(Xs.T @ Xs)
+                    b = Xs.T @ y[idx]
+            else:
+                _rls_update(P, b, x_values[t_new], y[t_new], 1.0)
+                rows.append(t_new)
+                if window is not None and len(rows) > window:
+                    t_old = rows.popleft()
+                    _rls_update(P, b, x_values[t_old], y[t_old], -1.0)
+
+        if P is not None and np.isfinite(x_values[s]).all():
+            beta = P @ b
+            params[s] = beta
+            forecasts[s] = x_values[s] @ beta
+
+    return {
+        "forecast": pd.Series(forecasts, index=rv.index, name=f"{model.upper()} Forecast"),
+        "params": pd.DataFrame(params, index=rv.index, columns=X.columns)
+    }
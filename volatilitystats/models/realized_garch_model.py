@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+from typing import Sequence, Tuple
+from volatilitystats.utils.confidence import compute_confidence_bands
+
+def align_realized_measure(returns: pd.Series, realized: pd.Series) -> Tuple[np.ndarray, np.ndarray, pd.Index]:
+    """
+    Align daily returns with a daily realized measure.
+
+    Accepts the output of the `*_series` estimators directly: both series are
+    matched on calendar date, and days with a missing or non-positive realized
+    measure (e.g., empty resampling bins) are dropped.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Daily log returns with a datetime index.
+    realized : pd.Series
+        Daily realized measure (e.g., `realized_kernel_series`, `tsrv_series`).
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, pd.Index]
+        Aligned returns, aligned realized measure and the common index.
+    """
+    r = returns.copy()
+    x = realized.copy()
+    if isinstance(r.index, pd.DatetimeIndex) and isinstance(x.index, pd.DatetimeIndex):
+        x.index = x.index.normalize()
+        r_dates = r.index.normalize()
+        x = x.groupby(level=0).last()
+        x = pd.Series(x.reindex(r_dates).values, index=r.index)
+    else:
+        x = x.reindex(r.index)
+
+    valid = r.notna().values & x.notna().values & (x.values > 0)
+    return r.values[valid].astype(float), x.values[valid].astype(float), r.index[valid]
+
+def realized_garch_filter(params: Sequence[float], returns: np.ndarray, realized: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Run the log-linear Realized GARCH(1,1) recursion.
+
+    log h_t = omega + beta * log h_{t-1} + gamma * log x_{t-1}
+
+    The recursion is linear in log h given the realized measure, so it is
+    evaluated as a single IIR filter pass over both series.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        log h_t, standardized returns z_t and measurement residuals u_t.
+    """
+    omega, beta, gamma, xi, phi, tau1, tau2 = params[:7]
+    n = len(returns)
+    log_x = np.log(realized)
+
+    log_h = np.empty(n)
+    log_h[0] = np.log(np.var(returns)) if n > 1 else 0.0
+    if n > 1:
+        drive = omega + gamma * log_x[:-1]
+        log_h[1:], _ = lfilter([1.0], [1.0, -beta], drive, zi=[beta * log_h[0]])
+
+    z = returns * np.exp(-0.5 * log_h)
+    u = log_x - xi - phi * log_h - tau1 * z - tau2 * (z**2 - 1)
+    return log_h, z, u
+
+def realized_garch_log_likelihood(params: Sequence[float], returns: np.ndarray, realized: np.ndarray) -> float:
+    """
+    Negative joint log-likelihood of returns and the realized measure.
+
+    Parameters
+    ----------
+    params : list
+        Model parameters: [omega, beta, gamma, xi, phi, tau1, tau2, sigma_u]
+    returns : np.ndarray
+        Daily log returns.
+    realized : np.ndarray
+        Daily realized measure, aligned with `returns`.
+
+    Returns
+    -------
+    float
+        Negative log-likelihood value.
+    """
+    if len(params) != 8:
+        raise ValueError("Expected 8 parameters: omega, beta, gamma, xi, phi, tau1, tau2, sigma_u")
+
+    n = len(returns)
+    if n == 0:
+        return 0.0
+
+    sigma_u = params[7]
+    if sigma_u <= 0:
+        return np.inf
+
+    log_h, z, u = realized_garch_filter(params, returns, realized)
+    log_lik_returns = -0.5 * (np.log(2 * np.pi) + log_h + z**2)
+    log_lik_measure = -0.5 * (np.log(2 * np.pi) + 2 * np.log(sigma_u) + (u / sigma_u) ** 2)
+    log_lik_sum = -np.sum(log_lik_returns + log_lik_measure)
+
+    return np.inf if not np.isfinite(log_lik_sum) else log_lik_sum
+
+def estimate_realized_garch_params(
+    returns: pd.Series,
+    realized: pd.Series,
+    with_confidence: bool = False,
+    stderr_fraction: float = 0.1
+) -> dict:
+    """
+    Estimate log-linear Realized GARCH(1,1) parameters via joint MLE.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Daily log returns.
+    realized : pd.Series
+        Daily realized measure, e.g., the output of `realized_kernel_series`
+        or `tsrv_series`.
+    with_confidence : bool
+        If True, compute confidence bands.
+    stderr_fraction : float
+        Multiplier to simulate stderr when not estimated directly.
+
+    Returns
+    -------
+    dict
+        Model parameters, volatility series, measurement residuals and
+        optional confidence intervals.
+
+    References
+    ----------
+    Hansen, Huang and Shek (2012), "Realized GARCH: A Joint Model for Returns and Realized Measures of Volatility"
+    """
+    r, x, index = align_realized_measure(returns, realized)
+    if len(r) < 10:
+        raise ValueError("Not enough overlapping observations of returns and realized measure.")
+
+    log_var = np.log(np.var(r))
+    xi0 = np.mean(np.log(x)) - log_var
+    beta0, gamma0, phi0 = 0.55, 0.4, 1.0
+    omega0 = log_var * (1 - beta0 - gamma0 * phi0) - gamma0 * xi0
+    sigma_u0 = max(np.std(np.log(x)), 0.1)
+
+    initial_guess = [omega0, beta0, gamma0, xi0, phi0, 0.0, 0.0, sigma_u0]
+    bounds = [(-50, 50), (1e-6, 0.9999), (1e-6, 1.0), (-20, 20), (1e-6, 5.0), (-5, 5), (-5, 5), (1e-4, 10)]
+
+    result = minimize(
+        realized_garch_log_likelihood,
+        initial_guess,
+        args=(r, x),
+        bounds=bounds,
+        method="SLSQP"
+    )
+
+    omega, beta, gamma, xi, phi, tau1, tau2, sigma_u = result.x
+    log_h, z, u = realized_garch_filter(result.x, r, x)
+
+    volatility = pd.Series(np.exp(0.5 * log_h), index=index, name="RealizedGARCH(1,1) Volatility")
+
+    output = {
+        "omega": omega,
+        "beta": beta,
+        "gamma": gamma,
+        "xi": xi,
+        "phi": phi,
+        "tau1": tau1,
+        "tau2": tau2,
+        "sigma_u": sigma_u,
+        "log_likelihood": -result.fun,
+        "volatility": volatility,
+        "measurement_residuals": pd.Series(u, index=index, name="Measurement Residuals")
+    }
+
+    if with_confidence:
+        stderr = pd.Series(stderr_fraction * volatility, index=volatility.index)
+        lower, upper = compute_confidence_bands(volatility, stderr)
+        output["stderr"] = stderr
+        output["lower"] = lower
+        output["upper"] = upper
+
+    return output
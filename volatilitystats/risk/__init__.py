@@ -0,0 +1,6 @@
+from .filtered_historical_simulation import standardized_residuals, fhs_var_es
+
+__all__ = [
+    "standardized_residuals",
+    "fhs_var_es",
+]
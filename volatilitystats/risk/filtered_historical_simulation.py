@@ -0,0 +1,269 @@
+import warnings
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+# Number of most recent fitted variances the GARCH recursion must reproduce.
+_CHECKED_VARIANCES = 50
+
+def standardized_residuals(returns: pd.Series, result: dict) -> pd.Series:
+    """
+    Standardized residuals of a fitted volatility model.
+
+    Parameters
+    ----------
+    returns : pd.Series
+        Returns the model was fitted on.
+    result : dict
+        Output of any `estimate_*_params` function (must contain "volatility").
+        If it contains a "conditional_mean" series, residuals are demeaned with it.
+
+    Returns
+    -------
+    pd.Series
+        (returns - conditional mean) / conditional volatility, with non-finite
+        values removed.
+    """
+    if "volatility" not in result:
+        raise ValueError("Fitted result must contain a 'volatility' series.")
+
+    volatility = result["volatility"].reindex(returns.index)
+    mean = result.get("conditional_mean")
+    mean = 0.0 if mean is None else mean.reindex(returns.index)
+
+    z = (returns - mean) / volatility
+    z = z[np.isfinite(z.values)]
+    return z.rename("Standardized Residuals")
+
+def _one_step_variances(
+    eps: np.ndarray,
+    sigma2: np.ndarray,
+    omega: float,
+    alpha: np.ndarray,
+    gamma: np.ndarray,
+    beta: np.ndarray
+) -> np.ndarray:
+    """GJR-GARCH recursion sigma2_t from the residuals and variances before t, for t >= max(p, q)."""
+    q, p = len(alpha), len(beta)
+    start = max(p, q)
+    t = np.arange(start, len(eps))
+    out = np.full(len(t), omega)
+    for i in range(q):
+        lagged = eps[t - i - 1]
+        out += (alpha[i] + gamma[i] * (lagged < 0)) * lagged**2
+    for j in range(p):
+        out += beta[j] * sigma2[t - j - 1]
+    return out
+
+def _variance_dynamics(returns: pd.Series, result: dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float, float, float, np.ndarray, np.ndarray]:
+    """
+    Extract the variance recursion used to propagate simulated paths.
+
+    Results with "omega", "alpha" and "beta" (and optionally "gamma", "mu"
+    and "lambda") are propagated with the GARCH / GJR-GARCH /
+    GARCH-in-Mean recursion, provided that recursion reproduces the last
+    fitted variances. Other models (EGARCH, component GARCH, FIGARCH, ...)
+    keep their volatility at the last fitted value, with a warning.
+
+    Returns
+    -------
+    tuple
+        alpha, gamma, beta, omega, mu, lambda, last residuals (most recent last)
+        and last conditional variances (most recent last), with the next-period
+        variance appended to the latter.
+    """
+    volatility = result["volatility"].reindex(returns.index)
+    sigma2 = (volatility.values.astype(float)) ** 2
+    y = returns.fillna(0).values.astype(float)
+
+    garch_like = False
+    if all(key in result for key in ("omega", "alpha", "beta")):
+        omega = float(result["omega"])
+        alpha = np.atleast_1d(np.asarray(result["alpha"], dtype=float))
+        beta = np.atleast_1d(np.asarray(result["beta"], dtype=float))
+        gamma = np.atleast_1d(np.asarray(result.get("gamma", np.zeros_like(alpha)), dtype=float))
+        mu = float(result.get("mu", 0.0))
+        lmbda = float(result.get("lambda", 0.0))
+        if len(gamma) == len(alpha):
+            eps = y - (mu + lmbda * np.sqrt(sigma2))
+            fitted = _one_step_variances(eps, sigma2, omega, alpha, gamma, beta)[-_CHECKED_VARIANCES:]
+            garch_like = len(fitted) > 0 and np.allclose(fitted, sigma2[-len(fitted):], rtol=1e-6, atol=0.0)
+    if not garch_like:
+        warnings.warn(
+            "Fitted result does not follow a GARCH / GJR-GARCH / GARCH-in-Mean recursion; "
+            "simulating with volatility held at its last fitted value.",
+            RuntimeWarning,
+            stacklevel=3
+        )
+        omega = sigma2[-1]
+        alpha = beta = gamma = np.zeros(1)
+        mu = lmbda = 0.0
+
+    eps = y - (mu + lmbda * np.sqrt(sigma2))
+    q, p = len(alpha), len(beta)
+    eps_hist = eps[-q:] if q else np.zeros(0)
+    sig_hist = sigma2[-p:] if p else np.zeros(0)
+
+    next_sigma2 = omega
+    next_sigma2 += sum(alpha[i] * eps[-i - 1] ** 2 + gamma[i] * eps[-i - 1] ** 2 * (eps[-i - 1] < 0) for i in range(q))
+    next_sigma2 += sum(beta[j] * sigma2[-j - 1] for j in range(p))
+    return alpha, gamma, beta, omega, mu, lmbda, eps_hist, np.append(sig_hist, next_sigma2)
+
+def _simulate_chunk(
+    pools: Sequence[np.ndarray],
+    dynamics: Sequence[tuple],
+    horizon: int,
+    n_simulations: int,
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Simulate cumulative horizon returns for a chunk of assets, shape (n_assets, n_simulations).
+
+    All assets in the chunk are propagated together: lag polynomials are padded
+    to a common order and residuals are bootstrapped from a padded pool matrix.
+    """
+    n_assets = len(pools)
+    q = max(len(d[0]) for d in dynamics)
+    p = max(len(d[2]) for d in dynamics)
+
+    lengths = np.array([len(z) for z in pools])
+    pool = np.zeros((n_assets, lengths.max()))
+    for a, z in enumerate(pools):
+        pool[a, :len(z)] = z
+
+    alpha = np.zeros((n_assets, q))
+    gamma = np.zeros((n_assets, q))
+    beta = np.zeros((n_assets, p))
+    omega = np.empty(n_assets)
+    mu = np.empty(n_assets)
+    lmbda = np.empty(n_assets)
+    eps_hist = np.zeros((n_assets, n_simulations, q))
+    sig_hist = np.zeros((n_assets, n_simulations, p))
+    sigma2 = np.empty((n_assets, n_simulations))
+
+    for a, (a_i, g_i, b_i, w_i, mu_i, l_i, e_hist, s_hist) in enumerate(dynamics):
+        alpha[a, :len(a_i)] = a_i
+        gamma[a, :len(g_i)] = g_i
+        beta[a, :len(b_i)] = b_i
+        omega[a], mu[a], lmbda[a] = w_i, mu_i, l_i
+        # Histories are stored most-recent-first along the last axis.
+        if len(e_hist):
+            eps_hist[a, :, :len(e_hist)] = e_hist[::-1]
+        if len(s_hist) > 1:
+            sig_hist[a, :, :len(s_hist) - 1] = s_hist[-2::-1]
+        sigma2[a] = s_hist[-1]
+
+    rows = np.arange(n_assets)[:, None]
+    cumulative = np.zeros((n_assets, n_simulations))
+
+    for h in range(horizon):
+        draws = (rng.random((n_assets, n_simulations)) * lengths[:, None]).astype(np.int64)
+        sigma = np.sqrt(sigma2)
+        eps = sigma * pool[rows, draws]
+        cumulative += mu[:, None] + lmbda[:, None] * sigma + eps
+
+        if h == horizon - 1:
+            break
+
+        if q:
+            eps_hist = np.concatenate((eps[..., None], eps_hist[..., :-1]), axis=2)
+        if p:
+            sig_hist = np.concatenate((sigma2[..., None], sig_hist[..., :-1]), axis=2)
+
+        eps2 = eps_hist**2
+        sigma2 = (
+            omega[:, None]
+            + np.einsum("aq,asq->as", alpha, eps2)
+            + np.einsum("aq,asq->as", gamma, eps2 * (eps_hist < 0))
+            + np.einsum("ap,asp->as", beta, sig_hist)
+        )
+
+    return cumulative
+
+def fhs_var_es(
+    returns: Union[pd.Series, pd.DataFrame],
+    results: Union[dict, Dict[str, dict]],
+    levels: Sequence[float] = (0.95, 0.99),
+    horizon: int = 1,
+    n_simulations: int = 10000,
+    chunk_size: int = 64,
+    seed: Optional[int] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Value-at-Risk and Expected Shortfall by filtered historical simulation.
+
+    Standardized residuals of each fitted model are bootstrapped and pushed
+    through the model's variance recursion to build `horizon`-day return paths.
+    Assets are simulated in batches of `chunk_size`, so memory stays bounded by
+    chunk_size × n_simulations × model order regardless of the number of assets.
+
+    Parameters
+    ----------
+    returns : pd.Series or pd.DataFrame
+        Returns of one asset, or one column per asset.
+    results : dict or Dict[str, dict]
+        Output of an `estimate_*_params` function, or a mapping from column
+        name to fitted result when `returns` is a DataFrame. GARCH,
+        GJR-GARCH and GARCH-in-Mean fits are propagated with their variance
+        recursion; other models are simulated at their last fitted volatility
+        (a RuntimeWarning says so).
+    levels : Sequence[float]
+        Confidence levels, e.g., (0.95, 0.99).
+    horizon : int
+        Horizon in periods; VaR/ES refer to the cumulative log return.
+    n_simulations : int
+        Number of simulated paths per asset.
+    chunk_size : int
+        Number of assets simulated together.
+    seed : int, optional
+        Random seed.
+
+    Returns
+    -------
+    Dict[str, pd.DataFrame]
+        "VaR" and "ES" tables (assets × levels), expressed as positive losses.
+
+    References
+    ----------
+    Barone-Adesi, Giannopoulos and Vosper (1999), "VaR without Correlations for Portfolios of Derivative Securities"
+    """
+    if isinstance(returns, pd.Series):
+        name = returns.name if returns.name is not None else "asset"
+        returns = returns.to_frame(name)
+        results = {name: results}
+
+    missing = [col for col in returns.columns if col not in results]
+    if missing:
+        raise ValueError(f"No fitted result for assets: {missing}")
+
+    levels = np.asarray(levels, dtype=float)
+    if np.any((levels <= 0) | (levels >= 1)):
+        raise ValueError("Confidence levels must lie strictly between 0 and 1.")
+
+    rng = np.random.default_rng(seed)
+    tail_counts = np.maximum(np.ceil((1 - levels) * n_simulations).astype(int), 1)
+    assets = list(returns.columns)
+    var = np.empty((len(assets), len(levels)))
+    es = np.empty((len(assets), len(levels)))
+
+    for start in range(0, len(assets), chunk_size):
+        chunk = assets[start:start + chunk_size]
+        pools, dynamics = [], []
+        for asset in chunk:
+            series = returns[asset].dropna()
+            z = standardized_residuals(series, results[asset]).values
+            if len(z) == 0:
+                raise ValueError(f"No finite standardized residuals for asset {asset}.")
+            pools.append(z)
+            dynamics.append(_variance_dynamics(series, results[asset]))
+
+        simulated = np.sort(_simulate_chunk(pools, dynamics, horizon, n_simulations, rng), axis=1)
+        tail_means = np.cumsum(simulated, axis=1) / np.arange(1, n_simulations + 1)
+
+        var[start:start + len(chunk)] = -simulated[:, tail_counts - 1]
+        es[start:start + len(chunk)] = -tail_means[:, tail_counts - 1]
+
+    return {
+        "VaR": pd.DataFrame(var, index=assets, columns=levels),
+        "ES": pd.DataFrame(es, index=assets, columns=levels)
+    }
@@ -0,0 +1,180 @@
+import numpy as np
+import pandas as pd
+from typing import Mapping, Optional, Union
+from .sampling import _NS_PER_DAY, _time_of_day
+from .tick_store import TickSlice
+
+class IntradayGrid:
+    """
+    Session calendar for one set of tick timestamps, built once and reused.
+
+    Holds everything the intraday estimators otherwise derive from the
+    timestamps on every call: the sort permutation, the session of each tick,
+    the in-session mask and the per-session return offsets. Pass it as
+    `grid=` to any `*_series` estimator (or `realized_measures`) together
+    with the same rows' prices; timestamps are then never parsed, sorted or
+    grouped again.
+
+    Sessions run from `session_start` to `session_end` (both inclusive) in
+    wall-clock time. If `session_end` is not after `session_start`, a session
+    wraps past midnight, as for futures or 24h crypto markets with a custom
+    cut-off, and is labeled by the date on which it closes. A tick at the
+    exact cut-off opens the next session.
+
+    Parameters
+    ----------
+    times : array-like
+        Tick timestamps (datetime-like or int64 nanoseconds), in row order.
+    session_start : str
+        Session open as a time of day, e.g., '09:30'.
+    session_end : str
+        Session close as a time of day, e.g., '16:00' or '24:00'.
+    early_closes : Mapping, optional
+        Half days: session date -> earlier close time, e.g.,
+        {'2024-11-29': '13:00'}.
+    include_overnight : bool
+        If True, the return from a session's last tick to the next session's
+        first tick belongs to the later session, as in the `freq`-based
+        estimators. If False, every session starts afresh.
+    name : str
+        Name given to the session labels.
+
+    Attributes
+    ----------
+    order : np.ndarray or None
+        Permutation that sorts the input rows by time (None if already sorted).
+    times : np.ndarray
+        Sorted timestamps as int64 nanoseconds (UTC instants for tz-aware
+        input; session membership is still decided on wall-clock time).
+    in_session : np.ndarray
+        Boolean mask over sorted ticks.
+    session_ids : np.ndarray
+        Session number of every sorted tick (-1 outside sessions).
+    labels : pd.DatetimeIndex
+        Session dates, one per session with at least one tick.
+    offsets : np.ndarray
+        Session i covers returns offsets[i]:offsets[i + 1].
+    overnight : np.ndarray
+        Boolean mask over returns: True for returns spanning two sessions.
+
+    Examples
+    --------
+    >>> grid = IntradayGrid(df["time"], session_start="09:30", session_end="16:00")
+    >>> bv = bipower_variation_series(df, "price", "time", grid=grid)
+    >>> rk = realized_kernel_series(df, "price", "time", grid=grid)
+    """
+
+    def __init__(
+        self,
+        times,
+        session_start: str = "00:00",
+        session_end: str = "24:00",
+        early_closes: Optional[Mapping] = None,
+        include_overnight: bool = False,
+        name: str = "time"
+    ) -> None:
+        values = times if isinstance(times, pd.DatetimeIndex) else np.asarray(times)
+        if values.dtype.kind in "iu":
+            instants, self.tz = values.astype(np.int64), None
+            wall = instants
+        else:
+            index = values if isinstance(values, pd.DatetimeIndex) else pd.DatetimeIndex(pd.to_datetime(times))
+            self.tz = index.tz
+            instants = index.as_unit("ns").asi8
+            # Wall-clock time only places ticks in sessions; ordering uses the instants,
+            # which stay increasing through the repeated hour of a DST fall-back.
+            wall = index.tz_localize(None).as_unit("ns").asi8 if self.tz is not None else instants
+
+        self.order = None
+        if np.any(instants[1:] < instants[:-1]):
+            self.order = np.argsort(instants, kind="stable")
+            instants, wall = instants[self.order], wall[self.order]
+        self.times = instants
+
+        open_ns, close_ns = _time_of_day(session_start), _time_of_day(session_end)
+        if not (0 <= open_ns < _NS_PER_DAY and 0 < close_ns <= _NS_PER_DAY):
+            raise ValueError("Session times must lie between 00:00 and 24:00.")
+        day = wall // _NS_PER_DAY
+        time_of_day = wall - day * _NS_PER_DAY
+
+        close = np.full(len(wall), close_ns, dtype=np.int64)
+        if early_closes:
+            dates = pd.DatetimeIndex(pd.to_datetime(list(early_closes))).as_unit("ns").asi8 // _NS_PER_DAY
+            closes = np.array([_time_of_day(v) for v in early_closes.values()], dtype=np.int64)
+            by_date = np.argsort(dates)
+            dates, closes = dates[by_date], closes[by_date]
+            position = np.minimum(np.searchsorted(dates, day), len(dates) - 1)
+            hit = dates[position] == day
+            close[hit] = closes[position[hit]]
+
+        if open_ns < close_ns:
+            self.in_session = (time_of_day >= open_ns) & (time_of_day <= close)
+            session_day = day
+        else:
+            opened = time_of_day >= open_ns
+            self.in_session = opened | (time_of_day <= close)
+            session_day = day + opened
+
+        keep = np.flatnonzero(self.in_session)
+        session_day = session_day[keep]
+        new_session = np.r_[True, session_day[1:] != session_day[:-1]] if len(keep) else np.empty(0, dtype=bool)
+        codes = np.cumsum(new_session) - 1
+        self.session_ids = np.full(len(wall), -1, dtype=np.int64)
+        self.session_ids[keep] = codes
+
+        labels = pd.DatetimeIndex((session_day[new_session] * _NS_PER_DAY).view("datetime64[ns]"), name=name)
+        self.labels = labels.tz_localize(self.tz) if self.tz is not None else labels
+
+        # Returns between consecutive in-session ticks, as positions in the original rows.
+        spans = codes[1:] != codes[:-1]
+        kept = np.ones(len(spans), dtype=bool) if include_overnight else ~spans
+        to_sorted, from_sorted = keep[1:][kept], keep[:-1][kept]
+        self._to = to_sorted if self.order is None else self.order[to_sorted]
+        self._from = from_sorted if self.order is None else self.order[from_sorted]
+        self._return_times = instants[to_sorted]
+        self.overnight = spans[kept]
+        counts = np.bincount(codes[1:][kept], minlength=len(self.labels))
+        self.offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self.include_overnight = include_overnight
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, time_column: str, **kwargs) -> "IntradayGrid":
+        """Grid for the rows of `df`; keyword arguments as in the constructor."""
+        kwargs.setdefault("name", time_column)
+        return cls(df[time_column], **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def return_index(self) -> pd.DatetimeIndex:
+        """Timestamp of the closing tick of every return."""
+        index = pd.DatetimeIndex(self._return_times.view("datetime64[ns]"), name=self.labels.name)
+        return index.tz_localize("UTC").tz_convert(self.tz) if self.tz is not None else index
+
+    def returns(self, prices: Union[np.ndarray, pd.Series, TickSlice], log_prices: bool = False) -> np.ndarray:
+        """
+        Log returns of every session, laid out by `offsets`.
+
+        Parameters
+        ----------
+        prices : array-like
+            Prices of the rows the grid was built from, in the same order.
+        log_prices : bool
+            If True, `prices` already holds log prices.
+
+        Returns
+        -------
+        np.ndarray
+            Tick log returns.
+        """
+        prices = np.asarray(prices.prices if isinstance(prices, TickSlice) else prices, dtype=float)
+        if len(prices) != len(self.times):
+            raise ValueError("prices must have one value per row of the grid.")
+        if log_prices:
+            return prices[self._to] - prices[self._from]
+        return np.log(prices[self._to] / prices[self._from])
+
+    def log_returns(self, prices: Union[np.ndarray, pd.Series, TickSlice]) -> pd.Series:
+        """`returns` as a Series indexed by the closing tick timestamps."""
+        return pd.Series(self.returns(prices), index=self.return_index)
@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple, Union
+from .tick_store import TickSlice
+
+_NS_PER_DAY = 86_400 * 10**9
+
+def _sorted_ticks(df: Union[pd.DataFrame, TickSlice], price_column: str, time_column: str) -> Tuple[np.ndarray, np.ndarray, object]:
+    """
+    Time-sorted int64 nanosecond timestamps, prices and the original time zone.
+
+    Timestamps of tz-aware input are UTC instants, so that ticks in the
+    repeated hour of a DST fall-back keep their order; `_wall_clock` gives
+    the local times used for sessions.
+    """
+    if isinstance(df, TickSlice):
+        return np.asarray(df.instants), np.asarray(df.prices), df.tz
+    times = pd.DatetimeIndex(pd.to_datetime(df[time_column]))
+    tz = times.tz
+    times = times.as_unit("ns").asi8
+    prices = np.asarray(df[price_column], dtype=float)
+    if np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        times, prices = times[order], prices[order]
+    return times, prices, tz
+
+def _local_index(times: np.ndarray, tz, name: Optional[str] = None) -> pd.DatetimeIndex:
+    """DatetimeIndex of int64 nanosecond instants, in time zone `tz`."""
+    index = pd.DatetimeIndex(times.view("datetime64[ns]"), name=name)
+    return index if tz is None else index.tz_localize("UTC").tz_convert(tz)
+
+def _wall_clock(times: np.ndarray, tz) -> np.ndarray:
+    """Local wall-clock int64 nanoseconds of instants in time zone `tz`."""
+    return times if tz is None else _local_index(times, tz).tz_localize(None).asi8
+
+def _time_of_day(value: str) -> int:
+    """Nanoseconds since midnight for 'HH:MM' or 'HH:MM:SS[.fff]'."""
+    value = str(value)
+    return pd.Timedelta(value + ":00" if value.count(":") == 1 else value).value
+
+def _session_ticks(times: np.ndarray, session_start: str, session_end: str, tz=None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    In-session tick positions, the days that have them and each day's session bounds.
+
+    Sessions and days are taken on the wall clock of `tz`; `times` and the
+    returned bounds are instants, as from `_sorted_ticks`.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Positions of ticks inside [open, close], per-day int64 offsets into
+        those positions, and an (n_days, 2) array of open / close timestamps.
+    """
+    open_ns = _time_of_day(session_start)
+    close_ns = _time_of_day(session_end)
+    if not 0 <= open_ns < close_ns <= _NS_PER_DAY:
+        raise ValueError("Session must satisfy 00:00 <= session_start < session_end <= 24:00.")
+    wall = _wall_clock(times, tz)
+    time_of_day = wall % _NS_PER_DAY
+    keep = np.flatnonzero((time_of_day >= open_ns) & (time_of_day <= close_ns))
+    day = wall[keep] // _NS_PER_DAY
+    starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]]) if len(keep) else np.empty(0, dtype=np.int64)
+    offsets = np.r_[starts, len(keep)].astype(np.int64)
+    day_start = day[starts] * _NS_PER_DAY
+    bounds = np.column_stack((day_start + open_ns, day_start + close_ns))
+    if tz is not None and len(bounds):
+        # Wall-clock open and close as instants; an ambiguous time means its first occurrence.
+        local = pd.DatetimeIndex(bounds.ravel().view("datetime64[ns]"))
+        local = local.tz_localize(tz, ambiguous=np.ones(len(local), dtype=bool), nonexistent="shift_forward")
+        bounds = local.tz_convert("UTC").tz_localize(None).as_unit("ns").asi8.reshape(bounds.shape)
+    return keep, offsets, bounds
+
+def previous_tick_sample(times: np.ndarray, grid: np.ndarray, first: np.ndarray) -> np.ndarray:
+    """
+    Positions of the last tick at or before each grid point.
+
+    Parameters
+    ----------
+    times : np.ndarray
+        Sorted tick timestamps (int64 nanoseconds).
+    grid : np.ndarray
+        Sorted sampling times (int64 nanoseconds).
+    first : np.ndarray
+        For every grid point, the earliest position it may use, e.g. the first
+        tick of its session. Grid points before that tick take it instead
+        (the session opens at its first price).
+
+    Returns
+    -------
+    np.ndarray
+        Tick positions, one per grid point.
+    """
+    positions = np.searchsorted(times, grid, side="right") - 1
+    return np.maximum(positions, first)
+
+def calendar_time_returns(
+    df: Union[pd.DataFrame, TickSlice],
+    price_column: str,
+    time_column: str,
+    interval: str = "5min",
+    session_start: str = "09:30",
+    session_end: str = "16:00"
+) -> pd.Series:
+    """
+    Previous-tick log returns on a regular calendar-time grid.
+
+    Each day's grid runs from `session_start` to `session_end` in steps of
+    `interval` (the close is always included). The price at a grid point is
+    the last tick at or before it within the session; the open uses the
+    first tick of the session if none has printed yet. Ticks outside the
+    session are ignored and no overnight return is formed. All days are
+    sampled with one binary search.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or TickSlice
+        Tick data, or a tick store handle.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    interval : str
+        Sampling interval, e.g., '1min', '5min', '15min'.
+    session_start : str
+        Session open as a time of day, e.g., '09:30'.
+    session_end : str
+        Session close as a time of day, e.g., '16:00'.
+
+    Returns
+    -------
+    pd.Series
+        Log returns indexed by the end of each sampling interval, for every
+        day with at least one tick in the session. Use
+        `segments.period_offsets(result, '1D')` to obtain per-day offsets for
+        the segment-based estimators.
+    """
+    step = pd.Timedelta(interval).value
+    if step <= 0:
+        raise ValueError("interval must be positive.")
+    times, prices, tz = _sorted_ticks(df, price_column, time_column)
+    keep, offsets, bounds = _session_ticks(times, session_start, session_end, tz)
+    times, log_prices = times[keep], np.log(prices[keep])
+
+    # Grid points per day: open, open + step, ..., plus the close.
+    length = bounds[0, 1] - bounds[0, 0] if len(bounds) else 0
+    marks = np.unique(np.r_[np.arange(0, length, step), length])
+    grid = (bounds[:, :1] + marks).ravel()
+    first = np.repeat(offsets[:-1], len(marks))
+    sampled = log_prices[previous_tick_sample(times, grid, first)].reshape(len(bounds), len(marks))
+
+    returns = np.diff(sampled, axis=1).ravel()
+    index = (bounds[:, :1] + marks[1:]).ravel()
+    return _returns_series(returns, index, tz, time_column)
+
+def tick_time_returns(
+    df: Union[pd.DataFrame, TickSlice],
+    price_column: str,
+    time_column: str,
+    k: int,
+    session_start: str = "00:00",
+    session_end: str = "24:00"
+) -> pd.Series:
+    """
+    Log returns over every k-th tick of each session.
+
+    Sampling starts at each session's first tick; the last tick is always
+    kept so that the sampled returns span the whole session.
+
+    Parameters
+    ----------
+    df : pd.DataFrame or TickSlice
+        Tick data, or a tick store handle.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+    k : int
+        Number of ticks per sampled return.
+    session_start : str
+        Session open as a time of day; earlier ticks are ignored.
+    session_end : str
+        Session close as a time of day; later ticks are ignored.
+
+    Returns
+    -------
+    pd.Series
+        Log returns indexed by the time of their closing tick.
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    times, prices, tz = _sorted_ticks(df, price_column, time_column)
+    keep, offsets, _ = _session_ticks(times, session_start, session_end, tz)
+    times, log_prices = times[keep], np.log(prices[keep])
+
+    lengths = np.diff(offsets)
+    position = np.arange(len(times)) - np.repeat(offsets[:-1], lengths)
+    is_last = position == np.repeat(lengths - 1, lengths)
+    chosen = np.flatnonzero((position % k == 0) | is_last)
+
+    returns = np.diff(log_prices[chosen])
+    # Drop the returns that would span two sessions.
+    same_session = position[chosen[1:]] != 0
+    return _returns_series(returns[same_session], times[chosen[1:]][same_session], tz, time_column)
+
+def _returns_series(returns: np.ndarray, index: np.ndarray, tz, time_column: str) -> pd.Series:
+    return pd.Series(returns, index=_local_index(index, tz, time_column))
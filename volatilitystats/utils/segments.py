@@ -0,0 +1,242 @@
+import numpy as np
+import pandas as pd
+from typing import Optional, Tuple, Union
+from .intraday_grid import IntradayGrid
+from .sampling import _NS_PER_DAY
+from .tick_store import TickSlice
+
+IntradayData = Union[pd.DataFrame, pd.Series, TickSlice, Tuple[np.ndarray, np.ndarray]]
+
+def _tick_arrays(
+    df: IntradayData,
+    price_column: str,
+    time_column: str
+) -> Tuple[pd.DatetimeIndex, np.ndarray, bool]:
+    """
+    Timestamps and prices of any accepted input, as views where the dtypes allow.
+
+    The flag is True when the values are already log prices.
+    """
+    if isinstance(df, TickSlice):
+        return pd.DatetimeIndex(df.times, name=time_column, copy=False), df.prices, False
+    if isinstance(df, tuple):
+        times, prices = df
+        times = np.asarray(times)
+        if times.dtype.kind in "iu":
+            times = times.astype(np.int64, copy=False).view("datetime64[ns]")
+        if len(times) != len(prices):
+            raise ValueError("Timestamps and prices must have the same length.")
+        return pd.DatetimeIndex(times, name=time_column, copy=False), np.asarray(prices, dtype=float), False
+    if isinstance(df, pd.Series):
+        if not isinstance(df.index, pd.DatetimeIndex):
+            raise ValueError("A Series of log prices must have a DatetimeIndex.")
+        return df.index.rename(time_column), np.asarray(df, dtype=float), True
+
+    column = df[time_column]
+    if isinstance(column.dtype, pd.DatetimeTZDtype) or column.dtype.kind == "M":
+        times = pd.DatetimeIndex(column, name=time_column, copy=False)
+    else:
+        times = pd.DatetimeIndex(pd.to_datetime(column), name=time_column)
+    return times, np.asarray(df[price_column], dtype=float), False
+
+def _differenced(values: np.ndarray, block: int = 1 << 16) -> np.ndarray:
+    """First differences of `values`, written over its own buffer block by block."""
+    for lo in range(0, len(values) - 1, block):
+        hi = min(lo + block, len(values) - 1)
+        values[lo:hi] = values[lo + 1:hi + 1] - values[lo:hi]
+    return values[:-1]
+
+def intraday_log_returns(df: IntradayData, price_column: str, time_column: str) -> pd.Series:
+    """
+    Sorted tick log returns indexed by timestamp.
+
+    Inputs that are already typed and sorted are not copied: timestamps and
+    prices are read as views and the only array allocated is the returns
+    themselves. Sorting happens only if a linear monotonicity check fails.
+
+    Parameters
+    ----------
+    df : pd.DataFrame, pd.Series, TickSlice or tuple
+        One of:
+        - DataFrame containing timestamps and price data;
+        - Series of log prices with a DatetimeIndex (column names unused);
+        - tick store handle, whose sorted arrays are read directly from disk;
+        - (timestamps, prices) arrays, timestamps as int64 nanoseconds or
+          datetime64.
+    price_column : str
+        Column name for price.
+    time_column : str
+        Column name for timestamp.
+
+    Returns
+    -------
+    pd.Series
+        Log returns between consecutive ticks, indexed by the later timestamp.
+    """
+    times, values, log_prices = _tick_arrays(df, price_column, time_column)
+    if not times.is_monotonic_increasing:
+        order = np.argsort(times.asi8, kind="stable")
+        times, values = times[order], values[order]
+
+    if log_prices:
+        returns = np.subtract(values[1:], values[:-1])
+    else:
+        returns = _differenced(np.log(values))
+    index = times[1:]
+    # Missing prices leave NaN returns; the sum is a cheap test for any of them.
+    if np.isnan(returns.sum()):
+        keep = ~np.isnan(returns)
+        returns, index = returns[keep], index[keep]
+    return pd.Series(returns, index=index, copy=False)
+
+def period_offsets(log_returns: pd.Series, freq: str) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+    """
+    Period labels and boundary offsets for time-sorted data.
+
+    Labels match `groupby(pd.Grouper(freq=freq))`, including empty periods.
+    Period i covers positions offsets[i]:offsets[i + 1]. Fixed frequencies
+    are located with a binary search on the period edges, without a
+    per-observation allocation.
+
+    Parameters
+    ----------
+    log_returns : pd.Series
+        Series with a sorted DatetimeIndex.
+    freq : str
+        Resampling frequency, e.g., '1D'.
+
+    Returns
+    -------
+    Tuple[pd.DatetimeIndex, np.ndarray]
+        Period labels and int64 offsets of length n_periods + 1.
+    """
+    index = log_returns.index
+    offset = pd.tseries.frequencies.to_offset(freq)
+    try:
+        step = offset.nanos
+    except ValueError:
+        step = None
+    unit = pd.Timedelta(1, unit=index.unit).value if len(index) else 1
+    # On a tz-aware index only sub-daily steps are fixed in absolute time; daily and longer
+    # periods follow local midnights, which move across DST changes.
+    absolute = index.tz is None or (isinstance(offset, pd.offsets.Tick) and step is not None and step < _NS_PER_DAY)
+    fixed = step is not None and step % unit == 0 and absolute
+    if fixed and len(index):
+        # Bins of a fixed length from midnight of the first day, as `resample` lays them out,
+        # in the index's own unit so that its values are searched in place.
+        ticks, step = index.asi8, step // unit
+        origin = index[:1].normalize().asi8[0]
+        first = origin + (ticks[0] - origin) // step * step
+        edges = np.arange(first, ticks[-1] + 1, step, dtype=np.int64)
+        edges = np.append(edges, edges[-1] + step)
+        offsets = np.searchsorted(ticks, edges, side="left").astype(np.int64)
+        start = pd.Timestamp(first, unit=index.unit)
+        if index.tz is not None:
+            start = start.tz_localize("UTC").tz_convert(index.tz)
+        labels = pd.date_range(start, periods=len(edges) - 1, freq=offset, name=index.name, unit=index.unit)
+        return labels, offsets
+
+    counts = log_returns.resample(freq).size()
+    offsets = np.concatenate(([0], np.cumsum(counts.values))).astype(np.int64)
+    return counts.index, offsets
+
+def period_returns(
+    df: IntradayData,
+    price_column: str,
+    time_column: str,
+    freq: str,
+    grid: Optional[IntradayGrid] = None
+) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """
+    Period labels, tick log returns and their offsets for the `*_series` estimators.
+
+    With a `grid`, sessions, ordering and offsets come from it and only the
+    prices are read; otherwise timestamps are parsed and grouped by `freq`.
+
+    Returns
+    -------
+    Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]
+        Labels, returns, and int64 offsets of length n_periods + 1.
+    """
+    if grid is not None:
+        if isinstance(df, tuple):
+            prices = df[1]
+        elif isinstance(df, (pd.Series, TickSlice)):
+            prices = df
+        else:
+            prices = df[price_column]
+        return grid.labels, grid.returns(prices, log_prices=isinstance(df, pd.Series)), grid.offsets
+    log_returns = intraday_log_returns(df, price_column, time_column)
+    labels, offsets = period_offsets(log_returns, freq)
+    return labels, log_returns.values, offsets
+
+def segment_codes(offsets: np.ndarray) -> np.ndarray:
+    """Integer period code of every observation."""
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+def segment_positions(offsets: np.ndarray) -> np.ndarray:
+    """Position of every observation within its period (0 for the first one)."""
+    lengths = np.diff(offsets)
+    return np.arange(offsets[-1]) - np.repeat(offsets[:-1], lengths)
+
+def range_sum(values: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Sums of values[starts[i]:ends[i]] for many ranges at once.
+
+    Multi-dimensional values are summed along the first axis. Empty ranges
+    (ends <= starts) sum to zero.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    ends = np.asarray(ends, dtype=np.int64)
+    out = np.zeros((len(starts),) + values.shape[1:], dtype=np.result_type(values, np.float64))
+    valid = ends > starts
+    if not valid.any():
+        return out
+    padded = np.concatenate((values, np.zeros((1,) + values.shape[1:], dtype=values.dtype)))
+    bounds = np.column_stack((starts[valid], ends[valid])).ravel()
+    out[valid] = np.add.reduceat(padded, bounds)[::2]
+    return out
+
+def segment_sum(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-period sums; empty periods sum to zero."""
+    return range_sum(values, offsets[:-1], offsets[1:])
+
+def segment_lag_sum(x: np.ndarray, offsets: np.ndarray, lag: int = 1, y: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Per-period sums of x_t * y_{t-lag}, using only pairs inside the same period.
+
+    If `y` is None, `x` is used for both factors (lag-`lag` autocovariance sum).
+    """
+    if lag == 0:
+        return segment_sum(x * (x if y is None else y), offsets)
+    y = x if y is None else y
+    products = x[lag:] * y[:-lag]
+    starts = offsets[:-1]
+    return range_sum(products, starts, np.maximum(offsets[1:] - lag, starts))
+
+def segment_median(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-period medians; empty periods are NaN."""
+    lengths = np.diff(offsets)
+    out = np.full(len(lengths), np.nan)
+    order = np.lexsort((values, segment_codes(offsets)))
+    ranked = values[order]
+    valid = lengths > 0
+    lo = offsets[:-1][valid] + (lengths[valid] - 1) // 2
+    hi = offsets[:-1][valid] + lengths[valid] // 2
+    out[valid] = 0.5 * (ranked[lo] + ranked[hi])
+    return out
+
+def segment_autocovariances(r: np.ndarray, offsets: np.ndarray, max_lag: int) -> np.ndarray:
+    """
+    Per-period realized autocovariances sum_t r_t r_{t-h} for h = 0..max_lag.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_periods, max_lag + 1). Lags at or beyond a period's
+        length contribute zero.
+    """
+    gamma = np.zeros((len(offsets) - 1, max_lag + 1))
+    for h in range(min(max_lag, max(len(r) - 1, 0)) + 1):
+        gamma[:, h] = segment_lag_sum(r, offsets, h)
+    return gamma
@@ -0,0 +1,298 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from typing import List, Optional, Tuple, Union
+
+_NS_PER_DAY = 86_400 * 10**9
+# File name and dtype of every per-symbol array.
+_FILES = {
+    "time": ("time.i8", np.int64),
+    "price": ("price.f8", np.float64),
+    "days": ("days.i8", np.int64),
+    "offsets": ("offsets.i8", np.int64)
+}
+
+class TickSlice:
+    """
+    Handle on the ticks of one symbol between two dates in a `TickStore`.
+
+    Arrays are read-only memory-map views; nothing is copied until a caller
+    asks for it. Every intraday estimator that takes (df, price_column,
+    time_column) also accepts a TickSlice in place of `df`. Ticks of a symbol
+    stored with a time zone come back in that time zone.
+    """
+
+    def __init__(self, store: "TickStore", symbol: str, start: Optional[str] = None, end: Optional[str] = None) -> None:
+        self.store = store
+        self.symbol = symbol
+        self.start = start
+        self.end = end
+        self._bounds = store._row_bounds(symbol, start, end)
+
+    @property
+    def tz(self):
+        """Time zone of the symbol's ticks (None for naive timestamps)."""
+        return self.store._tz(self.symbol)
+
+    @property
+    def instants(self) -> np.ndarray:
+        """Timestamps as int64 nanoseconds since the epoch, UTC for tz-aware ticks (a view on the store)."""
+        lo, hi = self._bounds
+        return self.store._column(self.symbol, "time")[lo:hi]
+
+    @property
+    def times(self) -> Union[np.ndarray, pd.DatetimeIndex]:
+        """
+        Timestamps as datetime64[ns], or a tz-aware DatetimeIndex if the
+        symbol has a time zone (a view on the store either way).
+        """
+        tz = self.tz
+        if tz is None:
+            return self.instants.view("datetime64[ns]")
+        return pd.DatetimeIndex(np.asarray(self.instants), dtype=pd.DatetimeTZDtype("ns", tz), copy=False)
+
+    @property
+    def prices(self) -> np.ndarray:
+        """Prices (a view on the store)."""
+        lo, hi = self._bounds
+        return self.store._column(self.symbol, "price")[lo:hi]
+
+    def __len__(self) -> int:
+        return self._bounds[1] - self._bounds[0]
+
+    def to_frame(self, price_column: str = "price", time_column: str = "time") -> pd.DataFrame:
+        """Copy the slice into a DataFrame."""
+        return pd.DataFrame({time_column: self.times, price_column: self.prices})
+
+class TickStore:
+    """
+    On-disk columnar tick store with a per-day offset index.
+
+    Each symbol is a directory holding append-only raw arrays: `time.i8`
+    (int64 nanoseconds since the epoch, sorted), `price.f8`, and the day index
+    `days.i8` / `offsets.i8`, where day i covers rows offsets[i]:offsets[i + 1].
+    Reads are memory-mapped, so slicing any range of days costs two binary
+    searches on the index and no parsing.
+
+    A symbol first appended with tz-aware timestamps records its time zone in
+    `tz.txt`; its times are then UTC instants, its days are local calendar
+    days, and later appends must carry the same time zone.
+
+    Parameters
+    ----------
+    root : str or path-like
+        Store directory; created if missing.
+    """
+
+    def __init__(self, root: Union[str, os.PathLike]) -> None:
+        self.root = os.fspath(root)
+        os.makedirs(self.root, exist_ok=True)
+        self._maps = {}
+        self._zones = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols present in the store."""
+        return sorted(d for d in os.listdir(self.root) if os.path.isfile(os.path.join(self.root, d, "time.i8")))
+
+    def _path(self, symbol: str, name: str) -> str:
+        return os.path.join(self.root, symbol, name)
+
+    def _column(self, symbol: str, name: str) -> np.ndarray:
+        key = (symbol, name)
+        if key not in self._maps:
+            filename, dtype = _FILES[name]
+            path = self._path(symbol, filename)
+            if not os.path.exists(path):
+                raise KeyError(f"Symbol '{symbol}' is not in the store.")
+            self._maps[key] = np.memmap(path, dtype=dtype, mode="r") if os.path.getsize(path) else np.empty(0, dtype=dtype)
+        return self._maps[key]
+
+    def _tz(self, symbol: str):
+        """Stored time zone of a symbol, or None."""
+        if symbol not in self._zones:
+            path = self._path(symbol, "tz.txt")
+            if os.path.exists(path):
+                with open(path) as f:
+                    self._zones[symbol] = pd.Timestamp(0, tz=f.read().strip()).tz
+            else:
+                self._zones[symbol] = None
+        return self._zones[symbol]
+
+    def append(self, symbol: str, times, prices) -> None:
+        """
+        Append time-ordered ticks to a symbol and update its day index.
+
+        Parameters
+        ----------
+        symbol : str
+            Symbol name.
+        times : array-like
+            Timestamps (datetime-like or int64 nanoseconds since the epoch),
+            sorted and not earlier than the symbol's last stored tick.
+            Datetimes must be naive or tz-aware as the symbol's first append
+            was, in the same time zone.
+        prices : array-like
+            Prices.
+        """
+        times = times if isinstance(times, (pd.Series, pd.DatetimeIndex)) else np.asarray(times)
+        known = symbol in self.symbols
+        if times.dtype.kind in "iu":
+            times, tz = np.asarray(times, dtype=np.int64), self._tz(symbol) if known else None
+        else:
+            index = pd.DatetimeIndex(pd.to_datetime(times))
+            tz = index.tz
+            stored = self._tz(symbol) if known else tz
+            if known and str(tz) != str(stored):
+                raise ValueError(f"Ticks of '{symbol}' are stored with time zone {stored}; got {tz}.")
+            times = index.as_unit("ns").asi8
+        prices = np.asarray(prices, dtype=np.float64)
+        if len(times) != len(prices):
+            raise ValueError("times and prices must have the same length.")
+        if len(times) == 0:
+            return
+        if np.any(np.diff(times) < 0):
+            raise ValueError("Ticks must be sorted by time.")
+
+        os.makedirs(os.path.join(self.root, symbol), exist_ok=True)
+        if not known and tz is not None:
+            with open(self._path(symbol, "tz.txt"), "w") as f:
+                f.write(str(tz))
+        existing = self._column(symbol, "time") if known else np.empty(0, dtype=np.int64)
+        if len(existing) and times[0] < existing[-1]:
+            raise ValueError("Appended ticks must not precede stored ticks.")
+        n_before = len(existing)
+
+        self._release(symbol)
+        with open(self._path(symbol, "time.i8"), "ab") as f:
+            f.write(times.tobytes())
+        with open(self._path(symbol, "price.f8"), "ab") as f:
+            f.write(prices.tobytes())
+        self._extend_index(symbol, times, n_before, tz)
+
+    def _extend_index(self, symbol: str, times: np.ndarray, n_before: int, tz=None) -> None:
+        days_path, offsets_path = self._path(symbol, "days.i8"), self._path(symbol, "offsets.i8")
+        days = np.fromfile(days_path, dtype=np.int64) if os.path.exists(days_path) else np.empty(0, dtype=np.int64)
+        offsets = np.fromfile(offsets_path, dtype=np.int64) if os.path.exists(offsets_path) else np.zeros(1, dtype=np.int64)
+
+        # Days are local calendar days: bucket the wall-clock times of tz-aware ticks.
+        wall = times if tz is None else pd.DatetimeIndex(times.view("datetime64[ns]")).tz_localize("UTC").tz_convert(tz).tz_localize(None).asi8
+        day_of_tick = wall // _NS_PER_DAY * _NS_PER_DAY
+        starts = np.flatnonzero(np.r_[True, day_of_tick[1:] != day_of_tick[:-1]])
+        new_days = day_of_tick[starts]
+        new_ends = np.r_[starts[1:], len(times)] + n_before
+        if len(days) and new_days[0] == days[-1]:
+            # The first appended day continues the last stored day.
+            offsets[-1] = new_ends[0]
+            new_days, new_ends = new_days[1:], new_ends[1:]
+        np.concatenate((days, new_days)).tofile(days_path)
+        np.concatenate((offsets, new_ends)).tofile(offsets_path)
+
+    def _release(self, symbol: str) -> None:
+        for name in _FILES:
+            self._maps.pop((symbol, name), None)
+        self._zones.pop(symbol, None)
+
+    def days(self, symbol: str) -> pd.DatetimeIndex:
+        """Days with ticks for a symbol (local calendar dates for a tz-aware symbol)."""
+        return pd.DatetimeIndex(np.asarray(self._column(symbol, "days")).view("datetime64[ns]"), name="date")
+
+    def _row_bounds(self, symbol: str, start: Optional[str], end: Optional[str]) -> Tuple[int, int]:
+        days = self._column(symbol, "days")
+        offsets = self._column(symbol, "offsets")
+        tz = self._tz(symbol)
+
+        def day(value) -> int:
+            stamp = pd.Timestamp(value)
+            if stamp.tz is not None:
+                stamp = stamp.tz_convert(tz).tz_localize(None)
+            return stamp.normalize().as_unit("ns").value
+
+        first = 0 if start is None else int(np.searchsorted(days, day(start), side="left"))
+        last = len(days) if end is None else int(np.searchsorted(days, day(end), side="right"))
+        if first >= last:
+            return 0, 0
+        return int(offsets[first]), int(offsets[last])
+
+    def slice(self, symbol: str, start: Optional[str] = None, end: Optional[str] = None) -> TickSlice:
+        """
+        Handle on a symbol's ticks from day `start` through day `end` (inclusive).
+        """
+        return TickSlice(self, symbol, start, end)
+
+    def read(
+        self, symbol: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> Tuple[Union[np.ndarray, pd.DatetimeIndex], np.ndarray]:
+        """Zero-copy (times, prices) views for a date range; times as in `TickSlice.times`."""
+        handle = self.slice(symbol, start, end)
+        return handle.times, handle.prices
+
+def import_csv(
+    path: Union[str, os.PathLike],
+    store: Union[TickStore, str, os.PathLike],
+    symbol: Optional[str] = None,
+    price_column: str = "price",
+    time_column: str = "time",
+    symbol_column: Optional[str] = None,
+    chunksize: int = 1_000_000
+) -> TickStore:
+    """
+    Convert a CSV tick file into a `TickStore`, chunk by chunk.
+
+    Timestamps are parsed once here so that later reads never touch
+    `pd.to_datetime`. Within each chunk ticks are sorted by time; across
+    chunks they must be in time order per symbol. Timestamps with a UTC
+    offset keep it as the symbol's time zone.
+
+    Parameters
+    ----------
+    path : str or path-like
+        CSV file.
+    store : TickStore, str or path-like
+        Target store (or its directory).
+    symbol : str, optional
+        Symbol for all rows; required unless `symbol_column` is given.
+    price_column, time_column : str
+        CSV column names.
+    symbol_column : str, optional
+        Column holding the symbol of each row.
+    chunksize : int
+        Rows read per chunk.
+
+    Returns
+    -------
+    TickStore
+        The store written to.
+    """
+    if (symbol is None) == (symbol_column is None):
+        raise ValueError("Give exactly one of `symbol` and `symbol_column`.")
+    store = store if isinstance(store, TickStore) else TickStore(store)
+
+    columns = [time_column, price_column] + ([symbol_column] if symbol_column else [])
+    for chunk in pd.read_csv(path, usecols=columns, chunksize=chunksize):
+        chunk = chunk.assign(**{time_column: pd.to_datetime(chunk[time_column])}).sort_values(time_column, kind="stable")
+        groups = chunk.groupby(symbol_column, sort=False) if symbol_column else [(symbol, chunk)]
+        for name, part in groups:
+            store.append(str(name), part[time_column], part[price_column].values)
+    return store
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point: `python -m volatilitystats.utils.tick_store CSV STORE ...`."""
+    parser = argparse.ArgumentParser(description="Import a CSV tick file into a memory-mapped tick store.")
+    parser.add_argument("csv")
+    parser.add_argument("store")
+    parser.add_argument("--symbol")
+    parser.add_argument("--symbol-column")
+    parser.add_argument("--price-column", default="price")
+    parser.add_argument("--time-column", default="time")
+    parser.add_argument("--chunksize", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    store = import_csv(
+        args.csv, args.store, args.symbol, args.price_column, args.time_column, args.symbol_column, args.chunksize
+    )
+    for name in store.symbols:
+        print(f"{name}: {len(store.slice(name))} ticks over {len(store.days(name))} days")
+
+if __name__ == "__main__":
+    main()
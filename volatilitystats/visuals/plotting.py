@@ -41,3 +41,45 @@ def plot_volatility_series(
         plt.savefig(savepath)
     else:
         plt.show()
+
+def plot_volatility_signature(
+    signatures: Dict[str, pd.DataFrame],
+    title: str = "Volatility Signature",
+    figsize: tuple = (10, 5),
+    ylabel: str = "Average realized variance",
+    savepath: Optional[str] = None
+):
+    """
+    Plot the average of realized measures across days against the sampling interval.
+
+    Parameters
+    ----------
+    signatures : dict
+        Dictionary mapping label to an interval x day matrix, as returned by
+        `volatility_signatures`.
+    title : str
+        Plot title.
+    figsize : tuple
+        Size of the figure.
+    ylabel : str
+        Y-axis label.
+    savepath : str, optional
+        If provided, save the figure to this path.
+    """
+    plt.figure(figsize=figsize)
+    for label, matrix in signatures.items():
+        seconds = matrix.index.total_seconds()
+        plt.plot(seconds, matrix.mean(axis=1).values, marker="o", label=label)
+
+    plt.xscale("log")
+    plt.title(title)
+    plt.ylabel(ylabel)
+    plt.xlabel("Sampling interval (seconds)")
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+
+    if savepath:
+        plt.savefig(savepath)
+    else:
+        plt.show()